@@ -2151,14 +2151,15 @@ class RPGMTL_Interface
 				util.add_grid_cell(
 					grid,
 					'<img src="assets/images/release.png"> Release a Patch',
-					() => {
+					(e) => {
 						this.loader.text = "The patch is being generated in the release folder...";
 						this.post(
 							"/api/release",
 							() => this.routes.redirect_to_project(),
 							null,
 							{
-								name:this.project.name
+								name:this.project.name,
+								full:e.ctrlKey // shortcut to rebuild the whole release folder
 							}
 						);
 					}
@@ -3334,7 +3335,8 @@ class RPGMTL_Interface
 				name:this.project.name,
 				path:this.project.last_data.path,
 				group:elem.group,
-				index:elem.string
+				index:elem.string,
+				strings_version:this.project.strings_version
 			}
 		);
 		this.nav.update_focus(elem);
@@ -3353,7 +3355,8 @@ class RPGMTL_Interface
 				name:this.project.name,
 				path:this.project.last_data.path,
 				group:elem.group,
-				index:elem.string
+				index:elem.string,
+				strings_version:this.project.strings_version
 			}
 		);
 		this.nav.update_focus(elem);
@@ -3372,7 +3375,8 @@ class RPGMTL_Interface
 				name:this.project.name,
 				path:this.project.last_data.path,
 				group:elem.group,
-				index:elem.string
+				index:elem.string,
+				strings_version:this.project.strings_version
 			}
 		);
 		this.nav.update_focus(elem);
@@ -3391,7 +3395,8 @@ class RPGMTL_Interface
 				name:this.project.name,
 				path:this.project.last_data.path,
 				group:elem.group,
-				index:elem.string
+				index:elem.string,
+				strings_version:this.project.strings_version
 			}
 		);
 		this.nav.update_focus(elem);
@@ -3407,6 +3412,7 @@ class RPGMTL_Interface
 				name:this.project.name,
 				path:this.project.last_data.path,
 				id:this.project.string_groups[elem.group][elem.string][0],
+				strings_version:this.project.strings_version,
 				value:(
 					(
 						this.project.strings[this.project.string_groups[elem.group][elem.string][0]][3]
@@ -3484,6 +3490,7 @@ class RPGMTL_Interface
 		{
 			// init stuff
 			this.project.strings = data.strings;
+			this.project.strings_version = data.strings_version;
 			this.project.string_groups = data.list;
 			this.project.last_data = data;
 			this.lastfileopened = data.path;
@@ -3686,7 +3693,8 @@ class RPGMTL_Interface
 							{
 								name:this.project.name,
 								path:this.lastfileopened,
-								version:this.project.version
+								version:this.project.version,
+								strings_version:this.project.strings_version
 							}
 						);
 					}
@@ -3805,7 +3813,8 @@ class RPGMTL_Interface
 					version:this.project.version,
 					path:this.project.last_data.path,
 					group:this.currentstr.group,
-					index:this.currentstr.string
+					index:this.currentstr.string,
+					strings_version:this.project.strings_version
 				}
 			);
 		}
@@ -3825,7 +3834,8 @@ class RPGMTL_Interface
 					path:this.project.last_data.path,
 					group:this.currentstr.group,
 					index:this.currentstr.string,
-					string:this.edit.translation.value
+					string:this.edit.translation.value,
+					strings_version:this.project.strings_version
 				}
 			);
 		}
@@ -3850,7 +3860,15 @@ class RPGMTL_Interface
 				USERMARKER:4,
 			}
 			// update list in memory with received data
-			this.project.strings = data.strings;
+			if(data.strings_delta) // only the modified strings have been sent
+			{
+				Object.assign(this.project.strings, data.strings);
+			}
+			else
+			{
+				this.project.strings = data.strings;
+			}
+			this.project.strings_version = data.strings_version;
 			this.project.string_groups = data.list;
 			let lcstringsearch = "";
 			// last searched string
@@ -35,6 +35,27 @@ class IntBool(IntEnum):
     FALSE = 0
     TRUE = 1
 
+# XOR data with a repeating key (the key restarts at the beginning of data)
+# The whole buffer is processed at once, as two big integers
+def xor_key(data : bytes|bytearray|memoryview, key : bytes) -> bytes:
+    size : int = len(data)
+    if size == 0:
+        return b""
+    stream : bytes = (bytes(key) * (size // len(key) + 1))[:size]
+    return (int.from_bytes(data, 'little') ^ int.from_bytes(stream, 'little')).to_bytes(size, 'little')
+
+# Replace parts of a text, given a list of (start, end, replacement) sorted by position
+# The result is joined once, instead of copying the whole text for every replacement
+def splice_text(text : str, replacements : list[tuple[int, int, str]]) -> str:
+    segments : list[str] = []
+    pos : int = 0
+    for start, end, replacement in replacements:
+        segments.append(text[pos:start])
+        segments.append(replacement)
+        pos = end
+    segments.append(text[pos:])
+    return "".join(segments)
+
 
 def get_plugin_from_ast(tree : ast.Module) -> tuple[list[ast.ClassDef], list[ast.ClassDef]]:
     classes : list[ast.ClassDef] = ([], [])
@@ -158,6 +179,11 @@ class BasePlugin:
 
 class Plugin(BasePlugin):
     FILE_ENCODINGS : list[str] = ["utf-8", "shift_jis", "cp932", "iso8859-1", "cp1251", "cp1252", "ascii"] # To cover a lot of encoding scenarios
+    # Lowercase suffixes (such as ".json") of the files which match can accept, outside of file actions
+    # RPGMTL only calls match on files with one of those suffixes. Leave it to None to have match called for every file
+    SUFFIXES : tuple[str, ...]|None = None
+    # Same as SUFFIXES, for extract
+    EXTRACT_SUFFIXES : tuple[str, ...]|None = None
     def __init__(self : Plugin) -> None:
         # Be sure to call super first, in your Plugin
         super().__init__()
@@ -220,6 +246,16 @@ class Plugin(BasePlugin):
         # name is the project name (useful if you want to access other plugins)
         return (0, 0)
 
+    def read_with_locations(self : Plugin, file_path : str, content : bytes) -> tuple[list[list[str]], Any]:
+        # Optional: same as read but also returns a JSON serializable map of the string locations, or None
+        # The map is saved during the extraction and given back to write_with_locations
+        # as long as the original file (and the settings) didn't change
+        return (self.read(file_path, content), None)
+
+    def write_with_locations(self : Plugin, name : str, file_path : str, content : bytes, locations : Any) -> tuple[bytes, bool]:
+        # Optional: same as write but with the map returned by read_with_locations, to skip parsing the file again
+        return self.write(name, file_path, content)
+
     def format(self : Plugin, file_path : str, content : bytes) -> bytes:
         # Called last in the patching process
         # If you want to format the 
@@ -4,6 +4,7 @@ import csv
 import io
 
 class CSV(Plugin):
+    SUFFIXES : tuple[str, ...] = (".csv",)
     LM_JP_TEXT = 3
     LM_EN_TEXT = 4
     
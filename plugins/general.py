@@ -6,6 +6,7 @@ import textwrap
 import unicodedata
 
 class GeneralActions(Plugin):
+    SUFFIXES : tuple[str, ...] = () # only used for file actions
     COMMA_SPLIT : re.Pattern = re.compile(r'(?<!\\),')
     def __init__(self : GeneralActions) -> None:
         super().__init__()
@@ -124,7 +125,7 @@ class GeneralActions(Plugin):
             additional_names : set[str] = set(self.COMMA_SPLIT.split(params["_t_additional_names"]))
             second_line_chara : tuple[str, ...] = tuple(set(list(params["_t_name_chara"])))
             # parameters preparation ends
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name)
             seen : set[str] = set() # used to track which strings we tested
@@ -363,7 +364,7 @@ class GeneralActions(Plugin):
                     checks.pop(k, None)
             if len(list(checks.keys())) == 0:
                 return "Nothing has been selected"
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name)
             seen : set[str] = set() # used to track which strings we tested
@@ -420,7 +421,7 @@ class GeneralActions(Plugin):
     def tool_clear_unlinked(self : GeneralActions, name : str, params : dict[str, Any]) -> str:
         try:
             if params["_t_confirm"]:
-                self.owner.save() # save first!
+                self.owner.save(name=name) # save first!
                 self.owner.backup_strings_file(name) # backup strings.json
                 self.owner.load_strings(name)
                 count : int = 0
@@ -2,6 +2,7 @@ from __future__ import annotations
 from . import Plugin, WalkHelper
 
 class INI(Plugin):
+    SUFFIXES : tuple[str, ...] = (".ini",)
     def __init__(self : INI) -> None:
         super().__init__()
         self.name : str = "INI"
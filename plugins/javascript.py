@@ -1,12 +1,18 @@
 from __future__ import annotations
-from . import Plugin, WalkHelper
+from . import Plugin, WalkHelper, splice_text
+from typing import Any
 import json
+import re
+
+WORD : re.Pattern = re.compile(r'[^\W_]+') # alphanumeric characters, as str.isalnum()
+SYMBOLS : re.Pattern = re.compile(r'(?:[^\w\'"`/]|_)*') # non-alphanumeric characters, except quotes and slashes
 
 class Javascript(Plugin):
+    SUFFIXES : tuple[str, ...] = (".js",)
     def __init__(self : Javascript) -> None:
         super().__init__()
         self.name : str = "Javascript"
-        self.description : str = " v1.8\nHandle Javascript files, including the plugins.js file from RPG Maker MV/MZ"
+        self.description : str = " v1.9\nHandle Javascript files, including the plugins.js file from RPG Maker MV/MZ"
         self.related_tool_plugins : list[str] = [self.name]
 
     def match(self : Javascript, file_path : str, is_for_action : bool) -> bool:
@@ -35,6 +41,22 @@ class Javascript(Plugin):
         else:
             return content, False
 
+    def read_with_locations(self : Javascript, file_path : str, content : bytes) -> tuple[list[list[str]], Any]:
+        if file_path.endswith('js/plugins.js'):
+            return self.read(file_path, content), None
+        entries, string_table = self._scan_strings(self.decode(content))
+        return entries, self._make_locations(entries, string_table)
+
+    def write_with_locations(self : Javascript, name : str, file_path : str, content : bytes, locations : Any) -> tuple[bytes, bool]:
+        data = self.decode(content)
+        entries, string_table = self._read_locations(data, locations)
+        helper : WalkHelper = WalkHelper(file_path, self.owner.strings[name])
+        data = self._apply_strings(data, entries, string_table, helper, helper.group)
+        if helper.modified:
+            return self.encode(data), True
+        else:
+            return content, False
+
     # Standard javascript
     def _read_walk(self : Javascript, js : str) -> list[list[str]]:
         return self._parse_strings(js, None)[0]
@@ -46,10 +68,15 @@ class Javascript(Plugin):
     # If helper is not None, it will also replace the strings with translations
     # The returned value is a tuple, containing the list of group strings and the (modified or not) javascript text
     def _parse_strings(self : Javascript, js : str, helper : WalkHelper|None) -> tuple[list[list[str]], str]:
-        if helper is None:
-            entry_offset = 0
-        else:
-            entry_offset = helper.group
+        entries, string_table = self._scan_strings(js)
+        if helper is not None: # write mode
+            js = self._apply_strings(js, entries, string_table, helper, helper.group)
+        return entries, js
+
+    # Detect strings in the given javascript text
+    # The returned value is a tuple, containing the list of group strings and the string locations
+    # String locations are tuples of (start, end, group index, string index, quote character)
+    def _scan_strings(self : Javascript, js : str) -> tuple[list[list[str]], list[tuple]]:
         entries : list[list[str]] = []
         i = 0
         funcs = ["", ""]
@@ -61,6 +88,16 @@ class Javascript(Plugin):
         c : str = ""
         while i < jslen:
             c = js[i]
+            if c.isalnum():
+                # Function name detection, the whole word at once
+                end = WORD.match(js, i).end()
+                if func_pos[0] is None:
+                    func_pos[0] = i
+                func_pos[1] = end
+                # Regex allowed detection
+                regex_possible = False
+                i = end
+                continue
             if c == '/':
                 # Handle comments.
                 if i + 1 < jslen:
@@ -95,60 +132,89 @@ class Javascript(Plugin):
                             if start != end:
                                 literal = js[start:end]
                                 string_table.append((start, end, len(entries), len(group), quote)) # position in file, position in entries, quote
-                                group.append(literal.replace('\\'+quote, quote).replace("\\\n", "\n").replace("\\\r\n", "\n"))
+                                group.append(self._unescape(literal, quote))
                             i = end + 1
                             break
                         else:
                             end += 1
             else:
-                if c.isalnum():
-                    # Function name detection
-                    if func_pos[0] is None:
-                        func_pos[0] = i
-                    func_pos[1] = i+1
-                    # Regex allowed detection
-                    regex_possible = False
+                # Function name detection
+                if func_pos[0] is not None:
+                    funcs[-1] = js[func_pos[0]:func_pos[1]]
+                    func_pos[0] = None
+                shift_array : bool = False
+                if funcs[-1] != "":
+                    if funcs[-1] == "function" and funcs[-2] != "":
+                        if len(group) > 1:
+                            entries.append(group)
+                            group = [""]
+                        group[0] = funcs[-2] + "()"
+                    elif funcs[-2] == "function":
+                        if len(group) > 1:
+                            entries.append(group)
+                            group = [""]
+                        group[0] = funcs[-1] + "()"
+                    shift_array = True
+                elif c in ("(", ")"):
+                    shift_array = True
+                # Regex allowed detection
+                if c in (" ", "\t", "\n"):
+                    regex_possible = (funcs[-1] == "return" or regex_possible)
+                elif c in ("=", "(", ","):
+                    regex_possible = True
                 else:
-                    # Function name detection
-                    if func_pos[0] is not None:
-                        funcs[-1] = js[func_pos[0]:func_pos[1]]
-                        func_pos[0] = None
-                    shift_array : bool = False
-                    if funcs[-1] != "":
-                        if funcs[-1] == "function" and funcs[-2] != "":
-                            if len(group) > 1:
-                                entries.append(group)
-                                group = [""]
-                            group[0] = funcs[-2] + "()"
-                        elif funcs[-2] == "function":
-                            if len(group) > 1:
-                                entries.append(group)
-                                group = [""]
-                            group[0] = funcs[-1] + "()"
-                        shift_array = True
-                    elif c in ("(", ")"):
-                        shift_array = True
-                    # Regex allowed detection
-                    if c in (" ", "\t", "\n"):
-                        regex_possible = (funcs[-1] == "return" or regex_possible)
-                    elif c in ("=", "(", ","):
-                        regex_possible = True
-                    else:
-                        regex_possible = False
-                    # Shift funcs array
-                    if shift_array:
-                        funcs[0] = funcs[1]
-                        funcs[1] = ""
+                    regex_possible = False
+                # Shift funcs array
+                if shift_array:
+                    funcs[0] = funcs[1]
+                    funcs[1] = ""
+                # The last function name is now empty: process the following symbols at once
                 i += 1
+                end = SYMBOLS.match(js, i).end()
+                if end > i:
+                    symbols : str = js[i:end]
+                    if "(" in symbols or ")" in symbols:
+                        funcs[0] = ""
+                    symbols = symbols.rstrip(" \t\n")
+                    if symbols != "":
+                        regex_possible = symbols[-1] in ("=", "(", ",")
+                    i = end
         if len(group) > 1:
             entries.append(group)
-        if helper is not None: # write mode
-            for i in range(len(string_table)-1, -1, -1):
-                st = string_table[i]
-                tmp : str = helper.apply_string(entries[st[2]][st[3]], entries[st[2]][0], loc=(st[2]+entry_offset, st[3]))
-                if tmp != entries[st[2]][st[3]]:
-                    js = js[:st[0]] + tmp.replace(st[4], '\\'+st[4]).replace("\n", "\\n") + js[st[1]:]
-        return entries, js
+        return entries, string_table
+
+    # Return the text of a string literal
+    def _unescape(self : Javascript, literal : str, quote : str) -> str:
+        return literal.replace('\\'+quote, quote).replace("\\\n", "\n").replace("\\\r\n", "\n")
+
+    # Compact map of the strings found by _scan_strings: the group names and the string locations
+    def _make_locations(self : Javascript, entries : list[list[str]], string_table : list[tuple]) -> dict[str, list]:
+        return {"groups":[group[0] for group in entries], "strings":string_table}
+
+    # Rebuild the results of _scan_strings from the given text and map, without parsing the text
+    def _read_locations(self : Javascript, js : str, locations : dict[str, list]) -> tuple[list[list[str]], list[tuple]]:
+        entries : list[list[str]] = [[name] for name in locations["groups"]]
+        string_table : list[tuple] = [tuple(st) for st in locations["strings"]]
+        for st in string_table:
+            group : list[str] = entries[st[2]]
+            if len(group) != st[3]:
+                raise Exception("Invalid string location map")
+            group.append(self._unescape(js[st[0]:st[1]], st[4]))
+        return entries, string_table
+
+    # Replace the strings found by _scan_strings with their translations
+    # The text is returned unchanged if no string has been modified
+    def _apply_strings(self : Javascript, js : str, entries : list[list[str]], string_table : list[tuple], helper : WalkHelper, entry_offset : int) -> str:
+        replacements : list[tuple[int, int, str]] = []
+        for i in range(len(string_table)-1, -1, -1):
+            st = string_table[i]
+            tmp : str = helper.apply_string(entries[st[2]][st[3]], entries[st[2]][0], loc=(st[2]+entry_offset, st[3]))
+            if tmp != entries[st[2]][st[3]]:
+                replacements.append((st[0], st[1], tmp.replace(st[4], '\\'+st[4]).replace("\n", "\\n")))
+        if len(replacements) > 0:
+            replacements.reverse()
+            js = splice_text(js, replacements)
+        return js
 
     # RPGMK MZ/MV plugins.js
     def _read_walk_plugins(self : Javascript, js : str) -> list[list[str]]:
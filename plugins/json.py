@@ -6,6 +6,7 @@ from pathlib import PurePath
 from typing import Any
 
 class JSON(Plugin):
+    SUFFIXES : tuple[str, ...] = (".json",)
     DEFAULT_RPGMK_DATA_FILE : set[str] = set(["data/actors.json", "data/animations.json", "data/armors.json", "data/classes.json", "data/enemies.json", "data/items.json", "data/mapinfos.json", "data/skills.json", "data/states.json", "data/tilesets.json", "data/weapons.json"])
     RPGMVMZ_CODE_TABLE = {
         101: "Show Text",
@@ -155,7 +156,7 @@ class JSON(Plugin):
 
     def apply_default(self : JSON, name : str, params : dict[str, Any]) -> str:
         try:
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name)
             modified_string : int = 0
@@ -4,6 +4,7 @@ from typing import Any
 import unicodedata
 
 class KiriKiri(Plugin):
+    SUFFIXES : tuple[str, ...] = (".ks", ".tjs")
     def __init__(self : KiriKiri) -> None:
         super().__init__()
         self.name : str = "KiriKiri"
@@ -34,7 +35,7 @@ class KiriKiri(Plugin):
 
     def tool_space_removal(self : KiriKiri, name : str, params : dict[str, Any]) -> str:
         try:
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name)
             seen : set[str] = set() # used to track which strings we tested
@@ -2,11 +2,16 @@ from __future__ import annotations
 from . import Plugin, WalkHelper, GloIndex, LocIndex, IntBool
 from typing import Any
 import io
+import re
 import textwrap
 
+# Control characters which can't appear in a valid string (anything below 0x1f except \t, \n, \r)
+INVALID_CHARACTERS : re.Pattern = re.compile(rb'[\x00-\x08\x0b\x0c\x0e-\x1e]')
+
 # Based on some script I got from someone.
 # The original author is unknown, feel free to hit me up so I can credit them if you know.
 class MED(Plugin):
+    SUFFIXES : tuple[str, ...] = (".med",)
     CIPHER : bytes = b'\x00\x23\x52\x55\x4C\x45\x5F\x56\x49\x45\x57\x45\x52\x00\x3A\x56\x49\x45\x57\x5F\x30\x00\x7B\x00'
     
     def __init__(self : MED) -> None:
@@ -67,7 +72,7 @@ class MED(Plugin):
         except:
             return "Invalid character limit, it must be a positive integer."
         try:
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name) # if not loaded
             modified : int = 0
@@ -174,16 +179,19 @@ class MED(Plugin):
                 return ans
         return None
 
+    # Add (or subtract) the key to every byte after the 0x10 bytes header.
+    # Every byte sharing the same key position is processed at once using a translation table.
+    def apply_key(self : MED, data : bytearray, key : bytearray, sign : int) -> bytearray:
+        for i, k in enumerate(key):
+            table : bytes = bytes((j + sign * k) & 0xff for j in range(256))
+            data[0x10+i::len(key)] = data[0x10+i::len(key)].translate(table)
+        return data
+
     def decrypt(self : MED, data : bytes, key : bytearray) -> bytearray:
-        content = bytearray(data)
-        for i in range(0x10, len(content)):
-            content[i] = (content[i]+key[(i - 0x10) % len(key)]) & 0xff
-        return content
+        return self.apply_key(bytearray(data), key, 1)
 
     def encrypt(self : MED, data: bytearray, key : bytearray) -> bytearray:
-        for i in range(0x10, len(data)):
-            data[i] = (data[i] - key[(i - 0x10) % len(key)]) & 0xff
-        return data
+        return self.apply_key(data, key, -1)
 
     def unpack(self : MED, data : bytes) -> dict[str, bytearray]:
         if data[:4] != b'MDE0':
@@ -227,10 +235,7 @@ class MED(Plugin):
             raise Exception("[MED] Failed to unpack file")
 
     def _is_valid_string(self : MED, line: bytes) -> bool:
-        for ch in line:
-            if ch < 0x1f and ch not in (9, 13, 10): # \t, \n, \r
-                return False
-        return True
+        return INVALID_CHARACTERS.search(line) is None
 
     def _is_jp_text(self : MED, line: str) -> bool:
         for ch in line:
@@ -248,27 +253,22 @@ class MED(Plugin):
         count = 0
         for f, data in files.items():
             offset : int = int.from_bytes(data[4:8], byteorder='little') + 0x10
-            content : bytearray = data[offset:]
-            file_content : bytes = b''
             strings : list[str] = [""]
             file_entries : list[list[str]] = [[f"{self.owner.CHILDREN_FILE_ID}{count:05}_{f}"]]
-            for i in content:
-                if i:
-                    file_content += int.to_bytes(i, 1, byteorder='little')
-                else:
-                    try:
-                        if self._is_valid_string(file_content):
-                            decoded : str = file_content.decode('cp932', errors='ignore')
-                            if not self._is_comment(decoded) and self._is_jp_text(decoded):
-                                strings.append(decoded)
-                            else:
-                                if len(strings) > 1:
-                                    file_entries.append(strings)
-                                    strings = [""]
-                                strings[0] = decoded
-                    except Exception as e:
-                        self.owner.log.warning(f"[MED] Error in 'extract_med':\n{self.owner.trbk(e)}")
-                    file_content = b''
+            # the last segment isn't NUL terminated and is ignored
+            for file_content in data[offset:].split(b'\0')[:-1]:
+                try:
+                    if self._is_valid_string(file_content):
+                        decoded : str = file_content.decode('cp932', errors='ignore')
+                        if not self._is_comment(decoded) and self._is_jp_text(decoded):
+                            strings.append(decoded)
+                        else:
+                            if len(strings) > 1:
+                                file_entries.append(strings)
+                                strings = [""]
+                            strings[0] = decoded
+                except Exception as e:
+                    self.owner.log.warning(f"[MED] Error in 'extract_med':\n{self.owner.trbk(e)}")
             if len(strings) > 1:
                 file_entries.append(strings)
             if len(file_entries) > 1:
@@ -286,31 +286,23 @@ class MED(Plugin):
                 helper : WalkHelper = WalkHelper(fname, strings)
                 data : bytearray = files[f]
                 offset : int = int.from_bytes(data[4:8], byteorder='little') + 0x10
-                buffer : bytes = b''
-                while offset < len(data):
-                    if data[offset]:
-                        buffer += data[offset:offset+1]
-                    else:
-                        if self._is_valid_string(buffer):
-                            decoded : str = buffer.decode('cp932', errors='ignore')
-                            if self._is_comment(decoded) or not self._is_jp_text(decoded):
-                                group = decoded
-                                offset += 1
-                                buffer = b''
-                                continue
-                            else:
-                                tmp : str = helper.apply_string(decoded, group)
-                                if helper.str_modified:
-                                    offset -= len(buffer)
-                                    encoded = tmp.encode('cp932', errors='ignore')
-                                    data[offset:offset+len(buffer)] = encoded
-                                    offset += len(encoded)
-                                    modified = True
-                                buffer = b''
+                # split the strings on NUL, replace the patched segments and join them back at the end
+                segments : list[bytes] = data[offset:].split(b'\0')
+                for i in range(len(segments) - 1): # the last segment isn't NUL terminated
+                    buffer : bytes = segments[i]
+                    if self._is_valid_string(buffer):
+                        decoded : str = buffer.decode('cp932', errors='ignore')
+                        if self._is_comment(decoded) or not self._is_jp_text(decoded):
+                            group = decoded
                         else:
-                            buffer = b''
-                    offset += 1
+                            tmp : str = helper.apply_string(decoded, group)
+                            if helper.str_modified:
+                                segments[i] = tmp.encode('cp932', errors='ignore')
+                                modified = True
+                data = bytearray(memoryview(data)[:offset])
+                data += b'\0'.join(segments)
                 data[:4] = int.to_bytes(len(data)-0x10, 4, byteorder='little')
+                files[f] = data
             count += 1
         if modified:
             # header
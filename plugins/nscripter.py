@@ -5,6 +5,7 @@ from . import Plugin, WalkHelper
 # https://07th-mod.github.io/ponscripter-fork/api/
 # https://github.com/Galladite27/ONScripter-EN
 class NScripter(Plugin):
+    SUFFIXES : tuple[str, ...] = (".nscript",)
     # Complete list of NScripter functions, automatically dumped
     FUNCTIONS : set[str] = {
         "*define","*start","game","reset","definereset",
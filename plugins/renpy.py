@@ -2,6 +2,7 @@ from __future__ import annotations
 from . import Plugin, WalkHelper
 
 class Renpy(Plugin):
+    SUFFIXES : tuple[str, ...] = (".rpy",)
     def __init__(self : Renpy) -> None:
         super().__init__()
         self.name : str = "Renpy"
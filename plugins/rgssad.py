@@ -1,11 +1,18 @@
 from __future__ import annotations
-from . import Plugin, FileType, IntBool
+from . import Plugin, FileType, IntBool, xor_key
 from pathlib import PurePath
 import struct
 import os
-from typing import Any
+import mmap
+from array import array
+from typing import Any, Iterator
 
 class RGSSAD(Plugin):
+    SUFFIXES : tuple[str, ...] = ()
+    EXTRACT_SUFFIXES : tuple[str, ...] = (".rgssad", ".rgss2a", ".rgss3a")
+    # number of 32 bits keys decrypted at once
+    KEY_BLOCK = 65536
+
     def __init__(self : RGSSAD) -> None:
         super().__init__()
         self.name : str = "RGSSAD"
@@ -19,10 +26,11 @@ class RGSSAD(Plugin):
         target_dir : PurePath,
         backup_path : PurePath
     ) -> bool:
-        if full_path.suffix.lower() not in (".rgssad", ".rgss2a", ".rgss3a"):
+        if full_path.suffix.lower() not in self.EXTRACT_SUFFIXES:
             return False
         try:
-            with open(full_path, mode="rb") as f:
+            # the archive is memory mapped, only the matching files are read
+            with open(full_path, mode="rb") as raw, mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as f:
                 magic = f.read(6).decode('ascii')
                 if magic != "RGSSAD":
                     return False
@@ -35,10 +43,10 @@ class RGSSAD(Plugin):
                 for metadata in metadatas:
                     file_path : PurePath = target_dir / metadata["filename"]
                     if os.path.isfile(file_path):
-                        self.owner.log.error(f"[RGSSAD] Failed to extract:{metadata["filename"]}, file already exists\n{self.owner.trbk(e)}")
+                        self.owner.log.error(f"[RGSSAD] Failed to extract:{metadata["filename"]}, file already exists")
                         continue
                     # check if file is valid for a plugin
-                    for p in self.owner.plugins.values():
+                    for p in self.owner.get_file_plugins(file_path.name):
                         if p.match(file_path.name, False):
                             # create directory if not found
                             if not os.path.isdir(file_path.parent):
@@ -46,11 +54,12 @@ class RGSSAD(Plugin):
                                     # create dir if needed
                                     os.makedirs(file_path.parent.as_posix(), exist_ok=True)
                                 except Exception as e:
-                                    self.owner.log.error("[RGSSAD] Couldn't create the following folder:" + file_path.parent.as_posix() + "\n" + self.trbk(e))
+                                    self.owner.log.error("[RGSSAD] Couldn't create the following folder:" + file_path.parent.as_posix() + "\n" + self.owner.trbk(e))
                             # write file
                             with open(file_path, mode="wb") as out:
-                                f.seek(metadata["offset"])
-                                out.write(self.decrypt_file_data(f.read(metadata["size"]), metadata["key_for_data"]))
+                                with memoryview(f) as view:
+                                    for chunk in self.decrypt_stream(view[metadata["offset"]:metadata["offset"]+metadata["size"]], metadata["key_for_data"]):
+                                        out.write(chunk)
                             # add to update_file_dict
                             update_file_dict[(file_path.relative_to(backup_path)).as_posix()] = {
                                 "file_type":FileType.NORMAL,
@@ -66,15 +75,44 @@ class RGSSAD(Plugin):
             return False
 
     def decrypt_file_data(self : RGSSAD, encrypted_data : bytes, initial_key : int) -> bytes:
-        decrypted_data = bytearray()
-        temp_key = initial_key
-        for i, byte_val in enumerate(encrypted_data):
-            if i > 0 and i % 4 == 0: # Update key every 4 bytes, but not before the first byte
-                temp_key = (temp_key * 7 + 3) & 0xFFFFFFFF
-            
-            key_byte = (temp_key >> (8 * (i % 4))) & 0xFF
-            decrypted_data.append(byte_val ^ key_byte)
-        return bytes(decrypted_data)
+        return b"".join(self.decrypt_stream(encrypted_data, initial_key))
+
+    # Decrypt the data by chunks of KEY_BLOCK 32 bits words
+    # Each chunk is XORed at once, as a single big integer
+    def decrypt_stream(self : RGSSAD, encrypted_data : bytes|memoryview, initial_key : int) -> Iterator[bytes]:
+        size : int = len(encrypted_data)
+        offset : int = 0
+        for keys in self.key_stream(initial_key, (size + 3) // 4):
+            chunk = encrypted_data[offset:offset+len(keys)]
+            offset += len(keys)
+            yield (int.from_bytes(chunk, 'little') ^ int.from_bytes(keys[:len(chunk)], 'little')).to_bytes(len(chunk), 'little')
+
+    # Generate the key stream (a key per 4 bytes, updated with key * 7 + 3) in chunks of KEY_BLOCK keys, as little endian bytes
+    # Only the first chunk is computed key by key
+    # The next ones are derived from the previous one: key[i + KEY_BLOCK] = key[i] * A + C, with A and C the combination of KEY_BLOCK updates
+    # The keys are stored in 64 bits lanes of a big integer, so this can be done with a single multiplication, addition and mask
+    def key_stream(self : RGSSAD, key : int, count : int) -> Iterator[bytes]:
+        if count <= 0:
+            return
+        block : int = min(count, self.KEY_BLOCK)
+        keys : list[int] = []
+        mul : int = 1
+        inc : int = 0
+        for i in range(block):
+            keys.append(key)
+            key = (key * 7 + 3) & 0xFFFFFFFF
+            mul = (mul * 7) & 0xFFFFFFFF
+            inc = (inc * 7 + 3) & 0xFFFFFFFF
+        lanes : int = int.from_bytes(struct.pack(f"<{block}Q", *keys), 'little')
+        repeat_inc : int = int.from_bytes(struct.pack(f"<{block}Q", *([inc] * block)), 'little')
+        mask : int = int.from_bytes(struct.pack(f"<{block}Q", *([0xFFFFFFFF] * block)), 'little')
+        while True:
+            words : array = array('I', lanes.to_bytes(block * 8, 'little'))
+            yield words[::2].tobytes() # the first 4 bytes of each lane
+            count -= block
+            if count <= 0:
+                break
+            lanes = (lanes * mul + repeat_inc) & mask
 
     def read_int(self : RGSSAD, handle):
         return struct.unpack('<I', handle.read(4))[0]
@@ -95,10 +133,7 @@ class RGSSAD(Plugin):
         return value ^ key
 
     def decrypt_filename_v3(self : RGSSAD, encrypted_name_bytes : bytes, key : int):
-        decrypted_name = bytearray()
-        for i, byte in enumerate(encrypted_name_bytes):
-            decrypted_name.append(byte ^ (key >> (8 * (i % 4))) & 0xFF)
-        return decrypted_name.decode('utf-8', errors='ignore')
+        return xor_key(encrypted_name_bytes, key.to_bytes(4, 'little')).decode('utf-8', errors='ignore')
 
     def read_rgssad_v1(self : RGSSAD, handle):
         # for .rgssad and .rgss2a
@@ -6,6 +6,8 @@ import math
 from pathlib import Path, PurePath
 from typing import Any, Iterator, Callable
 from dataclasses import dataclass
+from collections import OrderedDict
+import hashlib
 import zlib
 import json
 
@@ -18,6 +20,10 @@ import json
 class RM_Marshal(Plugin):
     DEFAULT_RPGMK_DATA_FILE = ["data/actors", "data/animations", "data/armors", "data/classes", "data/enemies", "data/items", "data/skills", "data/states", "data/tilesets", "data/weapons"]
     EXTENSIONS : list[str] = ["rxdata", "rvdata", "rvdata2"]
+    SUFFIXES : tuple[str, ...] = tuple("." + ext for ext in EXTENSIONS)
+    # Classes without text, not parsed in files only walked through their event commands
+    SKIPPED_CLASSES : frozenset[bytes] = frozenset((b"RPG::MoveRoute", b"RPG::MoveCommand"))
+    CACHE_LIMIT = 1 << 26 # maximum total length of the cached scripts
     RPGMXP_CODE_TABLE = {
         101: "Show Text",
         102: "Choices",
@@ -129,9 +135,14 @@ class RM_Marshal(Plugin):
     def __init__(self : RM_Marshal) -> None:
         super().__init__()
         self.name : str = "RPG Maker Marshal"
-        self.description : str = "v3.5\nHandle files from RPG Maker XP, VX and VX Ace"
+        self.description : str = "v3.6\nHandle files from RPG Maker XP, VX and VX Ace"
         self.allow_ruby_plugin : bool = True # Leave it on by default
         self.related_tool_plugins : list[str] = [self.name, "JSON", "Ruby"]
+        # Scripts of Scripts.rxdata/rvdata/rvdata2, shared between read, write and the script export
+        # (index, compressed script hash) -> [decompressed script, Ruby plugin strings and locations or None if not scanned yet]
+        self.cache : OrderedDict[tuple, list] = OrderedDict()
+        self.cache_sizes : dict[tuple, int] = {}
+        self.cache_size : int = 0
 
     def get_setting_infos(self : RM_Marshal) -> dict[str, list]:
         return {
@@ -193,7 +204,7 @@ class RM_Marshal(Plugin):
         dp : str = p.relative_to(p.parent.parent) # path one folder up (to detect Data folder)
         dp = dp.parent / dp.stem # remove extension
         s : str = dp.as_posix().lower() # as lowercase posix string
-        mc : MC = MC.load(content)
+        mc : MC = MC.load(content, self._get_skipped_classes(s))
         entries : list[list[str]] = []
         if s == "data/commonevents":
             entries.extend(self._read_walk_common(mc.root))
@@ -216,13 +227,13 @@ class RM_Marshal(Plugin):
         dp : str = p.relative_to(p.parent.parent) # path one folder up (to detect Data folder)
         dp = dp.parent / dp.stem # remove extension
         s : str = dp.as_posix().lower() # as lowercase posix string
-        mc : MC = MC.load(content)
+        mc : MC = MC.load(content, self._get_skipped_classes(s))
         if s == "data/scripts":
             if self._write_walk_script(name, file_path, self.owner.strings[name], mc.root):
-                return mc.dump(), True
+                return mc.splice(content), True
         elif s== "data/commonevents":
             if self._write_walk_common(name, file_path, self.owner.strings[name], mc.root):
-                return mc.dump(), True
+                return mc.splice(content), True
         else:
             helper : WalkHelper = WalkHelper(file_path, self.owner.strings[name])
             if s == "data/mapinfos":
@@ -236,9 +247,15 @@ class RM_Marshal(Plugin):
             else:
                 self._write_walk(mc.root, helper)
             if helper.modified:
-                return mc.dump(), True
+                return mc.splice(content), True
         return content, False
 
+    # Return the classes which can be skipped during parsing, for the given data file
+    def _get_skipped_classes(self : RM_Marshal, s : str) -> frozenset[bytes]:
+        if s in ("data/commonevents", "data/troops") or (s.startswith("data/map") and s != "data/mapinfos"):
+            return self.SKIPPED_CLASSES
+        return frozenset()
+
     # Generic Ruby Marshal processing
     def _read_walk(self : RM_Marshal, me : ME, ignore_key : str|None = None) -> list[list[str]]:
         entries : list[list[str]] = []
@@ -249,7 +266,7 @@ class RM_Marshal(Plugin):
                 for i, e in enumerate(me):
                     if e.token == b'"':
                         if e.data:
-                            entries.append([str(i), e.data.decode('utf-8')])
+                            entries.append([str(i), e.text()])
                     else:
                         entries.extend(self._read_walk(e))
             case b'{'|b'o':
@@ -259,7 +276,7 @@ class RM_Marshal(Plugin):
                         continue
                     if v.token == b'"':
                         if v.data:
-                            entries.append([key, v.data.decode('utf-8')])
+                            entries.append([key, v.text()])
                     else:
                         entries.extend(self._read_walk(v))
             case _:
@@ -274,7 +291,7 @@ class RM_Marshal(Plugin):
                 for i, e in enumerate(me):
                     if e.token == b'"':
                         if e.data:
-                            tmp : str = helper.apply_string(e.data.decode('utf-8'), str(i))
+                            tmp : str = helper.apply_string(e.text(), str(i))
                             if helper.str_modified:
                                 e.data = tmp.encode('utf-8')
                     else:
@@ -286,7 +303,7 @@ class RM_Marshal(Plugin):
                         continue
                     if v.token == b'"':
                         if v.data:
-                            tmp : str = helper.apply_string(v.data.decode('utf-8'), key)
+                            tmp : str = helper.apply_string(v.text(), key)
                             if helper.str_modified:
                                 v.data = tmp.encode('utf-8')
                     else:
@@ -304,7 +321,7 @@ class RM_Marshal(Plugin):
                 if name is None:
                     strings = [[""]]
                 else:
-                    strings = [[name.data.decode('utf-8')]]
+                    strings = [[name.text()]]
                 pages : ME = ev.get(b"@pages")
                 if pages is not None:
                     for i, p in enumerate(pages):
@@ -343,7 +360,7 @@ class RM_Marshal(Plugin):
                     evname : str = f"{self.owner.CHILDREN_FILE_ID}{eid.data:04}"
                     n : ME = e.get(b"@name")
                     if n is not None:
-                        evname += " " + n.data.decode('utf-8')
+                        evname += " " + n.text()
                     entries.append([evname])
                     entries.extend(strings)
         return entries
@@ -359,7 +376,7 @@ class RM_Marshal(Plugin):
                 evname : str = f"{file_path}/{eid.data:04}"
                 n : ME = e.get(b"@name")
                 if n is not None:
-                    evname += " " + n.data.decode('utf-8')
+                    evname += " " + n.text()
                 if evname in strings["files"] and not self.owner.projects[name]["files"][evname]["ignored"]:
                     helper : WalkHelper = WalkHelper(evname, strings)
                     self._write_walk_event(cmds, helper)
@@ -376,7 +393,7 @@ class RM_Marshal(Plugin):
         while i < len(cmds) and cmds[i].token == b'o' and cmds[i].get(b"@code").data == code:
             parameters = cmds[i].get(b"@parameters").data
             if parameters[0].token == b'"' and parameters[0].data:
-                text.append(parameters[0].data.decode('utf-8'))
+                text.append(parameters[0].text())
                 elements.append(parameters[0])
             i += 1
         return i, text, elements
@@ -400,7 +417,7 @@ class RM_Marshal(Plugin):
             match code:
                 case 101|355: # Show Text commands / Script Commands
                     follow_code : int = code + 300
-                    tmp = parameters[0].data.decode('utf-8')
+                    tmp = parameters[0].text()
                     i, text, _unused_ = self._walk_event_continuous_command(i+1, me.data, follow_code)
                     i -= 1
                     if tmp or len(text) > 0:
@@ -416,16 +433,16 @@ class RM_Marshal(Plugin):
                         if pm.token == b'[':
                             for sub in pm:
                                 if sub.token == b'"' and sub.data:
-                                    group.append(sub.data.decode('utf-8'))
+                                    group.append(sub.text())
                         else:
                             if pm.token == b'"' and pm.data:
-                                group.append(pm.data.decode('utf-8'))
+                                group.append(pm.text())
                 case 108|408: # Comment
                     pass
                 case _: # Default
                     for pm in parameters:
                         if pm.token == b'"' and pm.data:
-                            group.append(pm.data.decode('utf-8'))
+                            group.append(pm.text())
             if len(group) > 1:
                 entries.append(group)
                 group = [""]
@@ -449,7 +466,7 @@ class RM_Marshal(Plugin):
             match code:
                 case 101|355: # Show Text commands / Script Commands
                     follow_code : int = code + 300
-                    tmp = parameters[0].data.decode('utf-8')
+                    tmp = parameters[0].text()
                     i, text, elements = self._walk_event_continuous_command(i+1, me.data, follow_code)
                     i -= 1
                     text.insert(0, tmp)
@@ -479,12 +496,12 @@ class RM_Marshal(Plugin):
                         if pm.token == b'[':
                             for sub in pm:
                                 if sub.token == b'"' and sub.data:
-                                    tmp : str = helper.apply_string(sub.data.decode('utf-8'), group)
+                                    tmp : str = helper.apply_string(sub.text(), group)
                                     if helper.str_modified:
                                         sub.data = tmp.encode('utf-8')
                         else:
                             if pm.token == b'"' and pm.data:
-                                tmp : str = helper.apply_string(pm.data.decode('utf-8'), group)
+                                tmp : str = helper.apply_string(pm.text(), group)
                                 if helper.str_modified:
                                     pm.data = tmp.encode('utf-8')
                 case 108|408: # Comment
@@ -492,12 +509,45 @@ class RM_Marshal(Plugin):
                 case _: # Default
                     for pm in parameters:
                         if pm.token == b'"' and pm.data:
-                            tmp : str = helper.apply_string(pm.data.decode('utf-8'), group)
+                            tmp : str = helper.apply_string(pm.text(), group)
                             if helper.str_modified:
                                 pm.data = tmp.encode('utf-8')
             i += 1
 
     # RPGMK Scripts processing
+    def cache_get(self : RM_Marshal, cache_key : tuple) -> Any:
+        value : Any = self.cache.get(cache_key, None)
+        if value is not None:
+            self.cache.move_to_end(cache_key)
+        return value
+
+    def cache_set(self : RM_Marshal, cache_key : tuple, value : Any, size : int = 64) -> None:
+        self.cache_size += size - self.cache_sizes.get(cache_key, 0)
+        self.cache[cache_key] = value
+        self.cache_sizes[cache_key] = size
+        self.cache.move_to_end(cache_key)
+        # remove the least recently used entries
+        while self.cache_size > self.CACHE_LIMIT and len(self.cache) > 1:
+            old_key, _ = self.cache.popitem(last=False)
+            self.cache_size -= self.cache_sizes.pop(old_key)
+
+    # Return the cache entry of a script, decompressing it if needed
+    def _get_script(self : RM_Marshal, index : int, data : bytes|memoryview) -> list:
+        cache_key : tuple = (index, hashlib.blake2b(data, digest_size=16).digest())
+        cached : list|None = self.cache_get(cache_key)
+        if cached is None:
+            cached = [zlib.decompressobj().decompress(data).decode('utf-8'), None]
+            self.cache_set(cache_key, cached, 64 + 2 * len(cached[0]))
+        return cached
+
+    # Return the decompressed script, its strings and their locations, scanning it with the Ruby plugin if needed
+    def _get_script_strings(self : RM_Marshal, index : int, data : bytes|memoryview) -> tuple[str, list[list[str]], list[tuple]]:
+        cached : list = self._get_script(index, data)
+        if cached[1] is None:
+            self.owner.plugins["Ruby"].reset()
+            cached[1] = self.owner.plugins["Ruby"]._scan_strings(cached[0])
+        return cached[0], cached[1][0], cached[1][1]
+
     def _read_walk_script(self : RM_Marshal, me : ME) -> list[list[str]]:
         entries : list[list[str]] = []
         count : int = 0
@@ -505,16 +555,15 @@ class RM_Marshal(Plugin):
         for e in me:
             scriptname = f"{self.owner.CHILDREN_FILE_ID}{count:04}"
             if e.data[1].data:
-                scriptname += " " + e.data[1].data.decode('utf-8')
+                scriptname += " " + e.data[1].text()
             if e.data[2].data:
-                script = zlib.decompressobj().decompress(e.data[2].data).decode('utf-8')
                 if use_ruby:
-                    self.owner.plugins["Ruby"].reset()
-                    strings = self.owner.plugins["Ruby"]._parse_strings(script, None, len(entries))[0]
+                    script, strings, _unused_ = self._get_script_strings(count, e.data[2].data)
                     if len(strings) > 0:
                         entries.append([scriptname])
-                        entries.extend(strings)
+                        entries.extend([list(group) for group in strings]) # copy the cached groups
                 else:
+                    script = self._get_script(count, e.data[2].data)[0]
                     entries.append([scriptname])
                     entries.append([script])
             count += 1
@@ -527,19 +576,19 @@ class RM_Marshal(Plugin):
         for e in me:
             scriptname = f"{file_path}/{count:04}"
             if e.data[1].data:
-                scriptname += " " + e.data[1].data.decode('utf-8').replace("/", " ").replace("\\", " ")
+                scriptname += " " + e.data[1].text().replace("/", " ").replace("\\", " ")
             if e.data[2].data:
                 if scriptname in strings["files"] and not self.owner.projects[name]["files"][scriptname]["ignored"]:
                     helper : WalkHelper = WalkHelper(scriptname, strings)
-                    script = zlib.decompressobj().decompress(e.data[2].data).decode('utf-8')
                     if use_ruby:
-                        self.owner.plugins["Ruby"].reset()
-                        newscript = self.owner.plugins["Ruby"]._parse_strings(script, helper)[1]
+                        script, script_strings, string_table = self._get_script_strings(count, e.data[2].data)
+                        newscript = self.owner.plugins["Ruby"]._apply_strings(script, script_strings, string_table, helper, helper.group)
                         if newscript != script:
                             compressor = zlib.compressobj()
                             e.data[2].data = compressor.compress(newscript.encode('utf-8')) + compressor.flush()
                             modified = True
                     else:
+                        script = self._get_script(count, e.data[2].data)[0]
                         tmp : str = helper.apply_string(script)
                         if helper.str_modified:
                             compressor = zlib.compressobj()
@@ -555,7 +604,7 @@ class RM_Marshal(Plugin):
             if e[1].token == b'o':
                 r : ME = e[1].get(b"@name")
                 if r is not None:
-                    entries.append(["Map " + str(e[0]), r.data.decode('utf-8')])
+                    entries.append(["Map " + str(e[0]), r.text()])
         return entries
 
     def _write_walk_mapinfo(self : RM_Marshal, me : ME, helper : WalkHelper) -> None:
@@ -563,7 +612,7 @@ class RM_Marshal(Plugin):
             if e[1].token == b'o':
                 r : ME = e[1].get(b"@name")
                 if r is not None and r.token == b'"' and r.data:
-                    tmp : str = helper.apply_string(r.data.decode('utf-8'), "Map " + str(e[0]))
+                    tmp : str = helper.apply_string(r.text(), "Map " + str(e[0]))
                     if helper.str_modified:
                         r.data = tmp.encode('utf-8')
 
@@ -623,25 +672,44 @@ class RM_Marshal(Plugin):
                 self._write_walk(e, helper)
 
 # Classes for handling Ruby Marshal files
+TOKENS : list[bytes] = [bytes((i,)) for i in range(256)] # token byte values to their bytes equivalent
+UNINDEXED_TOKENS : frozenset[bytes] = frozenset((b"0", b"T", b"F", b"i", b":", b";", b"@", b"I")) # tokens not added to the object table
+SHARED_TOKENS : frozenset[bytes] = frozenset((b"0", b"T", b"F", b"i", b";")) # tokens whose Marshal Elements are shared inside a container
+RAW_TOKEN : bytes = b"" # token of skipped elements, their data contains their original binary
+
 @dataclass(slots=True)
 class MC(): # for Marshal Container
     root : ME|None
     symtable : list[ME]
     objtable : list[ME]
+    view : memoryview|None # file content, only during parsing
+    pos : int # parsing cursor
+    skipped_classes : frozenset[bytes] # objects of those classes are kept as raw binary
+    shared : dict[int, ME] # nil, booleans, small fixnums and symbol links, indexed by their binary (token and one byte value)
+    strings : list[ME] # parsed strings, in file order
 
-    def __init__(self : MC) -> None:
+    def __init__(self : MC, skipped_classes : frozenset[bytes] = frozenset()) -> None:
         self.root = None
         self.symtable = []
         self.objtable = [None]
+        self.view = None
+        self.pos = 0
+        self.skipped_classes = skipped_classes
+        self.shared = {}
+        self.strings = []
 
     # parse binary Marshal File content and return a Marshal Container
-    def load(binary : bytes) -> MC:
-        with io.BytesIO(binary) as handle:
-            if handle.read(1) != b"\x04" or handle.read(1) != b"\x08":
-                raise Exception("[RM_Marshal] Unsupported Ruby Marshal version or invalid file")
-            mc : MC = MC()
-            mc.root = mc._process_token(handle)
-            return mc
+    # Strings and binary payloads are memoryview slices of the given content
+    # Objects of the classes in skipped_classes aren't parsed, they are kept as is and dumped back unchanged
+    def load(binary : bytes, skipped_classes : frozenset[bytes] = frozenset()) -> MC:
+        if binary[:2] != b"\x04\x08":
+            raise Exception("[RM_Marshal] Unsupported Ruby Marshal version or invalid file")
+        mc : MC = MC(skipped_classes)
+        mc.view = memoryview(binary)
+        mc.pos = 2
+        mc.root = mc._process_token()
+        mc.view = None
+        return mc
     
     # generate binary Marshal File content from the Marshal Container
     def dump(self : MC) -> bytes:
@@ -650,54 +718,152 @@ class MC(): # for Marshal Container
             self.root.dump(handle)
             return handle.getvalue()
 
+    # generate binary Marshal File content by replacing the modified strings in the original binary
+    # The rest of the file is copied as is, meaning only string modifications are kept (use dump() otherwise)
+    def splice(self : MC, binary : bytes) -> bytes:
+        view : memoryview = memoryview(binary)
+        segments : list[bytes] = []
+        pos : int = 0
+        for me in self.strings:
+            if not isinstance(me.data, memoryview): # the data has been replaced
+                segments.append(view[pos:me.span[0]])
+                segments.append(self.util_write_fixnum(len(me.data)))
+                segments.append(me.data)
+                pos = me.span[1]
+        segments.append(view[pos:])
+        return b"".join(segments)
+
     # Default function for unimplemented tokens, used during parsing
-    def _token_unimplemented(self : MC, token : bytes, handle : io.BytesIO) -> None:
+    def _token_unimplemented(self : MC, token : bytes) -> None:
         raise Exception("[RM_Marshal] Token " + str(token) + " isn't implemented")
 
     # Read a byte (token) and create Marshal Element (ME) accordingly
-    def _process_token(self : MC, handle : io.BytesIO, ivar=False) -> ME:
-        token = handle.read(1)
-        if token is None or token == b'':
+    def _process_token(self : MC, ivar=False) -> ME:
+        try:
+            c : int = self.view[self.pos]
+            if not ivar: # look for an already existing shared element first
+                me : ME|None = self.shared.get(c, None)
+                if me is not None:
+                    self.pos += 1
+                    return me
+                if c == 0x69 or c == 0x3b: # i and ;
+                    me = self.shared.get((c << 8) | self.view[self.pos+1], None)
+                    if me is not None:
+                        self.pos += 2
+                        return me
+        except IndexError:
             raise Exception("[RM_Marshal] Reached EOF")
-        if token not in self.TOKEN_TABLE:
-            return self._token_unimplemented(token, handle)
+        token : bytes = TOKENS[c]
+        self.pos += 1
+        reader : Callable|None = self.TOKEN_TABLE.get(token, None)
+        if reader is None:
+            return self._token_unimplemented(token)
         else:
             index : int|None
             # Add spot to object table
             # Instance Var are in as we handle those differently
-            if not ivar and token not in (b"0", b"T", b"F", b"i", b":", b";", b"@", b"I"): 
+            if not ivar and token not in UNINDEXED_TOKENS:
                 index = len(self.objtable)
                 self.objtable.append(None)
             else:
                 index = None
             # Parse content
-            me : ME = self.TOKEN_TABLE[token](self, token, handle)
+            me : ME = reader(self, token)
             # Instance variable
             if ivar:
-                me.attributes = self._read_hashtable(b"{", handle)
+                if me.token in SHARED_TOKENS: # don't modify a shared element
+                    me = ME(self, me.token, me.data)
+                me.attributes = self._read_hashtable(b"{")
                 me.attributes.silent_token = True
             # Fill object table
-            if not ivar and index is not None:
+            if index is not None:
                 self.objtable[index] = me
             return me
 
+    # Move the cursor over an element without creating it
+    # Symbols and the object table are filled the same way _process_token does, for links to stay valid
+    def _skip_token(self : MC, ivar=False) -> None:
+        if self.pos >= len(self.view):
+            raise Exception("[RM_Marshal] Reached EOF")
+        token : bytes = TOKENS[self.view[self.pos]]
+        self.pos += 1
+        if not ivar and token not in UNINDEXED_TOKENS:
+            self.objtable.append(None)
+        match token:
+            case b"0"|b"T"|b"F":
+                pass
+            case b"I":
+                self._skip_token(True)
+                self.objtable.append(None)
+            case b'"'|b"f"|b"/"|b"m"|b"c"|b"M":
+                self.util_read_bytes()
+            case b":":
+                self._read_symbol(token)
+            case b";":
+                if not 0 <= self.util_read_fixnum() < len(self.symtable):
+                    raise Exception("[RM_Marshal] Symbol Link isn't pointing to an existing symbol")
+            case b"i":
+                self.util_read_fixnum()
+            case b"[":
+                for i in range(self.util_read_fixnum()):
+                    self._skip_token()
+            case b"{":
+                self._skip_hashtable()
+            case b"l":
+                self.pos += 1 # sign
+                size : int = self.util_read_fixnum() # read first, as it moves self.pos
+                self.pos += 2 * size
+            case b"U":
+                self._skip_token()
+                self._skip_token()
+            case b"o":
+                self._skip_token()
+                self._skip_hashtable()
+            case b"@":
+                if not 0 < self.util_read_fixnum() < len(self.objtable):
+                    raise Exception("[RM_Marshal] Link isn't pointing to an existing element")
+            case b"u":
+                self._skip_token()
+                self.util_read_bytes()
+            case _:
+                self._token_unimplemented(token)
+        if ivar:
+            self._skip_hashtable()
+
+    def _skip_hashtable(self : MC) -> None:
+        for i in range(2 * self.util_read_fixnum()):
+            self._skip_token()
+
     # Generic function to read a Ruby Marshal fixnum/long
-    def util_read_fixnum(self : MC, handle : io.BytesIO) -> int:
-        length = struct.unpack("b", handle.read(1))[0]
-        if length == 0:
-            return 0
+    def util_read_fixnum(self : MC) -> int:
+        if self.pos >= len(self.view):
+            raise Exception("[RM_Marshal] Reached EOF")
+        length : int = self.view[self.pos]
+        self.pos += 1
         if 4 < length < 128:
             return length - 5
-        elif -129 < length < -4:
-            return length + 5
-        result = 0
-        alen = abs(length)
-        data = handle.read(alen)
-        result = int.from_bytes(data, byteorder="little", signed=False)
+        elif length == 0:
+            return 0
+        elif length > 127: # signed byte
+            length -= 256
+            if length < -4:
+                return length + 5
+        alen : int = abs(length)
+        result : int = int.from_bytes(self.view[self.pos:self.pos+alen], byteorder="little", signed=False)
+        self.pos += alen
         if length < 0:
             result -= (1 << (8 * alen))
         return result
 
+    # Generic function to read a length prefixed binary, as a slice of the file content
+    def util_read_bytes(self : MC) -> memoryview:
+        size : int = self.util_read_fixnum()
+        data : memoryview = self.view[self.pos:self.pos+size]
+        if len(data) != size:
+            raise Exception("[RM_Marshal] Reached EOF")
+        self.pos += size
+        return data
+
     # Generic function to write a Ruby Marshal fixnum/long
     def util_write_fixnum(self : MC, value : int) -> bytes:
         if value == 0:
@@ -720,85 +886,118 @@ class MC(): # for Marshal Container
             sign = int(math.copysign(size, back))
             return struct.pack("b", sign) + value.to_bytes(size, byteorder='little', signed=False)
 
+    # Create a Marshal Element for a fixnum or symbol link and share it if its value is stored in one byte
+    def _shared_fixnum(self : MC, token : bytes) -> ME:
+        start : int = self.pos
+        me : ME = ME(self, token, self.util_read_fixnum())
+        if self.pos == start + 1:
+            self.shared[(token[0] << 8) | self.view[start]] = me
+        return me
+
     # functions used for parsing
 
-    def _read_nil(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, None)
+    def _read_nil(self : MC, token : bytes) -> ME:
+        me : ME = ME(self, token, None)
+        self.shared[token[0]] = me
+        return me
 
-    def _read_true(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, True)
+    def _read_true(self : MC, token : bytes) -> ME:
+        me : ME = ME(self, token, True)
+        self.shared[token[0]] = me
+        return me
 
-    def _read_false(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, False)
+    def _read_false(self : MC, token : bytes) -> ME:
+        me : ME = ME(self, token, False)
+        self.shared[token[0]] = me
+        return me
 
-    def _read_instancevariable(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        me : ME = self._process_token(handle, True)
+    def _read_instancevariable(self : MC, token : bytes) -> ME:
+        me : ME = self._process_token(True)
         self.objtable.append(ME(self, b"I", False)) # Dummy "instance"
         return me
 
-    def _read_string(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, handle.read(self.util_read_fixnum(handle)))
+    def _read_string(self : MC, token : bytes) -> ME:
+        start : int = self.pos
+        me : ME = ME(self, token, self.util_read_bytes())
+        me.span = (start, self.pos)
+        self.strings.append(me)
+        return me
 
-    def _read_symbol(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        me : ME = ME(self, token, handle.read(self.util_read_fixnum(handle)))
+    def _read_symbol(self : MC, token : bytes) -> ME:
+        me : ME = ME(self, token, self.util_read_bytes().tobytes())
         self.symtable.append(me)
         return me
 
-    def _read_symlink(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        me : ME = ME(self, token, self.util_read_fixnum(handle))
+    def _read_symlink(self : MC, token : bytes) -> ME:
+        me : ME = self._shared_fixnum(token)
         if me.data < 0 or me.data >= len(self.symtable): # check validity
             raise Exception("[RM_Marshal] Symbol Link isn't pointing to an existing symbol")
         return me
 
-    def _read_fixnum(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, self.util_read_fixnum(handle))
+    def _read_fixnum(self : MC, token : bytes) -> ME:
+        return self._shared_fixnum(token)
 
-    def _read_array(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        size = self.util_read_fixnum(handle)
-        return ME(self, token, [self._process_token(handle) for i in range(size)])
+    def _read_array(self : MC, token : bytes) -> ME:
+        size = self.util_read_fixnum()
+        return ME(self, token, [self._process_token() for i in range(size)])
 
-    def _read_hashtable(self : MC, token : bytes, handle : io.BytesIO) -> ME:
+    def _read_hashtable(self : MC, token : bytes) -> ME:
         me : ME = ME(self, token, None)
-        size = self.util_read_fixnum(handle)
+        size = self.util_read_fixnum()
         hashtable : dict[ME, ME] = {}
         for i in range(size):
-            original : ME = self._process_token(handle) # before the statement to be processed first
-            hashtable[original.at().data] = (original, self._process_token(handle))
+            original : ME = self._process_token() # before the statement to be processed first
+            key : Any = original.at().data
+            if isinstance(key, memoryview):
+                key = key.tobytes()
+            hashtable[key] = (original, self._process_token())
         me.data = hashtable
         return me
 
-    def _read_float(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, handle.read(self.util_read_fixnum(handle)))
+    def _read_float(self : MC, token : bytes) -> ME:
+        return ME(self, token, self.util_read_bytes().tobytes())
 
-    def _read_bignum(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        sign = handle.read(1)
-        size = self.util_read_fixnum(handle)
-        b = b"" if size == 0 else handle.read(2*size)
+    def _read_bignum(self : MC, token : bytes) -> ME:
+        sign = self.view[self.pos:self.pos+1].tobytes()
+        self.pos += 1
+        size = self.util_read_fixnum()
+        b = self.view[self.pos:self.pos+2*size].tobytes()
+        self.pos += 2 * size
         return ME(self, token, (sign, b))
 
-    def _read_regex(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, handle.read(self.util_read_fixnum(handle)))
-
-    def _read_usermarshal(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, (self._process_token(handle), self._process_token(handle)))
-
-    def _read_object(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        symbol : ME = self._process_token(handle)
-        table : ME = self._read_hashtable(b"{", handle)
+    def _read_regex(self : MC, token : bytes) -> ME:
+        return ME(self, token, self.util_read_bytes().tobytes())
+
+    def _read_usermarshal(self : MC, token : bytes) -> ME:
+        return ME(self, token, (self._process_token(), self._process_token()))
+
+    def _read_object(self : MC, token : bytes) -> ME:
+        start : int = self.pos - 1
+        symbol : ME = self._process_token()
+        if self.skipped_classes and symbol.at().data in self.skipped_classes:
+            # keep the object binary as is
+            # links to elements inside it point to the skipped object
+            first : int = len(self.objtable)
+            self._skip_hashtable()
+            me : ME = ME(self, RAW_TOKEN, self.view[start:self.pos])
+            for i in range(first, len(self.objtable)):
+                self.objtable[i] = me
+            return me
+        table : ME = self._read_hashtable(b"{")
         table.silent_token = True
         return ME(self, token, (symbol, table))
 
-    def _read_link(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        me : ME = ME(self, token, self.util_read_fixnum(handle))
-        if me.data <= 0 or me.data >= len(self.objtable): # check validity
+    def _read_link(self : MC, token : bytes) -> ME:
+        index : int = self.util_read_fixnum()
+        if index <= 0 or index >= len(self.objtable): # check validity
             raise Exception("[RM_Marshal] Link isn't pointing to an existing element")
-        return me
+        return ME(self, token, index)
 
-    def _read_userdefined(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, (self._process_token(handle), handle.read(self.util_read_fixnum(handle))))
+    def _read_userdefined(self : MC, token : bytes) -> ME:
+        return ME(self, token, (self._process_token(), self.util_read_bytes()))
 
-    def _read_classmodule(self : MC, token : bytes, handle : io.BytesIO) -> ME:
-        return ME(self, token, handle.read(self.util_read_fixnum(handle)))
+    def _read_classmodule(self : MC, token : bytes) -> ME:
+        return ME(self, token, self.util_read_bytes().tobytes())
     
     TOKEN_TABLE = {
         b"0":_read_nil,
@@ -845,16 +1044,16 @@ class ME(): # for Marshal Element
     token : bytes
     data : Any
     attributes : ME|None # instance variable attributes
+    span : tuple[int, int]|None # position of a parsed string in the file, from its length to the end of its content
     silent_token : bool # set it to True so that the token isn't written during dump()
-    _dump_call_ : Callable # used during dump and set in __init__ according to the given token
     
     def __init__(self : ME, owner : MC, token : bytes, data : Any = None) -> None:
         self.owner = owner
         self.token = token
         self.data = data
         self.attributes = None
+        self.span = None
         self.silent_token = False
-        self._dump_call_ = self.DUMP_CALL_TABLE.get(self.token, self.dump_unimplemented)
 
     def __repr__(self : ME) -> str:
         return self.token.decode() + ":" + repr(self.data)
@@ -902,6 +1101,9 @@ class ME(): # for Marshal Element
             case b";"|b"@":
                 return self.at().get(key)
 
+    def text(self : ME) -> str: # decode the string data
+        return str(self.data, 'utf-8')
+
     def at(self : ME) -> ME: # match links to their equivalent
         match self.token:
             case b";":
@@ -917,7 +1119,7 @@ class ME(): # for Marshal Element
             handle.write(b"I")
         if not self.silent_token:
             handle.write(self.token)
-        self._dump_call_(self, handle)
+        self.DUMP_CALL_TABLE.get(self.token, ME.dump_unimplemented)(self, handle)
         if self.attributes is not None:
             self.attributes.dump(handle)
 
@@ -962,6 +1164,9 @@ class ME(): # for Marshal Element
         handle.write(self.owner.util_write_fixnum(len(self.data[1])))
         handle.write(self.data[1])
 
+    def dump_raw(self : ME, handle : io.BytesIO) -> None:
+        handle.write(self.data)
+
     def dump_unimplemented(self : ME, handle : io.BytesIO) -> None:
         raise Exception("[RM_Marshal] Unknown token type:" + str(self.token))
 
@@ -984,7 +1189,8 @@ class ME(): # for Marshal Element
         b"u":dump_userdefined,
         b"m":dump_binary,
         b"c":dump_binary,
-        b"M":dump_binary
+        b"M":dump_binary,
+        RAW_TOKEN:dump_raw
     }
 
     # For debugging purpose
@@ -1020,7 +1226,7 @@ class ME(): # for Marshal Element
                 handle.write('false')
             case b'"':
                 try:
-                    handle.write(json.dumps(self.data.decode('utf-8'), ensure_ascii=False))
+                    handle.write(json.dumps(self.text(), ensure_ascii=False))
                 except:
                     try:
                         if not is_script:
@@ -1085,7 +1291,7 @@ class ME(): # for Marshal Element
                 handle.write(',\n')
                 self._write_indent(handle, indent+1)
                 handle.write('"binary": ')
-                handle.write(json.dumps(str(self.data[1])))
+                handle.write(json.dumps(str(bytes(self.data[1]))))
                 self._write_struct_end(handle, indent)
             case b"m":
                 self._write_generic(handle, indent, "Module")
@@ -1,11 +1,17 @@
 from __future__ import annotations
-from . import Plugin, WalkHelper
+from . import Plugin, WalkHelper, splice_text
+from typing import Any
+import re
+
+WORD : re.Pattern = re.compile(r'[^\W_]+') # alphanumeric characters, as str.isalnum()
+SYMBOLS : re.Pattern = re.compile(r'(?:[^\w#"\n]|_)*') # non-alphanumeric characters, except comments, quotes and new lines
 
 class Ruby(Plugin):
+    SUFFIXES : tuple[str, ...] = (".rb",)
     def __init__(self : Ruby) -> None:
         super().__init__()
         self.name : str = "Ruby"
-        self.description : str = " v1.5\nHandle Ruby files"
+        self.description : str = " v1.6\nHandle Ruby files"
         self.related_tool_plugins : list[str] = [self.name]
 
     def match(self : Ruby, file_path : str, is_for_action : bool) -> bool:
@@ -24,6 +30,20 @@ class Ruby(Plugin):
         else:
             return content, False
 
+    def read_with_locations(self : Ruby, file_path : str, content : bytes) -> tuple[list[list[str]], Any]:
+        entries, string_table = self._scan_strings(self.decode(content))
+        return entries, self._make_locations(entries, string_table)
+
+    def write_with_locations(self : Ruby, name : str, file_path : str, content : bytes, locations : Any) -> tuple[bytes, bool]:
+        data = self.decode(content)
+        entries, string_table = self._read_locations(data, locations)
+        helper : WalkHelper = WalkHelper(file_path, self.owner.strings[name])
+        data = self._apply_strings(data, entries, string_table, helper, helper.group)
+        if helper.modified:
+            return self.encode(data), True
+        else:
+            return content, False
+
     # Standard ruby
     def _read_walk(self : Ruby, js : str) -> list[list[str]]:
         return self._parse_strings(js, None)[0]
@@ -34,13 +54,22 @@ class Ruby(Plugin):
     # Detect strings in the given ruby text
     # If helper is not None, it will also replace the strings with translations
     # The returned value is a tuple, containing the list of group strings and the (modified or not) ruby text
-    # Code inspired/reused from the javascript plugin
     def _parse_strings(self : Ruby, script : str, helper : WalkHelper|None, entry_offset : int|None = None) -> tuple[list[list[str]], str]:
         if entry_offset is None:
             if helper is None:
                 entry_offset = 0
             else:
                 entry_offset = helper.group
+        entries, string_table = self._scan_strings(script)
+        if helper is not None: # write mode
+            script = self._apply_strings(script, entries, string_table, helper, entry_offset)
+        return entries, script
+
+    # Detect strings in the given ruby text
+    # The returned value is a tuple, containing the list of group strings and the string locations
+    # String locations are tuples of (start, end, group index, string index, quote character)
+    # Code inspired/reused from the javascript plugin
+    def _scan_strings(self : Ruby, script : str) -> tuple[list[list[str]], list[tuple]]:
         entries : list[list[str]] = []
         i = 0
         funcs = ["", ""]
@@ -50,6 +79,14 @@ class Ruby(Plugin):
         scriptlen : int = len(script)
         while i < scriptlen:
             c : str = script[i]
+            if c.isalnum():
+                # Function name detection, the whole word at once
+                end = WORD.match(script, i).end()
+                if func_pos[0] is None:
+                    func_pos[0] = i
+                func_pos[1] = end
+                i = end
+                continue
             if c == '#': # Single Line Comment
                 i = script.find('\n', i + 1)
                 if i == -1:
@@ -76,41 +113,67 @@ class Ruby(Plugin):
                             if start != end:
                                 literal = script[start:end]
                                 string_table.append((start, end, len(entries), len(group), '"'))
-                                group.append(literal.replace('\\"', '"'))
+                                group.append(self._unescape(literal, '"'))
                             i = end + 1
                             break
                         else:
                             end += 1
             else:
-                if c.isalnum():
-                    # Function name detection
-                    if func_pos[0] is None:
-                        func_pos[0] = i
-                    func_pos[1] = i+1
+                # Function name detection
+                if func_pos[0] is not None:
+                    funcs[-1] = script[func_pos[0]:func_pos[1]]
+                    func_pos[0] = None
+                if funcs[-1] != "" and funcs[-2] == "def":
+                    if len(group) > 1:
+                        entries.append(group)
+                        group = [""]
+                    group[0] = funcs[-1] + "()"
+                    funcs[0], funcs[1] = funcs[1], ""
                 else:
-                    # Function name detection
-                    if func_pos[0] is not None:
-                        funcs[-1] = script[func_pos[0]:func_pos[1]]
-                        func_pos[0] = None
-                    if funcs[-1] != "" and funcs[-2] == "def":
-                        if len(group) > 1:
-                            entries.append(group)
-                            group = [""]
-                        group[0] = funcs[-1] + "()"
-                        funcs[0], funcs[1] = funcs[1], ""
-                    else:
-                        funcs[0], funcs[1] = funcs[1], ""
+                    funcs[0], funcs[1] = funcs[1], ""
+                # The following symbols only shift the function names
                 i += 1
+                end = SYMBOLS.match(script, i).end()
+                if end > i:
+                    funcs[0] = ""
+                    i = end
         if len(group) > 1:
             entries.append(group)
-        if helper is not None: # write mode
-            for i in range(len(string_table)-1, -1, -1):
-                st = string_table[i]
-                tmp : str = helper.apply_string(entries[st[2]][st[3]], entries[st[2]][0], loc=(st[2]+entry_offset, st[3]))
-                if tmp != entries[st[2]][st[3]]:
-                    script = script[:st[0]] + tmp.replace(st[4], '\\'+st[4]) + script[st[1]:]
-            if len(string_table) > 0:
-                helper.group = string_table[-1][2]+entry_offset
-                helper.index = string_table[-1][3]
-                helper._goNext()
-        return entries, script
\ No newline at end of file
+        return entries, string_table
+
+    # Return the text of a string literal
+    def _unescape(self : Ruby, literal : str, quote : str) -> str:
+        return literal.replace('\\'+quote, quote)
+
+    # Compact map of the strings found by _scan_strings: the group names and the string locations
+    def _make_locations(self : Ruby, entries : list[list[str]], string_table : list[tuple]) -> dict[str, list]:
+        return {"groups":[group[0] for group in entries], "strings":string_table}
+
+    # Rebuild the results of _scan_strings from the given script and map, without parsing the script
+    def _read_locations(self : Ruby, script : str, locations : dict[str, list]) -> tuple[list[list[str]], list[tuple]]:
+        entries : list[list[str]] = [[name] for name in locations["groups"]]
+        string_table : list[tuple] = [tuple(st) for st in locations["strings"]]
+        for st in string_table:
+            group : list[str] = entries[st[2]]
+            if len(group) != st[3]:
+                raise Exception("Invalid string location map")
+            group.append(self._unescape(script[st[0]:st[1]], st[4]))
+        return entries, string_table
+
+    # Replace the strings found by _scan_strings with their translations
+    # The script is returned unchanged if no string has been modified
+    def _apply_strings(self : Ruby, script : str, entries : list[list[str]], string_table : list[tuple], helper : WalkHelper, entry_offset : int) -> str:
+        replaced : list[tuple[int, int, str]] = []
+        for i in range(len(string_table)-1, -1, -1):
+            st = string_table[i]
+            tmp : str = helper.apply_string(entries[st[2]][st[3]], entries[st[2]][0], loc=(st[2]+entry_offset, st[3]))
+            if tmp != entries[st[2]][st[3]]:
+                replaced.append((st[0], st[1], tmp.replace(st[4], '\\'+st[4])))
+        if len(string_table) > 0:
+            helper.group = string_table[-1][2]+entry_offset
+            helper.index = string_table[-1][3]
+            helper._goNext()
+        if len(replaced) > 0:
+            replaced.reverse()
+            script = splice_text(script, replaced)
+        return script
\ No newline at end of file
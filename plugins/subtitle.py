@@ -4,6 +4,7 @@ import re
 
 
 class Subtitle(Plugin):
+    SUFFIXES : tuple[str, ...] = (".ass", ".ssa", ".srt", ".lrc")
     LRC_TIMECODE = re.compile("^\\s*\\d+\\s*:\\s*\\d+\\s*.\\s*\\d+\\s*")
     
     def __init__(self : Subtitle) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 from . import Plugin, WalkHelper
 
 class TXT(Plugin):
+    SUFFIXES : tuple[str, ...] = (".txt",)
     def __init__(self : TXT) -> None:
         super().__init__()
         self.name : str = "TXT"
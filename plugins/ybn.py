@@ -1,7 +1,11 @@
 from __future__ import annotations
-from . import Plugin, WalkHelper, GloIndex, LocIndex
+from . import Plugin, WalkHelper, GloIndex, LocIndex, xor_key
 import struct
-from collections import Counter
+import sys
+from array import array
+from itertools import accumulate
+from collections import Counter, OrderedDict
+import hashlib
 from io import BytesIO
 from pathlib import Path
 import json
@@ -144,32 +148,60 @@ class YArgInfo:
         self.res_info_val: int = res_info # Corresponds to YArg.ResSize when YArg.Type == 0
         self.res_offset_val: int = res_offset # Corresponds to YArg.ResOffset when YArg.Type == 0
 
-class YInstInfo:
-    def __init__(
-        self : YInstInfo, op: int = 0, unk: int = 0,
-        args : list[YArgInfo]|None = None
-    ):
-        self.op: int = op
-        self.unk: int = unk
-        self.arg_cnt: int = 0 # Will be populated from YInst's ArgCnt
-        self.args: list[YArgInfo] = args if args is not None else []
-
+# The instructions and arguments are stored as columns (one array per field)
+# YArgInfo objects are only created on demand, with get_arg and get_args
 class YbnInfo:
-    def __init__(
-        self : YbnInfo,
-        header : YbnHeader|None = None,
-        insts : list[YInstInfo]|None = None,
-        offs : list[int]|None = None
-    ) -> None:
+    def __init__(self : YbnInfo, header : YbnHeader|None = None) -> None:
         self.header: YbnHeader = header if header is not None else YbnHeader()
-        self.insts: list[YInstInfo] = insts if insts is not None else []
-        self.offs: list[int] = offs if offs is not None else []
+        # instructions
+        self.inst_op: bytes = b""
+        self.inst_arg_cnt: bytes = b""
+        self.inst_unk: array = array('H')
+        self.inst_arg_start: array = array('I') # index of the first argument of each instruction
+        # arguments
+        self.arg_value: array = array('H')
+        self.arg_type: array = array('H')
+        self.arg_res_size: array = array('I')
+        self.arg_res_offset: array = array('I')
+        # decrypted resource section
+        self.resources: bytes = b""
+        self.offs: array = array('I')
+
+    def get_arg(self : YbnInfo, inst_index : int, arg_index : int) -> YArgInfo:
+        a : int = self.inst_arg_start[inst_index] + arg_index
+        arg_info_entry = YArgInfo(type=self.arg_type[a], value=self.arg_value[a])
+        if arg_info_entry.type == 0 and self.inst_arg_cnt[inst_index] != 1:
+            arg_info_entry.res_info_val = self.arg_res_size[a]
+            arg_info_entry.res_offset_val = self.arg_res_offset[a]
+        else:
+            # Resource is present (bounds are checked by YBN.check_resources)
+            offset : int = self.arg_res_offset[a]
+            res_entry = arg_info_entry.res
+            if arg_info_entry.type == 3:
+                res_entry.type, length = struct.unpack_from(YResInfo.format_string(), self.resources, offset)
+                offset += YResInfo.size()
+                res_entry.res = self.resources[offset:offset+length]
+            else: # Type is not 3, read rarg.res_size bytes as raw resource
+                res_entry.res_raw = self.resources[offset:offset+self.arg_res_size[a]]
+        return arg_info_entry
+
+    def get_args(self : YbnInfo, inst_index : int) -> list[YArgInfo]:
+        return [self.get_arg(inst_index, i) for i in range(self.inst_arg_cnt[inst_index])]
+
+# Return an array of little endian integers from data
+def unpack_array(typecode : str, data : bytes) -> array:
+    a : array = array(typecode)
+    a.frombytes(data)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a
 
 # ##########################################################
 # The RPGMTL plugin
 # Extract and look for ybn files
 # ##########################################################
 class YBN(Plugin):
+    SUFFIXES : tuple[str, ...] = (".ybn",)
     TXT_FUNCTION : set[str] = (
         '"es.sel.set"',
         '"es.char.name.mark.set"',
@@ -179,14 +211,22 @@ class YBN(Plugin):
         '"es.tips.tx.def.set"',
     )
     HEADER_SIZE = YbnHeader.size()
+    CACHE_LIMIT = 1 << 26 # maximum total length of the cached strings
     
     def __init__(self : YBN) -> None:
         super().__init__()
         self.name : str = "YBN"
-        self.description : str = " v1.1\nHandle YBN files."
+        self.description : str = " v1.2\nHandle YBN files."
         self.related_tool_plugins : list[str] = [self.name]
         self.last_ypf_path : Path|None = None
         self.last_ypf_data : dict[str, str|int] = {}
+        # Parsing results, keyed by the file content hash, shared between the YPF import (get_codes), read and write
+        # ("key", hash) -> guessed key
+        # ("ops", hash, key, msg_op, call_op) -> guessed (msg_op, call_op)
+        # ("strings", hash, key, msg_op, call_op) -> extracted strings
+        self.cache : OrderedDict[tuple, Any] = OrderedDict()
+        self.cache_sizes : dict[tuple, int] = {}
+        self.cache_size : int = 0
 
     def match(self : YBN, file_path : str, is_for_action : bool) -> bool:
         return file_path.endswith("ybn")
@@ -240,7 +280,7 @@ class YBN(Plugin):
             case _:
                 return "Invalid selection"
         try:
-            self.owner.save() # save first!
+            self.owner.save(name=name) # save first!
             self.owner.backup_strings_file(name) # backup strings.json
             self.owner.load_strings(name) # if not loaded
             names : dict[str, str] = self.lusterise_load_names(name)
@@ -346,13 +386,12 @@ class YBN(Plugin):
         path : Path = Path(file_path)
         # we only care about yst00000.ybn files
         if path.name.startswith("yst") and path.name[3].isdigit() and path.suffix == ".ybn":
-            script, ops, _ = self.parse_ybn(
+            return self.get_strings(
                 content,
                 key=self.last_ypf_data.get("key", None),
                 msg_op=self.last_ypf_data.get("msg", 0),
                 call_op=self.last_ypf_data.get("call", 0)
             )
-            return self.extract_strings(script, ops)
         else:
             return []
 
@@ -373,22 +412,72 @@ class YBN(Plugin):
 
     # Function for the YPF plugin
     # It parse the file preemptively and return what it thinks is the key and the opcodes
+    # The strings are extracted too, so read doesn't have to parse the file again if the key and opcodes are the same
     def get_codes(self : YBN, content : bytes, file_path) -> tuple[str|None, int|None, int|None]:
         try:
-            _, ops, key = self.parse_ybn(content)
+            digest : bytes = self.content_hash(content)
+            script, ops, key = self.parse_ybn(content, digest=digest)
+            self.cache_strings(digest, bytes.fromhex(key), ops, self.extract_strings(script, ops))
             return key, ops.msg_op, ops.call_op
         except:
             return None, None, None
 
+    # Return the extracted strings of a file, from the cache if possible
+    def get_strings(
+        self : YBN, content: bytes,
+        *,
+        key : bytes|None = None,
+        msg_op : int = 0,
+        call_op : int = 0
+    ) -> list[list[str]]:
+        digest : bytes = self.content_hash(content)
+        used_key : bytes|None = key if key is not None else self.cache_get(("key", digest))
+        if used_key is not None:
+            guessed : tuple[int, int]|None = self.cache_get(("ops", digest, bytes(used_key), msg_op, call_op))
+            if guessed is not None:
+                entries : list[list[str]]|None = self.cache_get(("strings", digest, bytes(used_key)) + guessed)
+                if entries is not None:
+                    return [list(group) for group in entries] # copy, in case the caller modifies them
+        script, ops, hex_key = self.parse_ybn(content, key=key, msg_op=msg_op, call_op=call_op, digest=digest)
+        entries = self.extract_strings(script, ops)
+        self.cache_strings(digest, bytes.fromhex(hex_key), ops, entries)
+        return [list(group) for group in entries]
+
+    def content_hash(self : YBN, content : bytes) -> bytes:
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def cache_get(self : YBN, cache_key : tuple) -> Any:
+        value : Any = self.cache.get(cache_key, None)
+        if value is not None:
+            self.cache.move_to_end(cache_key)
+        return value
+
+    def cache_set(self : YBN, cache_key : tuple, value : Any, size : int = 64) -> None:
+        self.cache_size += size - self.cache_sizes.get(cache_key, 0)
+        self.cache[cache_key] = value
+        self.cache_sizes[cache_key] = size
+        self.cache.move_to_end(cache_key)
+        # remove the least recently used entries
+        while self.cache_size > self.CACHE_LIMIT and len(self.cache) > 1:
+            old_key, _ = self.cache.popitem(last=False)
+            self.cache_size -= self.cache_sizes.pop(old_key)
+
+    def cache_strings(self : YBN, digest : bytes, key : bytes, ops : YKeyOps, entries : list[list[str]]) -> None:
+        self.cache_set(("strings", digest, key, ops.msg_op, ops.call_op), entries, 64 + sum(len(s) for group in entries for s in group))
+
     # Main function to parse the YBN
+    # digest is the content hash, if already computed
     def parse_ybn(
         self : YBN, content: bytes,
         *,
         key : bytes|None = None,
         msg_op : int = 0,
-        call_op : int = 0
+        call_op : int = 0,
+        digest : bytes|None = None
     ) -> tuple[YbnInfo, YKeyOps, str]:
         script = YbnInfo()
+        if digest is None:
+            digest = self.content_hash(content)
 
         if len(content) < self.HEADER_SIZE:
             raise Exception("File too small to contain a YBN header.")
@@ -416,7 +505,10 @@ class YBN(Plugin):
         working = bytearray(content)
         # attempt to guess key if not provided (occurs via get_codes())
         if key is None:
-            key = self.guess_key(working[YbnHeader.size():])
+            key = self.cache_get(("key", digest))
+            if key is None:
+                key = bytes(self.guess_key(working[YbnHeader.size():]))
+                self.cache_set(("key", digest), key)
         if key != b"\x00\x00\x00\x00":
             self.decrypt_ybn(working, key, header)
 
@@ -428,15 +520,11 @@ class YBN(Plugin):
         if len(raw_insts_data) != header.code_size:
             raise Exception("Failed to find YBN file complete code section.")
 
-        script.insts = []
-        for i in range(int(header.inst_cnt)):
-            offset = i * yinst_size
-            if offset + yinst_size > len(raw_insts_data):
-                raise Exception("Not enough data for instruction {i} in code section.")
-            y_inst = YInst.unpack(raw_insts_data[offset : offset + yinst_size])
-            inst_info = YInstInfo(op=y_inst.op, unk=y_inst.unk)
-            inst_info.arg_cnt = y_inst.arg_cnt # Store arg_cnt from YInst
-            script.insts.append(inst_info)
+        # Columns of the instruction fields: op (uint8), arg_cnt (uint8), unk (uint16)
+        script.inst_op = raw_insts_data[0::yinst_size]
+        script.inst_arg_cnt = raw_insts_data[1::yinst_size]
+        script.inst_unk = unpack_array('H', raw_insts_data)[1::2]
+        script.inst_arg_start = array('I', accumulate(script.inst_arg_cnt, initial=0))
 
         # Read arguments
         raw_args_data = decrypted.read(header.arg_size)
@@ -450,89 +538,24 @@ class YBN(Plugin):
             if header.arg_size % yarg_size != 0:
                 raise Exception(f"ArgSize ({header.arg_size}) not a multiple of YArg size ({yarg_size}).")
 
-        rargs: list[YArg] = []
-        for i in range(num_yargs):
-            offset = i * yarg_size
-            if offset + yarg_size > len(raw_args_data):
-                raise Exception(f"Not enough data for YArg {i} in argument section.")
-            rargs.append(YArg.unpack(raw_args_data[offset : offset + yarg_size]))
+        # Columns of the argument fields: value (uint16), type (uint16), res_size (uint32), res_offset (uint32)
+        words = unpack_array('H', raw_args_data)
+        script.arg_value = words[0::6]
+        script.arg_type = words[1::6]
+        words = unpack_array('I', raw_args_data)
+        script.arg_res_size = words[1::3]
+        script.arg_res_offset = words[2::3]
+        del words
+        if script.inst_arg_start.pop() > num_yargs:
+            raise Exception(f"Argument count mismatch: instructions expect more arguments than available ({num_yargs})")
 
         res_start_abs_offset = self.HEADER_SIZE + header.code_size + header.arg_size
-        rarg_idx = 0
-
-        for i in range(int(header.inst_cnt)):
-            inst_info = script.insts[i]
-            inst_info.args = []
-
-            for _ in range(inst_info.arg_cnt): # Use stored arg_cnt
-                if rarg_idx >= len(rargs):
-                    raise Exception(f"Argument count mismatch: instruction {i} expected more arguments than available in rargs list (rarg_idx: {rarg_idx}, len(rargs): {len(rargs)})")
-
-                rarg = rargs[rarg_idx]
-                rarg_idx += 1
-
-                arg_info_entry = YArgInfo(type=rarg.type, value=rarg.value)
-
-                if rarg.type == 0 and inst_info.arg_cnt != 1:
-                    arg_info_entry.res_info_val = rarg.res_size
-                    arg_info_entry.res_offset_val = rarg.res_offset
-                else:
-                    # Resource is present, read it from the main resource section
-                    # Check if resource offset and size are valid
-                    if rarg.res_offset >= header.resource_size:
-                        raise Exception(f"Resource offset {rarg.res_offset} is out of bounds for resource section size {header.resource_size} (inst {i}, arg type {rarg.type})")
-
-                    # Temporarily seek in the main decrypted stream to read the resource
-                    ori_pos = decrypted.tell()
-                    decrypted.seek(res_start_abs_offset + rarg.res_offset)
-
-                    res_entry = arg_info_entry.res
-
-                    if rarg.type == 3:
-                        y_res_info_size = YResInfo.size()
-                        if rarg.res_size < y_res_info_size:
-                             # This used to be an error. Go code implies res_size is for the YResInfo + data.
-                             # Let's check if rarg.res_offset + y_res_info_size exceeds resource section.
-                             if res_start_abs_offset + rarg.res_offset + y_res_info_size > res_start_abs_offset + header.resource_size:
-                                raise Exception(f"Resource (type 3) at offset {rarg.res_offset} with YResInfo would read past resource section end.")
-
-                        res_info_data = decrypted.read(y_res_info_size)
-                        if len(res_info_data) < y_res_info_size:
-                            raise Exception(f"Could not read YResInfo at offset {rarg.res_offset} in resource section (inst {i})")
-
-                        y_res_info = YResInfo.unpack(res_info_data)
-                        res_entry.type = y_res_info.type
-
-                        # Check if y_res_info.length would read past end of specified rarg.res_size
-                        # or past end of the entire resource section
-                        if y_res_info_size + y_res_info.length > rarg.res_size:
-                            raise Exception(f"YResInfo length ({y_res_info.length}) + YResInfo size ({y_res_info_size}) > YArg.ResSize ({rarg.res_size}) for inst {i}, rarg offset {rarg.res_offset}. Clamping read.")
-                            bytes_to_read = rarg.res_size - y_res_info_size
-                        else:
-                            bytes_to_read = y_res_info.length
-
-                        if res_start_abs_offset + rarg.res_offset + y_res_info_size + bytes_to_read > res_start_abs_offset + header.resource_size:
-                            raise Exception(f"Resource data read (len {bytes_to_read}) for type 3 at offset {rarg.res_offset} would exceed resource section end.")
-
-                        res_entry.res = decrypted.read(bytes_to_read)
-                        if len(res_entry.res) != bytes_to_read:
-                            raise Exception(f"Could not read full resource data for type 3. Expected {bytes_to_read}, got {len(res_entry.res)} (inst {i}, rarg offset {rarg.res_offset})")
-                    else: # Type is not 3, read rarg.res_size bytes as raw resource
-                        if res_start_abs_offset + rarg.res_offset + rarg.res_size > res_start_abs_offset + header.resource_size:
-                            raise Exception(f"Raw resource read (size {rarg.res_size}) at offset {rarg.res_offset} would exceed resource section end.")
-
-                        res_entry.res_raw = decrypted.read(rarg.res_size)
-                        if len(res_entry.res_raw) != rarg.res_size:
-                            raise Exception(f"Could not read full raw resource data. Expected {rarg.res_size}, got {len(res_entry.res_raw)} (inst {i}, rarg offset {rarg.res_offset})")
-
-                    decrypted.seek(ori_pos) # Restore position
-
-                inst_info.args.append(arg_info_entry)
+        script.resources = bytes(working[res_start_abs_offset:res_start_abs_offset+header.resource_size])
+        self.check_resources(script)
 
         off_tbl_offset_in_file = self.HEADER_SIZE + header.code_size + header.arg_size + header.resource_size
-        decrypted.seek(off_tbl_offset_in_file)
 
-        script.offs = []
+        script.offs = array('I')
         if header.off_size > 0 :
             expected_off_size = header.inst_cnt * 4 # Each offset is uint32
             if header.off_size != expected_off_size:
@@ -550,16 +573,49 @@ class YBN(Plugin):
             if off_tbl_offset_in_file + bytes_for_offsets_to_read > len(working):
                 raise Exception(f"Offset table read ({bytes_for_offsets_to_read} bytes) would exceed total file data.")
 
-            for _ in range(num_offsets_to_read):
-                off_data = decrypted.read(4)
-                if len(off_data) < 4:
-                    raise Exception("Could not read full offset entry from offset table (EOF or short read).")
-                script.offs.append(struct.unpack("<I", off_data)[0])
+            script.offs = unpack_array('I', working[off_tbl_offset_in_file:off_tbl_offset_in_file + num_offsets_to_read * 4])
 
         ops = YKeyOps(msg_op, call_op)
-        self.guess_ybn_op(script, ops) # guess_ybn_op updates ops in-place
+        guessed : tuple[int, int]|None = self.cache_get(("ops", digest, bytes(key), msg_op, call_op))
+        if guessed is not None:
+            ops.msg_op, ops.call_op = guessed
+        else:
+            self.guess_ybn_op(script, ops) # guess_ybn_op updates ops in-place
+            # msg_op and call_op are guessed independently, so giving one of the results gives the same other one
+            guessed = (ops.msg_op, ops.call_op)
+            for given in set([(msg_op, call_op), (ops.msg_op, call_op), (msg_op, ops.call_op), guessed]):
+                if (given[0] == 0 or given[0] == guessed[0]) and (given[1] == 0 or given[1] == guessed[1]):
+                    self.cache_set(("ops", digest, bytes(key)) + given, guessed)
         return script, ops, key.hex()
 
+    # Check that the resource of each argument is inside the resource section
+    # Raise an exception otherwise, which is also how get_codes rejects a wrong key
+    def check_resources(self : YBN, script : YbnInfo) -> None:
+        resource_size : int = script.header.resource_size
+        y_res_info_size : int = YResInfo.size()
+        resources : bytes = script.resources
+        arg_type : array = script.arg_type
+        arg_res_size : array = script.arg_res_size
+        arg_res_offset : array = script.arg_res_offset
+        for i, (start, arg_cnt) in enumerate(zip(script.inst_arg_start, script.inst_arg_cnt)):
+            for a in range(start, start + arg_cnt):
+                arg_type_value : int = arg_type[a]
+                if arg_type_value == 0 and arg_cnt != 1:
+                    continue
+                res_offset : int = arg_res_offset[a]
+                if res_offset >= resource_size:
+                    raise Exception(f"Resource offset {res_offset} is out of bounds for resource section size {resource_size} (inst {i}, arg type {arg_type_value})")
+                if arg_type_value == 3:
+                    if res_offset + y_res_info_size > resource_size:
+                        raise Exception(f"Resource (type 3) at offset {res_offset} with YResInfo would read past resource section end.")
+                    length : int = resources[res_offset + 1] | (resources[res_offset + 2] << 8) # YResInfo length
+                    if y_res_info_size + length > arg_res_size[a]:
+                        raise Exception(f"YResInfo length ({length}) + YResInfo size ({y_res_info_size}) > YArg.ResSize ({arg_res_size[a]}) for inst {i}, rarg offset {res_offset}.")
+                    if res_offset + y_res_info_size + length > resource_size:
+                        raise Exception(f"Resource data read (len {length}) for type 3 at offset {res_offset} would exceed resource section end.")
+                elif res_offset + arg_res_size[a] > resource_size:
+                    raise Exception(f"Raw resource read (size {arg_res_size[a]}) at offset {res_offset} would exceed resource section end.")
+
     # Function to guess the decryption key from the byte content
     def guess_key(self : YBN, encrypted : bytearray) -> bytes:
         # The idea was inspired from this post https://forums.fuwanovel.moe/topic/24704-a-complete-guide-to-unpack-and-repack-yu-ris-engine-files/
@@ -580,9 +636,9 @@ class YBN(Plugin):
             raise Exception("Key length error")
         # Ensure end_offset does not exceed length
         actual_end_offset = min(end_offset, len(encrypted))
-        for i in range(start_offset, actual_end_offset):
-            # Key index must be relative to the start of the current block being processed
-            encrypted[i] ^= key[(i - start_offset) & 3]
+        if actual_end_offset > start_offset:
+            # Key index is relative to the start of the current block being processed
+            encrypted[start_offset:actual_end_offset] = xor_key(memoryview(encrypted)[start_offset:actual_end_offset], key)
 
     def decrypt_ybn(self : YBN, encrypted : bytearray, key: bytes, header: YbnHeader) -> bytearray:
         current_offset = YbnHeader.size()
@@ -626,46 +682,50 @@ class YBN(Plugin):
         if not should_guess_msg_op and not should_guess_call_op:
             return True
 
-        for inst in script.insts:
+        for i, (op, arg_cnt, start) in enumerate(zip(script.inst_op, script.inst_arg_cnt, script.inst_arg_start)):
             # If ops that needed guessing have been found, or if we only needed to output pre-set ops, stop.
             if not should_guess_msg_op and not should_guess_call_op:
                 break
-
-            if should_guess_msg_op and len(inst.args) == 1 and (self.is_jap_or_chn_msg(inst.args[0]) or self.is_english_msg(inst.args[0])):
-                msg_stat[inst.op] += 1
-                if msg_stat[inst.op] > 10:
-                    ops.msg_op = inst.op
+            # Both need a first argument with a value of 0, only read it then
+            if arg_cnt == 0 or script.arg_value[start] != 0 or script.arg_type[start] not in (0, 3):
+                continue
+            arg = script.get_arg(i, 0)
+
+            if should_guess_msg_op and arg_cnt == 1 and (self.is_jap_or_chn_msg(arg) or self.is_english_msg(arg)):
+                msg_stat[op] += 1
+                if msg_stat[op] > 10:
+                    ops.msg_op = op
                     should_guess_msg_op = False # Mark as found, stop guessing this one
 
-            if should_guess_call_op and len(inst.args) >= 1 and inst.args[0].res and \
-               inst.args[0].value == 0 and inst.args[0].type == 3 and inst.args[0].res.res is not None:
+            if should_guess_call_op and arg.res and \
+               arg.value == 0 and arg.type == 3 and arg.res.res is not None:
 
-                res_bytes = inst.args[0].res.res
+                res_bytes = arg.res.res
                 s = ""
                 try:
                     s = res_bytes.decode('ascii')
                 except UnicodeDecodeError:
                     pass
 
-                if inst.args[0].res.type == 0x4d and len(s) > 4 and \
+                if arg.res.type == 0x4d and len(s) > 4 and \
                    s.startswith('"e') and s.endswith('"'):
-                    call_stat[inst.op] += 1
-                    if call_stat[inst.op] > 5:
-                        ops.call_op = inst.op
+                    call_stat[op] += 1
+                    if call_stat[op] > 5:
+                        ops.call_op = op
                         should_guess_call_op = False # Mark as found, stop guessing this one
         return ops.msg_op != 0 and ops.call_op != 0
 
     # Extract strings return string groups in the RPGMTL format
     def extract_strings(self : YBN, script : YbnInfo, ops : YKeyOps) -> list[list[str]]:
         entries : list[list[str]] = []
-        for inst_idx, inst in enumerate(script.insts):
-            if inst.op == ops.msg_op:
-                if len(inst.args) != 1:
+        for inst_idx, op in enumerate(script.inst_op):
+            if op == ops.msg_op:
+                if script.inst_arg_cnt[inst_idx] != 1:
                     # Log warning instead of hard error to match Go behavior of continuing
-                    self.owner.log.warning(f"Message op 0x{ops.msg_op:x} (inst {inst_idx}) has {len(inst.args)} args, expected 1. Skipping.")
+                    self.owner.log.warning(f"Message op 0x{ops.msg_op:x} (inst {inst_idx}) has {script.inst_arg_cnt[inst_idx]} args, expected 1. Skipping.")
                     continue
 
-                arg = inst.args[0]
+                arg = script.get_arg(inst_idx, 0)
                 raw_str_bytes: bytes|None = None
                 # Go logic: Type 3 uses res.Res, otherwise res.ResRaw
                 if arg.type == 3 and arg.res and arg.res.res is not None:
@@ -680,24 +740,24 @@ class YBN(Plugin):
                 else:
                     self.owner.log.warning(f"Warning: Msg op 0x{ops.msg_op:x} (inst {inst_idx}), arg type {arg.type} had no decodable bytes.")
 
-            elif inst.op == ops.call_op:
-                if not inst.args:
+            elif op == ops.call_op:
+                if script.inst_arg_cnt[inst_idx] == 0:
                     self.owner.log.warning(f"Warning: Call op 0x{ops.call_op:x} (inst {inst_idx}) has no arguments. Skipping.")
                     continue
 
-                func_name_arg = inst.args[0]
+                func_name_arg = script.get_arg(inst_idx, 0)
                 if func_name_arg.res and func_name_arg.res.res and self.is_function_to_extract(func_name_arg.res.res):
-                    for arg_sub_idx, arg in enumerate(inst.args[1:]):
+                    for arg_sub_idx, arg in enumerate(script.get_args(inst_idx)[1:]):
                         if arg.type == 3 and arg.res and arg.res.res is not None and arg.res.res != b'""' and arg.res.res != b"''":
                             if len(entries) == 0 or entries[-1][0] != "Function":
                                 entries.append(["Function"])
                             entries[-1].append(self.decode_string(arg.res.res))
 
-            elif ops.other_op and inst.op in ops.other_op:
-                for arg_idx, arg in enumerate(inst.args):
+            elif ops.other_op and op in ops.other_op:
+                for arg_idx, arg in enumerate(script.get_args(inst_idx)):
                      if arg.type == 3 and arg.res and arg.res.res is not None and arg.res.res != b'""' and arg.res.res != b"''":
-                            if len(entries) == 0 or entries[-1][0] != f"Other {inst.op}":
-                                entries.append([f"Other {inst.op}"])
+                            if len(entries) == 0 or entries[-1][0] != f"Other {op}":
+                                entries.append([f"Other {op}"])
                             entries[-1].append(self.decode_string(arg.res.res))
         return entries
 
@@ -727,16 +787,19 @@ class YBN(Plugin):
         return False
 
     # Note: Unused, for debug
-    def decode_script_string(self : YBN, script : YbnInfo, ops : YKeyOps):
-        for inst in script.insts:
-            for arg in inst.args:
+    def decode_script_string(self : YBN, script : YbnInfo, ops : YKeyOps) -> list[list[YArgInfo]]:
+        insts : list[list[YArgInfo]] = []
+        for inst_idx, op in enumerate(script.inst_op):
+            insts.append(script.get_args(inst_idx))
+            for arg in insts[-1]:
                 if arg.res:
                     # Preference to res (Type 3 typically)
                     if arg.res.res is not None:
                         arg.res.res_str = self.decode_string(arg.res.res)
                     # Fallback to res_raw if res is None, especially for msg op
-                    elif arg.res.res_raw is not None and (inst.op == ops.msg_op or arg.type != 3) :
+                    elif arg.res.res_raw is not None and (op == ops.msg_op or arg.type != 3) :
                         arg.res.res_str = self.decode_string(arg.res.res_raw)
+        return insts
 
     def is_function_to_extract(self : YBN, name_bytes : bytes|None) -> bool:
         if name_bytes is None:
@@ -829,14 +892,18 @@ class YBN(Plugin):
         appended_new_data = bytearray()
         
         new_offset = script.header.resource_size
-        arg_cursor = 0 # Tracks current YArg's start position in arg_data
-        for inst_idx, inst in enumerate(script.insts):
-            is_msg_op = inst.op == ops.msg_op
+        for inst_idx, op in enumerate(script.inst_op):
+            # Only the arguments of these instructions are read
+            if op != ops.msg_op and op != ops.call_op and not (ops.other_op and op in ops.other_op):
+                continue
+            args = script.get_args(inst_idx)
+            is_msg_op = op == ops.msg_op
             is_call_op_for_extraction = False
-            if inst.op == ops.call_op and inst.args and inst.args[0].res and inst.args[0].res.res is not None: # Ensure res and res.res exist
-                 is_call_op_for_extraction = self.is_function_to_extract(inst.args[0].res.res)
-            is_other_relevant_op = ops.other_op and inst.op in ops.other_op
-            for arg_idx, arg in enumerate(inst.args):
+            if op == ops.call_op and args and args[0].res and args[0].res.res is not None: # Ensure res and res.res exist
+                 is_call_op_for_extraction = self.is_function_to_extract(args[0].res.res)
+            is_other_relevant_op = ops.other_op and op in ops.other_op
+            arg_cursor = script.inst_arg_start[inst_idx] * YArg.size() # Tracks current YArg's start position in arg_data
+            for arg_idx, arg in enumerate(args):
                 # Calculate offsets for YArg.ResSize and YArg.ResOffset within modified_arg_data_bytearray
                 # YArg structure: Value(2), Type(2), ResSize(4), ResOffset(4)
                 size_field_offset = arg_cursor + 4
@@ -862,7 +929,7 @@ class YBN(Plugin):
                     if arg.type == 3 and arg.res and arg.res.res is not None and arg.res.res != b'""' and arg.res.res != b"''":
                         should_process_this_arg = True
                         original = self.decode_string(arg.res.res)
-                        group = f"Other {inst.op}"
+                        group = f"Other {op}"
 
                 if should_process_this_arg:
                     string = helper.apply_string(original, group)
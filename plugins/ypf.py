@@ -2,9 +2,17 @@ from __future__ import annotations
 from . import Plugin, FileType, IntBool
 import io
 import os
+import sys
+import mmap
 import json
 import struct
 import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from collections import deque
+from collections.abc import Iterator
+import multiprocessing
+from itertools import repeat
 from enum import Enum
 from pathlib import PurePath
 from typing import Any
@@ -32,6 +40,9 @@ class YCrc32(YChecksum):
         return zlib.crc32(data) & 0xFFFFFFFF
 
 class YMurmurHash2(YChecksum):
+    # number of 32 bits words mixed at once
+    BLOCK = 1 << 20
+
     def compute_hash(self : YMurmurHash2, data : bytes) -> int:
         # Implementation of MurmurHash2 (32-bit)
         seed = 0
@@ -41,19 +52,16 @@ class YMurmurHash2(YChecksum):
         r = 24;
         h = (seed ^ data_length) & 0xFFFFFFFF
         
-        index = 0
-        while data_length >= 4:
-            k = struct.unpack_from('<I', data, index)[0]
-            
-            k = (k * m) & 0xFFFFFFFF
-            k = (k ^ (k >> r)) & 0xFFFFFFFF
-            k = (k * m) & 0xFFFFFFFF
-            
-            h = (h * m) & 0xFFFFFFFF
-            h = (h ^ k) & 0xFFFFFFFF
-            
-            index += 4
-            data_length -= 4
+        index = data_length & ~3
+        for start in range(0, index, self.BLOCK * 4):
+            words = self.mix_words(data[start:min(index, start + self.BLOCK * 4)], m, r)
+            # only the lower 32 bits matter, so h is masked every two words
+            it = iter(words)
+            for k0, k1 in zip(it, it):
+                h = ((h * m ^ k0) * m ^ k1) & 0xFFFFFFFF
+            if len(words) % 2 == 1:
+                h = ((h * m) & 0xFFFFFFFF) ^ words[-1]
+        data_length -= index
         
         # tail
         if data_length == 3:
@@ -74,6 +82,30 @@ class YMurmurHash2(YChecksum):
 
         return h
 
+    # Mix all the 32 bits words of data (k * m, k ^ k >> r, k * m) at once
+    # The words are put in 64 bits lanes of a single big integer, the products can't overflow into the next lane
+    def mix_words(self : YMurmurHash2, data : bytes, m : int, r : int) -> array:
+        words : array = array('I')
+        words.frombytes(data)
+        if sys.byteorder != "little":
+            words.byteswap()
+        count : int = len(words)
+        mask : int = int.from_bytes(array('Q', [0xFFFFFFFF]) * count, sys.byteorder)
+        lanes : int = int.from_bytes(array('Q', words), sys.byteorder)
+        lanes = (lanes * m) & mask
+        lanes ^= (lanes >> r) & mask
+        lanes = (lanes * m) & mask
+        result : array = array('Q')
+        result.frombytes(lanes.to_bytes(count * 8, sys.byteorder))
+        return result
+
+# Compute the MurmurHash2 of a part of an archive
+# Used by the worker processes, as the pure python implementation doesn't release the GIL
+def murmur_hash_part(path : str, offset : int, size : int) -> int:
+    with open(path, mode="rb") as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        with view[offset:offset+size] as data:
+            return YMurmurHash2().compute_hash(data)
+
 # ##########################################################
 # YPFEntry describes a file Entry
 # ##########################################################
@@ -225,6 +257,38 @@ class YPFHeader:
         if calc != checksum:
             raise Exception("[YPF] Invalid Data Checksum / Corrupted Data")
 
+    def validate_data(self : YPFHeader, data : bytes, checksum : int) -> None:
+        if self.data_checksum.compute_hash(data) != checksum:
+            raise Exception("[YPF] Invalid Data Checksum / Corrupted Data")
+
+    # Return the content of an entry from the archive data, validated (unless skip_checksum is True) and decompressed
+    def read_entry(self : YPFHeader, view : memoryview, entry : YPFEntry, skip_checksum : bool) -> bytes:
+        with view[entry.offset:entry.offset+entry.compressed_file_size] as data: # released right away, so the archive can be closed
+            if len(data) != entry.compressed_file_size:
+                raise Exception("[YPF] Invalid file offset or size")
+            # Validate the file
+            if not skip_checksum:
+                self.validate_data(data, entry.data_checksum)
+            # Decompress
+            if not entry.is_compressed:
+                return bytes(data)
+            content : bytes = zlib.decompress(data)
+        # Verify size
+        if len(content) != entry.raw_file_size:
+            raise Exception("[YPF] Invalid decompressed file size")
+        return content
+
+    # Yield the contents of the entries, in order, read by the given executor
+    # Only up to window entries are in flight at once, to bound the memory used by the decompressed files
+    def read_entries(self : YPFHeader, executor : ThreadPoolExecutor, view : memoryview, entries : list[YPFEntry], skip_checksum : bool, window : int) -> Iterator[bytes]:
+        pending : deque[Future] = deque()
+        for entry in entries:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(self.read_entry, view, entry, skip_checksum))
+        while len(pending) > 0:
+            yield pending.popleft().result()
+
     def find_duplicate_entry(self : YPFHeader, file_checksum: int, file_size: int) -> YPFEntry|None:
         for e in self.archived_files:
             if e.data_checksum == file_checksum and e.raw_file_size == file_size:
@@ -237,13 +301,20 @@ class YPFHeader:
 # ##########################################################
 class YPF(Plugin):
     SIGNATURE = b'YPF\0'
+    SUFFIXES : tuple[str, ...] = ()
+    EXTRACT_SUFFIXES : tuple[str, ...] = (".ypf",)
 
     def __init__(self : YPF):
         super().__init__()
         self.name : str = "YPF"
-        self.description : str = " v1.4\nExtract content from YPF files"
+        self.description : str = " v1.5\nExtract content from YPF files"
         self.related_tool_plugins : list[str] = [self.name]
 
+    def get_setting_infos(self : YPF) -> dict[str, list]:
+        return {
+            "ypf_skip_checksum": ["Skip the file checksums when extracting YPF archives (Only for trusted archives)", "bool", False, None]
+        }
+
     def extract(
         self : YPF,
         update_file_dict : dict[str, Any],
@@ -251,61 +322,75 @@ class YPF(Plugin):
         target_dir : PurePath,
         backup_path : PurePath
     ) -> bool:
-        if full_path.suffix.lower() != ".ypf":
+        if full_path.suffix.lower() not in self.EXTRACT_SUFFIXES:
             return False
         try:
             ybn_keys : dict[str, int] = {}
             ybn_msgs : dict[int, int] = {}
             ybn_calls : dict[int, int] = {}
             archive_name : str = full_path.stem
-            with open(full_path, mode="rb") as stream:
+            skip_checksum : bool = self.settings.get("ypf_skip_checksum", False)
+            with open(full_path, mode="rb") as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
                 # Extract the header
                 ypfh = YPFHeader(stream)
-                # Go through the files
-                for entry in ypfh.archived_files:
-                    file_path : PurePath = target_dir / archive_name / entry.file_name
-                    if file_path.suffix.lower() not in (".ybn",):
-                        continue
-                    # Validate the file
-                    ypfh.validate_data_integrity(stream, entry.offset, entry.compressed_file_size, entry.data_checksum)
-                    # Read it
-                    stream.seek(entry.offset)
-                    data = stream.read(entry.compressed_file_size)
-                    # Decompress
-                    if entry.is_compressed:
-                        data = zlib.decompress(data)
-                        # Verify size
-                        if len(data) != entry.raw_file_size:
-                            raise Exception("[YPF] Invalid decompressed file size")
-                    # create directory if not found
-                    if not os.path.isdir(file_path.parent):
-                        try:
-                            # create dir if needed
-                            os.makedirs(file_path.parent.as_posix(), exist_ok=True)
-                        except Exception as e:
-                            self.owner.log.error("[YPF] Couldn't create the following folder:" + file_path.parent.as_posix() + "\n" + self.trbk(e))
-                    # write file
-                    with open(file_path, mode="wb") as out:
-                        out.write(data)
-                    for p in self.owner.plugins.values():
-                        if p.match(file_path.name, False):
-                            # add to update_file_dict
-                            update_file_dict[(file_path.relative_to(backup_path)).as_posix()] = {
-                                "file_type":FileType.NORMAL,
-                                "ignored":IntBool.FALSE,
-                                "strings":0,
-                                "translated":0,
-                                "disabled_strings":0
-                            }
-                            # retrieve data to help with parsing later
-                            if p.name == "YBN":
-                                key, msg_op, call_op = p.get_codes(data, file_path)
-                                if key is not None:
-                                    ybn_keys[key] = ybn_keys.get(key, 0) + 1
-                                    if msg_op != 0:
-                                        ybn_msgs[msg_op] = ybn_msgs.get(msg_op, 0) + 1
-                                    if call_op != 0:
-                                        ybn_calls[call_op] = ybn_calls.get(call_op, 0) + 1
+                entries : list[YPFEntry] = [entry for entry in ypfh.archived_files if entry.file_name.suffix.lower() in (".ybn",)]
+                workers : int = self.owner.get_worker_count(len(entries))
+                if not skip_checksum and workers > 1 and isinstance(ypfh.data_checksum, YMurmurHash2):
+                    # Validate the files in worker processes beforehand
+                    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                        checksums = pool.map(
+                            murmur_hash_part,
+                            repeat(str(full_path)),
+                            [entry.offset for entry in entries],
+                            [entry.compressed_file_size for entry in entries],
+                            chunksize=max(1, len(entries) // (workers * 8))
+                        )
+                        for entry, checksum in zip(entries, checksums):
+                            if checksum != entry.data_checksum:
+                                raise Exception("[YPF] Invalid Data Checksum / Corrupted Data")
+                    skip_checksum = True
+                # Validate and decompress the files
+                # using threads, as zlib releases the GIL
+                executor : ThreadPoolExecutor|None = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rpgmtl_ypf") if workers > 1 else None
+                try:
+                    if executor is None:
+                        contents = (ypfh.read_entry(view, entry, skip_checksum) for entry in entries)
+                    else:
+                        contents = ypfh.read_entries(executor, view, entries, skip_checksum, workers * 2)
+                    for entry, data in zip(entries, contents):
+                        file_path : PurePath = target_dir / archive_name / entry.file_name
+                        # create directory if not found
+                        if not os.path.isdir(file_path.parent):
+                            try:
+                                # create dir if needed
+                                os.makedirs(file_path.parent.as_posix(), exist_ok=True)
+                            except Exception as e:
+                                self.owner.log.error("[YPF] Couldn't create the following folder:" + file_path.parent.as_posix() + "\n" + self.owner.trbk(e))
+                        # write file
+                        with open(file_path, mode="wb") as out:
+                            out.write(data)
+                        for p in self.owner.get_file_plugins(file_path.name):
+                            if p.match(file_path.name, False):
+                                # add to update_file_dict
+                                update_file_dict[(file_path.relative_to(backup_path)).as_posix()] = {
+                                    "file_type":FileType.NORMAL,
+                                    "ignored":IntBool.FALSE,
+                                    "strings":0,
+                                    "translated":0,
+                                    "disabled_strings":0
+                                }
+                                # retrieve data to help with parsing later
+                                if p.name == "YBN":
+                                    key, msg_op, call_op = p.get_codes(data, file_path)
+                                    if key is not None:
+                                        ybn_keys[key] = ybn_keys.get(key, 0) + 1
+                                        if msg_op != 0:
+                                            ybn_msgs[msg_op] = ybn_msgs.get(msg_op, 0) + 1
+                                        if call_op != 0:
+                                            ybn_calls[call_op] = ybn_calls.get(call_op, 0) + 1
+                finally:
+                    if executor is not None:
+                        executor.shutdown(cancel_futures=True)
                 # we take note of most commonly used key, msg_opcode and call_opcode in a separate, commong json file
                 if "YBN" in self.owner.plugins:
                     with open(target_dir / archive_name / "ypf.json", mode="w", encoding="utf-8") as f:
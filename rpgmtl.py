@@ -1,9 +1,11 @@
 from __future__ import annotations
 import asyncio
 from aiohttp import web, ClientSession
-from typing import Any
+from typing import Any, Callable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 import os
+import sys
 import re
 import shutil
 import copy
@@ -20,6 +22,15 @@ import ssl
 import hashlib
 from hmac import compare_digest
 import secrets
+import threading
+import time
+import bisect
+import struct
+import mmap
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat, islice
+import multiprocessing
 
 import plugins
 from plugins import BasePlugin, TranslatorPlugin, FileType, GloIndex, LocIndex, IntBool
@@ -59,6 +70,350 @@ class PatcherHelper():
     def from_json(self : PatcherHelper, s : Any, *, encoding : str = 'utf-8', ensure_ascii : bool = False, indent : None|int = None, separators : None|tuple[str, str] = None) -> None:
         self._content_ = json.dumps(s, ensure_ascii=ensure_ascii, separators=separators, indent=indent).encode(encoding)
 
+######################################################
+# Background task system
+######################################################
+# Raised inside a task when its cancellation has been requested
+class JobCancelled(Exception):
+    pass
+
+@dataclass(slots=True)
+class Job():
+    id : str
+    name : str # project name
+    kind : str # task type (extract, release...)
+    status : str # pending, running, done, error or cancelled
+    progress : list[int] # current step and total steps
+    result : Any # value returned by the task
+    message : str # error message
+    created : float
+    cancel_requested : bool
+    task : asyncio.Task|None
+
+    def __init__(self : Job, id : str, name : str, kind : str) -> None:
+        self.id = id
+        self.name = name
+        self.kind = kind
+        self.status = "pending"
+        self.progress = [0, 0]
+        self.result = None
+        self.message = ""
+        self.created = time.time()
+        self.cancel_requested = False
+        self.task = None
+
+    def done(self : Job) -> bool:
+        return self.status in ("done", "error", "cancelled")
+
+    # Data sent to the client
+    def info(self : Job) -> dict[str, Any]:
+        return {
+            "id":self.id,
+            "name":self.name,
+            "type":self.kind,
+            "status":self.status,
+            "progress":self.progress,
+            "message":self.message,
+            "created":self.created
+        }
+
+######################################################
+# Search index
+######################################################
+# Strings joined in a single text, to search them with str.find
+class SearchText():
+    SEPARATOR = "\x00"
+
+    def __init__(self : SearchText, keys : list[str], texts : list[str]) -> None:
+        self.keys : list[str] = keys # key of each string
+        self.offsets : list[int] = [] # position of each string in the text
+        pos : int = 1
+        for t in texts:
+            self.offsets.append(pos)
+            pos += len(t) + 1
+        self.text : str = self.SEPARATOR + self.SEPARATOR.join(texts) + self.SEPARATOR
+
+    # yield the key of the strings containing or equal to the search
+    def find(self : SearchText, search : str, contains : bool) -> Iterator[str]:
+        if contains and search == "": # every string contains it, and it would match the leading separator
+            yield from self.keys
+            return
+        if not contains:
+            search = self.SEPARATOR + search + self.SEPARATOR
+        shift : int = 0 if contains else 1 # exact matches start on the separator
+        i : int = self.text.find(search)
+        while i != -1:
+            n : int = bisect.bisect_right(self.offsets, i + shift) - 1
+            yield self.keys[n]
+            if n + 1 >= len(self.offsets):
+                break
+            i = self.text.find(search, self.offsets[n + 1] - shift) # continue from the next string
+
+# Index of the originals, global translations and local translations of a project
+# Modified strings and files are searched separately until there are too many of them
+class SearchIndex():
+    REBUILD_THRESHOLD = 1000 # minimum number of modified strings or files before rebuilding the texts
+
+    def __init__(self : SearchIndex, strings : dict[str, Any]) -> None:
+        self.strings : dict[str, Any] = strings # reference to the project strings.json
+        self.texts : dict[int, tuple[SearchText, SearchText]] = {} # originals or translations : lowercase and case sensitive texts
+        self.local_texts : tuple[SearchText, SearchText]|None = None # local translations : lowercase and case sensitive texts
+        self.dirty_strings : set[str] = set() # string ids modified since the texts were built
+        self.dirty_files : set[str] = set() # files modified since the texts were built
+        self.occurences : dict[str, set[str]] = {} # string id : files containing it
+        self.linked_occurences : dict[str, set[str]] = {} # string id : files containing it, not unlinked
+        self.file_ids : dict[str, tuple[set[str], set[str]]] = {} # file : string ids, linked string ids
+        self.build_strings()
+        self.build_files()
+        for f in strings["files"]:
+            self.update_file(f)
+        self.dirty_files.clear()
+
+    def build_strings(self : SearchIndex) -> None:
+        for i in (GloIndex.ORI, GloIndex.TL):
+            keys : list[str] = [sid for sid, s in self.strings["strings"].items() if s[i] is not None]
+            texts : list[str] = [self.strings["strings"][sid][i] for sid in keys]
+            self.texts[i] = (SearchText(keys, [t.lower() for t in texts]), SearchText(keys, texts))
+        self.dirty_strings.clear()
+
+    def build_files(self : SearchIndex) -> None:
+        keys : list[str] = []
+        texts : list[str] = []
+        for f, groups in self.strings["files"].items():
+            for group in groups:
+                for i in range(1, len(group)):
+                    if group[i][LocIndex.LOCAL] and group[i][LocIndex.TL] is not None:
+                        keys.append(f)
+                        texts.append(group[i][LocIndex.TL])
+        self.local_texts = (SearchText(keys, [t.lower() for t in texts]), SearchText(keys, texts))
+        self.dirty_files.clear()
+
+    # flag the given string id as modified
+    def update_string(self : SearchIndex, sid : str) -> None:
+        self.dirty_strings.add(sid)
+
+    # update the occurences of the given file and flag it as modified
+    def update_file(self : SearchIndex, f : str) -> None:
+        self.dirty_files.add(f)
+        # remove the previous state
+        ids, linked_ids = self.file_ids.pop(f, (set(), set()))
+        for sid in ids:
+            self.occurences[sid].discard(f)
+        for sid in linked_ids:
+            self.linked_occurences[sid].discard(f)
+        if f not in self.strings["files"]:
+            return
+        # and add the current one
+        ids = set()
+        linked_ids = set()
+        for group in self.strings["files"][f]:
+            for i in range(1, len(group)):
+                ids.add(group[i][LocIndex.ID])
+                if not group[i][LocIndex.LOCAL]:
+                    linked_ids.add(group[i][LocIndex.ID])
+        self.file_ids[f] = (ids, linked_ids)
+        for sid in ids:
+            try:
+                self.occurences[sid].add(f)
+            except KeyError:
+                self.occurences[sid] = {f}
+        for sid in linked_ids:
+            try:
+                self.linked_occurences[sid].add(f)
+            except KeyError:
+                self.linked_occurences[sid] = {f}
+
+    # return the files with strings matching the search
+    # return None if the search can't be done with the index
+    def search(self : SearchIndex, search : str, useorigin : bool, case : bool, contains : bool) -> set[str]|None:
+        if SearchText.SEPARATOR in search:
+            return None
+        if len(self.dirty_strings) > max(self.REBUILD_THRESHOLD, len(self.strings["strings"]) // 100):
+            self.build_strings()
+        if len(self.dirty_files) > max(self.REBUILD_THRESHOLD, len(self.strings["files"]) // 100):
+            self.build_files()
+        lsearch : str = search.lower() if not case else search
+        # matching function, for modified strings
+        if contains:
+            match : Callable = lambda text: lsearch in (text if case else text.lower())
+        else:
+            match : Callable = lambda text: lsearch == (text if case else text.lower())
+        variant : int = 1 if case else 0
+        files : set[str] = set()
+        for i, occurences in ((GloIndex.ORI, self.occurences), (GloIndex.TL, self.linked_occurences)):
+            if i == GloIndex.ORI and not useorigin:
+                continue
+            matches : set[str] = {sid for sid in self.texts[i][variant].find(lsearch, contains) if sid not in self.dirty_strings}
+            for sid in self.dirty_strings:
+                s : list|None = self.strings["strings"].get(sid, None)
+                if s is not None and s[i] is not None and match(s[i]):
+                    matches.add(sid)
+            for sid in matches:
+                files.update(occurences.get(sid, ()))
+        for f in self.local_texts[variant].find(lsearch, contains):
+            if f not in self.dirty_files:
+                files.add(f)
+        for f in self.dirty_files:
+            if f not in files and f in self.strings["files"]:
+                for group in self.strings["files"][f]:
+                    if any(group[i][LocIndex.LOCAL] and group[i][LocIndex.TL] is not None and match(group[i][LocIndex.TL]) for i in range(1, len(group))):
+                        files.add(f)
+                        break
+        return files
+
+######################################################
+# Compact strings format
+######################################################
+# Binary alternative to strings.json, see dump_compact_strings and load_compact_strings
+# Every string is stored once in a pool, and the lists are stored as columns of pool indexes and packed flags
+# Layout (little endian):
+# magic, header JSON (top level keys, without the content of strings and files)
+# pool: count, lengths in characters (array I), UTF-8 text
+# strings: id, original, translation (array I), count (array I), color (array B)
+# files: path, group count (array I)
+# groups: name, entry count (array I)
+# entries: id, translation (array I), LOCAL | IGNORED << 1 | MODIFIED << 2 (array B)
+COMPACT_MAGIC : bytes = b"RPGMTLC1"
+COMPACT_NONE : int = 0xFFFFFFFF # pool index of None translations
+
+def _compact_write_array(f : Any, a : array) -> None:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a)
+        a.byteswap()
+    f.write(struct.pack("<I", len(a)))
+    f.write(a.tobytes())
+
+def _compact_read_array(view : memoryview, offset : int, typecode : str) -> tuple[array, int]:
+    count : int = struct.unpack_from("<I", view, offset)[0]
+    offset += 4
+    a : array = array(typecode)
+    size : int = count * a.itemsize
+    if offset + size > len(view):
+        raise ValueError("Truncated compact strings file")
+    a.frombytes(view[offset:offset+size])
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a, offset + size
+
+# Write the strings.json data to the file object f, in the compact format
+# Raise a ValueError if the data contains something this format can't store losslessly
+def dump_compact_strings(strings : dict[str, Any], f : Any) -> None:
+    pool : dict[str, int] = {}
+    def index(s : str|None) -> int:
+        if s is None:
+            return COMPACT_NONE
+        elif type(s) is not str:
+            raise ValueError(f"Unexpected value {s!r} instead of a string")
+        i : int|None = pool.get(s, None)
+        if i is None:
+            i = pool[s] = len(pool)
+        return i
+    def integer(v : Any, limit : int) -> int:
+        if not isinstance(v, int) or isinstance(v, bool) or v < 0 or v > limit:
+            raise ValueError(f"Unexpected value {v!r} instead of an integer")
+        return int(v)
+    header : dict[str, Any] = {k : (None if k in ("strings", "files") else v) for k, v in strings.items()} # keep the key order
+    g_columns : list[array] = [array('I') for i in range(4)] + [array('B')]
+    for sid, entry in strings["strings"].items():
+        if not isinstance(entry, list) or len(entry) != 4:
+            raise ValueError(f"Unexpected string entry {sid!r}")
+        if entry[GloIndex.ORI] is None:
+            raise ValueError(f"Unexpected original string for {sid!r}")
+        g_columns[0].append(index(sid))
+        g_columns[1].append(index(entry[GloIndex.ORI]))
+        g_columns[2].append(index(entry[GloIndex.TL]))
+        g_columns[3].append(integer(entry[GloIndex.COUNT], 0xFFFFFFFF))
+        g_columns[4].append(integer(entry[GloIndex.COLOR], 0xFF))
+    f_columns : list[array] = [array('I'), array('I')]
+    gr_columns : list[array] = [array('I'), array('I')]
+    e_columns : list[array] = [array('I'), array('I'), array('B')]
+    for path, groups in strings["files"].items():
+        f_columns[0].append(index(path))
+        f_columns[1].append(len(groups))
+        for group in groups:
+            if not isinstance(group, list) or len(group) == 0 or group[0] is None:
+                raise ValueError(f"Unexpected group in file {path!r}")
+            gr_columns[0].append(index(group[0]))
+            gr_columns[1].append(len(group) - 1)
+            for i in range(1, len(group)):
+                entry = group[i]
+                if not isinstance(entry, list) or len(entry) != 5 or entry[LocIndex.ID] is None:
+                    raise ValueError(f"Unexpected string entry in file {path!r}")
+                e_columns[0].append(index(entry[LocIndex.ID]))
+                e_columns[1].append(index(entry[LocIndex.TL]))
+                e_columns[2].append(
+                    integer(entry[LocIndex.LOCAL], 1)
+                    | (integer(entry[LocIndex.IGNORED], 1) << 1)
+                    | (integer(entry[LocIndex.MODIFIED], 1) << 2)
+                )
+    if len(pool) >= COMPACT_NONE:
+        raise ValueError("Too many strings")
+    f.write(COMPACT_MAGIC)
+    data : bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    f.write(struct.pack("<I", len(data)))
+    f.write(data)
+    _compact_write_array(f, array('I', map(len, pool)))
+    data = "".join(pool).encode('utf-8', 'surrogatepass') # surrogates can come from JSON escapes
+    del pool
+    f.write(struct.pack("<Q", len(data)))
+    f.write(data)
+    del data
+    for a in g_columns + f_columns + gr_columns + e_columns:
+        _compact_write_array(f, a)
+
+# Read the compact format from a bytes-like object and return the same data as strings.json
+# Identical strings are shared between the entries
+def load_compact_strings(buffer : Any) -> dict[str, Any]:
+    with memoryview(buffer) as view:
+        if view[:len(COMPACT_MAGIC)] != COMPACT_MAGIC:
+            raise ValueError("Not a compact strings file")
+        offset : int = len(COMPACT_MAGIC)
+        size : int = struct.unpack_from("<I", view, offset)[0]
+        offset += 4
+        strings : dict[str, Any] = json.loads(str(view[offset:offset+size], 'utf-8'))
+        offset += size
+        lengths, offset = _compact_read_array(view, offset, 'I')
+        size = struct.unpack_from("<Q", view, offset)[0]
+        offset += 8
+        text : str = str(view[offset:offset+size], 'utf-8', 'surrogatepass')
+        offset += size
+        columns : list[array] = []
+        for typecode in "IIIIBIIIIIIB":
+            a, offset = _compact_read_array(view, offset, typecode)
+            columns.append(a)
+    pool : list[str|None] = []
+    start : int = 0
+    for length in lengths:
+        pool.append(text[start:start+length])
+        start += length
+    del text
+    def get(i : int) -> str|None:
+        return None if i == COMPACT_NONE else pool[i]
+    g_key, g_ori, g_tl, g_count, g_color, f_path, f_size, gr_name, gr_size, e_id, e_tl, e_flags = columns
+    strings["strings"] = {
+        pool[k] : [pool[o], get(t), c, col]
+        for k, o, t, c, col in zip(g_key, g_ori, g_tl, g_count, g_color)
+    }
+    files : dict[str, list] = {}
+    group_it : Iterator = zip(gr_name, gr_size)
+    entry_it : Iterator = zip(e_id, e_tl, e_flags)
+    for path, count in zip(f_path, f_size):
+        groups : list[list] = []
+        for group_name, size in islice(group_it, count):
+            group : list = [pool[group_name]]
+            for sid, tl, flags in islice(entry_it, size):
+                group.append([pool[sid], get(tl), flags & 1, (flags >> 1) & 1, (flags >> 2) & 1])
+            groups.append(group)
+        files[pool[path]] = groups
+    strings["files"] = files
+    return strings
+
+# Read a compact strings file, using a memory map to avoid an extra copy of its content
+def read_compact_strings(path : str) -> dict[str, Any]:
+    with open(path, mode='rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return load_compact_strings(m)
+
 ######################################################
 # The Main class
 ######################################################
@@ -68,6 +423,10 @@ class RPGMTL():
     CHILDREN_FILE_ID = "@__children_file__@:"
     HISTORY_LIMIT = 10
     CURRENT_STRING_VERSION = 2
+    JOURNAL_LIMIT = 200 # number of strings.journal records before strings.json is fully rewritten
+    JOB_HISTORY_LIMIT = 30 # number of finished tasks kept in memory
+    STRING_CHANGES_LIMIT = 1000 # number of string modifications kept to send only the modified strings to clients
+    PARALLEL_MIN_FILES = 20 # minimum number of files to use worker processes
 
     def __init__(self : RPGMTL) -> None:
         # Setting up logging
@@ -93,7 +452,21 @@ class RPGMTL():
         self.projects : dict[str, Any] = {} # store loaded config.json
         self.strings : dict[str, Any] = {} # store loaded string.json
         self.modified : dict[str, bool] = {} # store flag indicating if config.json or string.json has pending changes waiting to be saved
+        self.journal : dict[str, tuple[set[str], set[str]]] = {} # store string ids and files with pending changes, to be appended to strings.journal (see mark_modified)
+        self.journal_count : dict[str, int] = {} # store the number of records in strings.journal
+        self.search_indexes : dict[str, SearchIndex] = {} # store search indexes, built on the first search
+        self.occurences : dict[str, tuple[dict, dict[str, list[tuple[str, int, int]]]]] = {} # store the occurences of each string id (see get_occurences)
+        self.string_changes : dict[str, tuple[str, list[set[str]]]] = {} # store a version prefix and the modified string ids of each edit (see get_file_data)
         self.computing : dict[str, asyncio.Task] = {} # store state for compute_translated
+        self.computing_checks : dict[str, bool] = {} # store if the pending compute_translated must check the current counts
+        self.translated_strings : dict[str, dict[str, bool]] = {} # store which global strings are translated, as counted in config.json (see update_translated)
+        self.jobs : dict[str, Job] = {} # store background tasks, per id
+        self.project_locks : dict[str, asyncio.Lock] = {} # held while a background task is running on the project
+        # Note: Plugins keep a per-file state (settings, reset...), hence the single worker
+        self.executor : ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rpgmtl_job")
+        self.job_local : threading.local = threading.local() # store the Job running in the current worker thread
+        self.save_lock : threading.Lock = threading.Lock() # save() can be called from the event loop and the worker
+        self.loop : asyncio.AbstractEventLoop|None = None
         self.setting_key_set : set[str] = set(["rpgmtl_current_translator", "rpgmtl_current_batch_translator"]) # store existing setting keys
         self.action_key_set : set[str] = set() # store existing action keys
         self.tool_key_set : set[str] = set() # store existing tool keys
@@ -115,6 +488,8 @@ class RPGMTL():
         # loaded plugins
         self.plugins : dict[str, plugins.Plugin] = {}
         self.translators : dict[str, plugins.TranslatorPlugin] = {}
+        self.plugin_index : dict[tuple[str, bool], list[plugins.Plugin]] = {} # candidate plugins per file suffix (see get_file_plugins)
+        self.plugin_code_fingerprint : str|None = None # hash of the file plugins source code (see get_plugin_code_fingerprint)
         # load settings.json
         self.load_settings()
         # parse arguments
@@ -142,6 +517,9 @@ class RPGMTL():
         # Autosave system
         app.on_startup.append(self.init_autosave)
         app.on_cleanup.append(self.stop_autosave)
+        # Background tasks
+        app.on_startup.append(self.init_jobs)
+        app.on_cleanup.append(self.stop_jobs)
         # HTTP Routes
         app.router.add_static('/assets/images', path='./assets/images', name='assets')
         app.router.add_static('/assets/plugins', path='./assets/plugins', name='plugins_assets')
@@ -176,6 +554,7 @@ class RPGMTL():
                 web.post('/api/import_rpgmtrans', self.import_rpgmtrans), # Import RPG Maker Trans data
                 web.post('/api/backups', self.backup_list), # Open list of strings.json backups
                 web.post('/api/load_backup', self.load_backup), # Load strings.json backup
+                web.post('/api/export_strings', self.export_strings), # Write an up to date strings.json
                 web.post('/api/browse', self.open_folder), # Browse Folders/Files
                 web.post('/api/ignore_file', self.ignore_file), # Toggle File ignore value
                 web.post('/api/file', self.open_file), # Open File
@@ -194,6 +573,9 @@ class RPGMTL():
                 web.post('/api/update_knowledge', self.update_knowledge), # update a knowledge base entry
                 web.post('/api/update_notes', self.update_notes), # update project notes
                 web.post('/api/update_icon', self.update_icon), # update project notes
+                web.post('/api/jobs', self.job_list), # list background tasks
+                web.post('/api/job_status', self.job_status), # get a background task state
+                web.post('/api/cancel_job', self.cancel_job), # cancel a background task
         ])
         return app
 
@@ -278,6 +660,8 @@ class RPGMTL():
         self.process_infos(plugin)
         # Add and connect plugin
         self.plugins[plugin.name] = plugin
+        self.plugin_index.clear()
+        self.plugin_code_fingerprint = None
         plugin.connect(self)
         self.plugin_descriptions[plugin.name] = plugin.description
 
@@ -302,6 +686,51 @@ class RPGMTL():
     def get_plugin(self : RPGMTL, name : str) -> plugins.Plugin|None:
         return self.plugins.get(name, None)
 
+    # Return the plugins which might match the given file (or extract it, if for_extract is True), in the loading order
+    # Plugins are selected using their SUFFIXES (or EXTRACT_SUFFIXES), their match (or extract) function must still be called
+    # Plugins without declared suffixes are always returned, unless they don't reimplement match (or extract)
+    def get_file_plugins(self : RPGMTL, file_path : str, for_extract : bool = False) -> list[plugins.Plugin]:
+        i : int = file_path.rfind('.')
+        suffix : str = file_path[i:].lower() if i != -1 and '/' not in file_path[i:] else ""
+        key : tuple[str, bool] = (suffix, for_extract)
+        if key not in self.plugin_index:
+            candidates : list[plugins.Plugin] = []
+            for p in self.plugins.values():
+                if for_extract:
+                    suffixes = p.EXTRACT_SUFFIXES
+                    implemented : bool = type(p).extract is not plugins.Plugin.extract
+                else:
+                    suffixes = p.SUFFIXES
+                    implemented : bool = type(p).match is not plugins.Plugin.match
+                if implemented and (suffixes is None or suffix in suffixes):
+                    candidates.append(p)
+            self.plugin_index[key] = candidates
+        return self.plugin_index[key]
+
+    # return a hash of the source code of the file plugins and of the plugins package
+    # used in fingerprints, so the files are extracted and patched again when a plugin is updated
+    # all the plugins are covered, as archive plugins pass their content to other plugins
+    def get_plugin_code_fingerprint(self : RPGMTL) -> str:
+        if self.plugin_code_fingerprint is None:
+            h = hashlib.sha256()
+            for module in sorted({type(p).__module__ for p in self.plugins.values()} | {plugins.__name__}):
+                h.update(module.encode("utf-8"))
+                try:
+                    with open(sys.modules[module].__file__, mode="rb") as f:
+                        h.update(hashlib.file_digest(f, "sha256").digest())
+                except Exception as e:
+                    self.log.warning(f"Couldn't read the source of module {module}, its updates won't be detected\n{self.trbk(e)}")
+            self.plugin_code_fingerprint = h.hexdigest()
+        return self.plugin_code_fingerprint
+
+    # return the settings declared by the given plugins (or all the file plugins) as a string, to be used in fingerprints
+    # the other settings (translators, UI...) don't change how the game files are read or patched
+    def get_file_settings_fingerprint(self : RPGMTL, settings : dict[str, Any], plugin_list : Iterable[plugins.Plugin]|None = None) -> str:
+        keys : set[str] = set()
+        for p in (self.plugins.values() if plugin_list is None else plugin_list):
+            keys.update(p.get_setting_infos().keys())
+        return json.dumps({k : settings.get(k, None) for k in sorted(keys)}, ensure_ascii=False)
+
     # return a tuple of the Translator-in-use name and instance
     # name is the project name (to check a specific project setting)
     def get_current_translator(self : RPGMTL, name : str|None) -> tuple[str, plugins.TranslatorPlugin|None, str, plugins.TranslatorPlugin|None]:
@@ -353,9 +782,25 @@ class RPGMTL():
             self.log.warning("Failed to load settings.json, default value will be used:\n" + self.trbk(e))
 
     # Save config.json, strings.json and load_settings.json
-    def save(self : RPGMTL) -> None:
-        for k, v in self.modified.items(): # check modified flags
-            if v: # if raised
+    # If only known strings have been modified (see mark_modified), they're appended to strings.journal instead of rewriting strings.json
+    # If skip_busy is True, projects with a running background task are left for later
+    # If name is set, only this project is saved, and settings.json is left for later
+    # When called from a background task, only the project of the task is saved, as the event loop might be editing the other ones
+    def save(self : RPGMTL, skip_busy : bool = False, name : str|None = None) -> None:
+        if name is None:
+            job : Job|None = getattr(self.job_local, "job", None)
+            if job is not None:
+                name = job.name
+        with self.save_lock:
+            self._save(skip_busy, name)
+
+    def _save(self : RPGMTL, skip_busy : bool, name : str|None) -> None:
+        for k in ([name] if name is not None else list(self.modified.keys() | self.journal.keys())): # check modified flags and pending journal changes
+            if skip_busy and self.is_busy(k):
+                continue
+            full : bool = self.modified.get(k, False)
+            pending : tuple[set[str], set[str]]|None = self.journal.pop(k, None)
+            if full or pending is not None: # if raised
                 folder = f"projects/{k}/"
                 err_flag : bool = False
                 self.log.info(f"Saving projects '{k}' files...")
@@ -371,19 +816,21 @@ class RPGMTL():
                 try:
                     if k in self.strings: # if strings.json is loaded
                         # also save it
-                        with open(folder + "_tmp_strings_.json", mode='w', encoding='utf-8') as f:
-                            f.write(self.serialize_format_json(self.strings[k]))
-                        # move file to actual name
-                        shutil.move(folder + "_tmp_strings_.json", folder + "strings.json")
+                        if full or self.journal_count.get(k, 0) >= self.JOURNAL_LIMIT:
+                            self.write_strings(k)
+                        else:
+                            self.write_journal(k, pending)
                 except Exception as e:
                     err_flag = True
                     self.log.error(f"Failed to update projects/{k}/strings.json:\n{self.trbk(e)}")
-                self.modified[k] = False # reset it
+                # reset it, unless something failed
+                # a full rewrite will then be done on the next save, as the pending changes are lost and the journal might end with an incomplete record
+                self.modified[k] = err_flag
                 if err_flag:
                     self.log.info(f"Errors occured while saving project '{k}' files")
                 else:
                     self.log.info(f"Saved project '{k}' files")
-        if self.settings_modified: # write settings if flag is set
+        if name is None and self.settings_modified: # write settings if flag is set
             try:
                 with open('settings.json', mode='w', encoding='utf-8') as f:
                     json.dump({"version":2, "settings":self.settings, "history":self.history, "auth":self.auth}, f, ensure_ascii=False, indent=4, separators=(',', ':'))
@@ -391,6 +838,191 @@ class RPGMTL():
                 self.log.error("Failed to update settings.json:\n" + self.trbk(e))
             self.settings_modified = False
 
+    # Flag a project as modified, where the given string ids and files are the only strings.json changes
+    # On save, they will be appended to strings.journal instead of rewriting the whole strings.json
+    # Setting self.modified[name] to True is still required if the changes are unknown or too widespread
+    def mark_modified(self : RPGMTL, name : str, string_ids : Iterable[str] = (), files : Iterable[str] = ()) -> None:
+        string_ids = tuple(string_ids)
+        files = tuple(files)
+        if name not in self.journal:
+            self.journal[name] = (set(), set())
+        self.journal[name][0].update(string_ids)
+        self.journal[name][1].update(files)
+        self.update_search_index(name, string_ids, files)
+        self.record_string_changes(name, string_ids)
+        self.update_translated(name, string_ids, files)
+
+    # start a new version history for the strings of a project
+    # to be called when strings might have been modified without being recorded, clients will receive all the strings again
+    def reset_string_changes(self : RPGMTL, name : str) -> None:
+        self.string_changes[name] = (secrets.token_hex(4), [])
+
+    # record the given string ids as modified, in a new version
+    def record_string_changes(self : RPGMTL, name : str, string_ids : Iterable[str]) -> None:
+        string_ids = set(string_ids)
+        if len(string_ids) == 0:
+            return
+        if name not in self.string_changes or len(self.string_changes[name][1]) >= self.STRING_CHANGES_LIMIT:
+            self.reset_string_changes(name)
+        self.string_changes[name][1].append(string_ids)
+
+    # return the current version of the strings of a project
+    def get_strings_version(self : RPGMTL, name : str) -> str:
+        if name not in self.string_changes:
+            self.reset_string_changes(name)
+        return f"{self.string_changes[name][0]}-{len(self.string_changes[name][1])}"
+
+    # return the string ids modified since the given version
+    # return None if the version is unknown
+    def get_string_changes_since(self : RPGMTL, name : str, version : str|None) -> set[str]|None:
+        if version is None or name not in self.string_changes:
+            return None
+        prefix, changes = self.string_changes[name]
+        try:
+            p, n = version.split("-")
+            n = int(n)
+        except:
+            return None
+        if p != prefix or n < 0 or n > len(changes):
+            return None
+        modified : set[str] = set()
+        for c in changes[n:]:
+            modified.update(c)
+        return modified
+
+    # return the data sent along the content of a file: its groups and the global strings it uses
+    # if known_version is the strings version already known by the client, only the strings modified since are included
+    def get_file_data(self : RPGMTL, name : str, path : str, known_version : str|None = None) -> dict[str, Any]:
+        version : str = self.get_strings_version(name)
+        modified : set[str]|None = self.get_string_changes_since(name, known_version)
+        strings : dict[str, list] = self.strings[name]["strings"]
+        file_strings : dict[str, list] = {}
+        for group in self.strings[name]["files"][path]:
+            for i in range(1, len(group)):
+                sid : str = group[i][LocIndex.ID]
+                if modified is None or sid in modified:
+                    file_strings[sid] = strings[sid]
+        return {"config":self.projects[name], "name":name, "path":path, "strings":file_strings, "strings_delta":modified is not None, "strings_version":version, "list":self.strings[name]["files"][path]}
+
+    # return the search index of a project, built if needed
+    # return None if a task is running on the project, as the strings might be modified in the meantime
+    def get_search_index(self : RPGMTL, name : str) -> SearchIndex|None:
+        if self.is_busy(name):
+            return None
+        if name not in self.search_indexes:
+            start : float = time.time()
+            self.search_indexes[name] = SearchIndex(self.strings[name])
+            self.log.info(f"Search index of project {name} built in {time.time() - start:.2f}s")
+        return self.search_indexes[name]
+
+    # return the occurences of each string id of a project, as a list of (file, group index, string index)
+    # the files and groups of strings.json are only modified by a string extraction, which replaces the whole dictionary
+    # so the occurences are built again if the dictionary changed
+    def get_occurences(self : RPGMTL, name : str) -> dict[str, list[tuple[str, int, int]]]:
+        files : dict[str, Any] = self.strings[name]["files"]
+        if name not in self.occurences or self.occurences[name][0] is not files:
+            occurences : dict[str, list[tuple[str, int, int]]] = {}
+            for f, groups in files.items():
+                for g, group in enumerate(groups):
+                    for i in range(1, len(group)):
+                        try:
+                            occurences[group[i][LocIndex.ID]].append((f, g, i))
+                        except KeyError:
+                            occurences[group[i][LocIndex.ID]] = [(f, g, i)]
+            self.occurences[name] = (files, occurences)
+        return self.occurences[name][1]
+
+    # update the search index of a project, if it exists, for the given string ids and files
+    def update_search_index(self : RPGMTL, name : str, string_ids : Iterable[str] = (), files : Iterable[str] = ()) -> None:
+        if name in self.search_indexes:
+            for sid in string_ids:
+                self.search_indexes[name].update_string(sid)
+            for f in files:
+                self.search_indexes[name].update_file(f)
+
+    # Write the whole strings.json of a project and clear its journal
+    # If the compact format is enabled (see --compact), strings.bin is written instead
+    def write_strings(self : RPGMTL, name : str) -> None:
+        folder = f"projects/{name}/"
+        compact : bool = self.settings.get("compact_strings", False)
+        if compact:
+            try:
+                with open(folder + "_tmp_strings_.bin", mode='wb') as f:
+                    dump_compact_strings(self.strings[name], f)
+                # move file to actual name
+                shutil.move(folder + "_tmp_strings_.bin", folder + "strings.bin")
+            except ValueError as e:
+                self.log.warning(f"The strings of project {name} can't be stored in the compact format, strings.json will be used instead:\n{self.trbk(e)}")
+                compact = False
+        if not compact:
+            self.write_strings_json(self.strings[name], folder + "strings.json")
+        # remove the other format, strings.bin is always loaded first
+        other : str = folder + ("strings.json" if compact else "strings.bin")
+        if os.path.isfile(other):
+            os.remove(other)
+        # the journal is now merged in strings.json
+        if os.path.isfile(folder + "strings.journal"):
+            os.remove(folder + "strings.journal")
+        self.journal_count[name] = 0
+
+    # Append the given string ids and files to the strings.journal of a project
+    # Each line is a JSON object containing the current state of those strings and files
+    def write_journal(self : RPGMTL, name : str, pending : tuple[set[str], set[str]]) -> None:
+        if len(pending[0]) == 0 and len(pending[1]) == 0:
+            return
+        record : dict[str, dict] = {
+            "strings":{sid : self.strings[name]["strings"][sid] for sid in pending[0] if sid in self.strings[name]["strings"]},
+            "files":{f : self.strings[name]["files"][f] for f in pending[1] if f in self.strings[name]["files"]}
+        }
+        with open(f"projects/{name}/strings.journal", mode='a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+            f.write("\n")
+        self.journal_count[name] = self.journal_count.get(name, 0) + 1
+
+    # Write the given strings to a file, in the strings.json format
+    def write_strings_json(self : RPGMTL, strings : dict[str, Any], path : str) -> None:
+        folder = str(PurePath(path).parent) + "/"
+        with open(folder + "_tmp_strings_.json", mode='w', encoding='utf-8') as f:
+            f.write(self.serialize_format_json(strings))
+        # move file to actual name
+        shutil.move(folder + "_tmp_strings_.json", path)
+
+    # Apply the strings.journal records of a project to the given strings.json data
+    # Return the number of records applied
+    def read_journal(self : RPGMTL, name : str, strings : dict[str, Any]) -> int:
+        count : int = 0
+        try:
+            with open(f"projects/{name}/strings.journal", mode='r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except:
+                        # last record is likely incomplete, if the application was interrupted while writing it
+                        self.log.warning(f"Invalid record found in projects/{name}/strings.journal, the following records are ignored")
+                        break
+                    strings["strings"].update(record["strings"])
+                    strings["files"].update(record["files"])
+                    count += 1
+        except OSError:
+            pass
+        if count > 0:
+            self.log.info(f"Applied {count} records from projects/{name}/strings.journal")
+        return count
+
+    # Rewrite the whole strings.json of a loaded project, merging its journal
+    # Used to get an up to date human readable strings.json on demand
+    def compact_strings(self : RPGMTL, name : str) -> None:
+        if name not in self.strings:
+            return
+        # the pending journal changes are included in the rewrite
+        # but config.json must still be saved, as the counts and other file data might have changed with them
+        if self.journal.pop(name, None) is not None:
+            self.modified[name] = True
+        try:
+            self.write_strings(name)
+        except Exception as e:
+            self.log.error(f"Failed to update projects/{name}/strings.json:\n{self.trbk(e)}")
+
     # Utility recursive function to format strings.json in a certain way, to make it humanly readable and easy to pick apart by git
     def serialize_format_json(self : RPGMTL, d : Any, level : int = 0, parent_is_list : bool = False) -> str|list[str]:
         parts : list[str] = [] # using an array instead of a string to avoid needless string allocations
@@ -429,7 +1061,7 @@ class RPGMTL():
         while True:
             try:
                 await asyncio.sleep(300) # call save() every 300s
-                self.save()
+                self.save(skip_busy=True)
             except asyncio.CancelledError:
                 return
 
@@ -441,6 +1073,101 @@ class RPGMTL():
     async def stop_autosave(self : RPGMTL, app : web.Application) -> None:
         self.autosave_task.cancel()
 
+    # keep a reference to the event loop, for the worker thread
+    async def init_jobs(self : RPGMTL, app : web.Application) -> None:
+        self.loop = asyncio.get_running_loop()
+
+    # request the cancellation of all tasks
+    async def stop_jobs(self : RPGMTL, app : web.Application) -> None:
+        for job in self.jobs.values():
+            if not job.done():
+                job.cancel_requested = True
+
+    # return True if a background task is running on the given project
+    def is_busy(self : RPGMTL, name : str) -> bool:
+        return name in self.project_locks and self.project_locks[name].locked()
+
+    # create and start a background task
+    # func is called in the worker thread with the given arguments, its return value is stored in Job.result
+    def start_job(self : RPGMTL, name : str, kind : str, func : Callable, *args) -> Job:
+        job : Job = Job(secrets.token_hex(8), name, kind)
+        self.jobs[job.id] = job
+        job.task = asyncio.create_task(self._run_job(job, func, args))
+        # cleanup old tasks
+        finished : list[Job] = [j for j in self.jobs.values() if j.done()]
+        for j in finished[:max(0, len(finished) - self.JOB_HISTORY_LIMIT)]:
+            self.jobs.pop(j.id, None)
+        return job
+
+    async def _run_job(self : RPGMTL, job : Job, func : Callable, args : tuple) -> None:
+        if job.name not in self.project_locks:
+            self.project_locks[job.name] = asyncio.Lock()
+        async with self.project_locks[job.name]: # one task at a time per project
+            if job.cancel_requested:
+                job.status = "cancelled"
+                return
+            job.status = "running"
+            if job.kind != "release": # the task might modify the strings
+                self.search_indexes.pop(job.name, None)
+            self.log.info(f"Task {job.kind} ({job.id}) started for project {job.name}")
+            try:
+                job.result = await asyncio.get_running_loop().run_in_executor(self.executor, self._job_worker, job, func, args)
+                job.status = "done"
+                job.progress[0] = job.progress[1]
+                self.log.info(f"Task {job.kind} ({job.id}) completed for project {job.name}")
+            except JobCancelled:
+                job.status = "cancelled"
+                self.log.info(f"Task {job.kind} ({job.id}) has been cancelled for project {job.name}")
+            except Exception as e:
+                job.status = "error"
+                job.message = str(e)
+                self.log.error(f"Task {job.kind} ({job.id}) failed for project {job.name}\n{self.trbk(e)}")
+            finally:
+                if job.kind != "release": # the task might have modified the strings, even if it failed
+                    self.reset_string_changes(job.name)
+                    if job.name in self.strings:
+                        self.start_compute_translated(job.name, True) # and not have updated the counts
+
+    # run in the worker thread
+    def _job_worker(self : RPGMTL, job : Job, func : Callable, args : tuple) -> Any:
+        self.job_local.job = job
+        try:
+            return func(*args)
+        finally:
+            self.job_local.job = None
+
+    # to be called by long tasks to report their progress
+    # raise JobCancelled if the cancellation of the current task has been requested
+    # do nothing if not called from a background task
+    def job_step(self : RPGMTL, current : int, total : int) -> None:
+        job : Job|None = getattr(self.job_local, "job", None)
+        if job is not None:
+            job.progress = [current, total]
+            if job.cancel_requested:
+                raise JobCancelled()
+
+    # common response of the endpoints starting a background task
+    # if background is True, the response is sent immediately with the task data
+    # otherwise, it's sent once the task is over
+    async def job_response(self : RPGMTL, job : Job, background : bool, data : dict[str, Any]|None = None) -> web.Response:
+        if data is None:
+            data = {"name":job.name, "config":self.projects[job.name]}
+        if background:
+            return web.json_response({"result":"ok", "data":data | {"job":job.info()}, "message":"The task has been started"})
+        await asyncio.shield(job.task) # shield to not cancel the task if the client disconnects
+        if data.get("config", None) is not None:
+            data["config"] = self.projects.get(job.name, data["config"]) # the task might have replaced it
+        match job.status:
+            case "done":
+                if job.result is None or job.result == "":
+                    return web.json_response({"result":"ok", "data":data})
+                else:
+                    return web.json_response({"result":"ok", "data":data, "message":job.result})
+            case "cancelled":
+                return web.json_response({"result":"ok", "data":data, "message":"The task has been cancelled"})
+            case _:
+                return web.json_response({"result":"bad", "message":f"An unexpected error occured: {job.message}"})
+
     def load_ip_whitelist(self : RPGMTL) -> None:
         try:
             with open("whitelist.txt", mode="r", encoding="utf-8") as f:
@@ -488,53 +1215,174 @@ class RPGMTL():
             self.log.error(f"Error during selection of an executable for project {name}\n{self.trbk(e)}")
             return None
 
+    # load the manifest of the previous game files import
+    # return None if there is none, or if the originals folder must be fully rebuilt
+    def _backup_load_manifest(self : RPGMTL, pname : str) -> dict[str, Any]|None:
+        try:
+            if not os.path.isdir(PurePath("projects", pname, "originals")):
+                return None
+            with open(f"projects/{pname}/import_manifest.json", mode="r", encoding="utf-8") as f:
+                manifest : dict[str, Any] = json.load(f)
+            if manifest.get("version", None) != self.VERSION:
+                return None
+            return manifest
+        except:
+            return None
+
+    def _backup_save_manifest(self : RPGMTL, pname : str, manifest : dict[str, Any]) -> None:
+        try:
+            with open(f"projects/{pname}/import_manifest.json", mode="w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            self.log.error(f"Failed to save import_manifest.json for project {pname}\n{self.trbk(e)}")
+
+    # check if the backup of a game file is up to date, using the size and modification time of the game file during the previous import
+    # if only the modification time changed, the content of both files is compared
+    def _backup_is_up_to_date(self : RPGMTL, fp : PurePath, target : PurePath, st : os.stat_result, previous : list[int]|None) -> bool:
+        if previous is None or previous[0] != st.st_size:
+            return False
+        try:
+            if os.stat(target).st_size != st.st_size:
+                return False
+            if previous[1] == st.st_mtime_ns:
+                return True
+            with open(fp, mode="rb") as a, open(target, mode="rb") as b:
+                return hashlib.file_digest(a, "sha256").digest() == hashlib.file_digest(b, "sha256").digest()
+        except OSError:
+            return False
+
+    # copy a game file to the originals folder
+    def _backup_copy_file(self : RPGMTL, pname : str, fp : PurePath, target : PurePath) -> bool:
+        if not os.path.isdir(target.parent): # create directory if not found
+            try:
+                # create dir if needed
+                os.makedirs(target.parent.as_posix(), exist_ok=True)
+            except Exception as e:
+                self.log.error("Couldn't create the following folder:" + target.parent.as_posix() + "\n" + self.trbk(e))
+        tmp : PurePath = target.with_name(target.name + ".rpgmtl_tmp")
+        try:
+            # file copy to project folder
+            # through a temporary file, so the previous copy is kept if it fails
+            shutil.copy(fp, tmp)
+            os.replace(tmp, target)
+            return True
+        except Exception as e:
+            self.log.error("Couldn't copy the following file:" + fp.as_posix() + " to project folder " + pname + "\n" + self.trbk(e))
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
     # Backup game files matching the plugin extensions for the given project name
-    def backup_game_files(self : RPGMTL, pname : str) -> None:
+    # The import is incremental: the files which didn't change since the previous import (see import_manifest.json) aren't copied again
+    # Return the list of the original files which have been added, modified or removed
+    def backup_game_files(self : RPGMTL, pname : str) -> list[str]:
         self.log.info(f"Copying game files for project {pname}...")
         backup_path : PurePath = PurePath("projects", pname, "originals") # project backup path
-        # delete existing backup
-        if os.path.isdir(backup_path):
-            shutil.rmtree(backup_path)
+        manifest : dict[str, Any]|None = self._backup_load_manifest(pname)
+        if manifest is None:
+            # delete existing backup
+            if os.path.isdir(backup_path):
+                shutil.rmtree(backup_path)
+            manifest = {"files":{}, "archives":{}}
         update_file_dict : dict[str, dict] = {}
+        files_stats : dict[str, list[int]] = {} # size and modification time of the game files
+        archives : dict[str, dict[str, Any]] = {} # files extracted from the game archives
+        changed : set[str] = set()
+        copy_list : list[tuple[str, PurePath, PurePath]] = []
         # walk into the game folder
         game_path : PurePath = PurePath(self.projects[pname]["path"])
         for path, subdirs, files in os.walk(game_path):
             for name in files:
-                copied : bool = False
-                extracted : bool = False
+                extractors : list[plugins.Plugin] = self.get_file_plugins(name, True)
+                candidates : list[plugins.Plugin] = self.get_file_plugins(name)
+                if len(extractors) == 0 and len(candidates) == 0: # not supported by any plugin
+                    continue
                 fp : PurePath = PurePath(path, name) # full file path
                 fpr : PurePath = fp.relative_to(game_path) # relative target file path
                 target_dir = backup_path / fpr.parent # directory containing the file
+                try:
+                    st : os.stat_result = os.stat(fp)
+                except OSError as e:
+                    self.log.error("Couldn't access the following file:" + fp.as_posix() + "\n" + self.trbk(e))
+                    continue
                 
-                for p in self.plugins.values():
-                    # check if file is supported by an extension
-                    if not extracted and p.extract(update_file_dict, fp, target_dir, backup_path):
-                        extracted = True
-                    
+                # check if file is supported by an extension
+                if len(extractors) > 0:
+                    previous : dict[str, Any]|None = manifest["archives"].get(fpr.as_posix(), None)
+                    if (previous is not None
+                            and previous["stat"] == [st.st_size, st.st_mtime_ns]
+                            and all(os.path.isfile(backup_path / k) for k in previous["files"])):
+                        # the archive didn't change, its files are still there
+                        update_file_dict.update(previous["files"])
+                        archives[fpr.as_posix()] = previous
+                    else:
+                        if previous is not None: # remove the files extracted previously
+                            for k in previous["files"]:
+                                try:
+                                    os.remove(backup_path / k)
+                                except OSError:
+                                    pass
+                                changed.add(k)
+                        keys : set[str] = set(update_file_dict.keys())
+                        for p in extractors:
+                            p.set_settings(self.settings | self.projects[pname]['settings'])
+                            if p.extract(update_file_dict, fp, target_dir, backup_path):
+                                break
+                        extracted : dict[str, dict] = {k : v for k, v in update_file_dict.items() if k not in keys}
+                        changed.update(extracted.keys())
+                        archives[fpr.as_posix()] = {"stat":[st.st_size, st.st_mtime_ns], "files":extracted}
+                
+                for p in candidates:
                     # check if the file must be backed up
-                    if not copied and p.match(name, False):
-                        if not os.path.isdir(target_dir): # create directory if not found
-                            try:
-                                # create dir if needed
-                                os.makedirs(target_dir.as_posix(), exist_ok=True)
-                            except Exception as e:
-                                self.log.error("Couldn't create the following folder:" + target_dir.as_posix() + "\n" + self.trbk(e))
-                        # backup
+                    if p.match(name, False):
+                        # add to config.json
+                        update_file_dict[fpr.as_posix()] = {
+                            "file_type":FileType.NORMAL,
+                            "ignored":IntBool.FALSE,
+                            "strings":0,
+                            "translated":0,
+                            "disabled_strings":0
+                        }
+                        files_stats[fpr.as_posix()] = [st.st_size, st.st_mtime_ns]
+                        if not self._backup_is_up_to_date(fp, backup_path / fpr, st, manifest["files"].get(fpr.as_posix(), None)):
+                            copy_list.append((fpr.as_posix(), fp, backup_path / fpr))
+                        break
+        # copy the new and modified files
+        # using threads, as the copies are I/O bound (so not limited by the worker setting, which is for processes)
+        workers : int = min(32, (os.cpu_count() or 1) + 4, max(1, len(copy_list)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rpgmtl_backup") as executor:
+            for (k, fp, target), copied in zip(copy_list, executor.map(self._backup_copy_file, repeat(pname), [c[1] for c in copy_list], [c[2] for c in copy_list])):
+                if copied:
+                    self.log.info(k + " has been copied to project folder " + pname)
+                    changed.add(k)
+                elif k in manifest["files"] and os.path.isfile(target):
+                    # keep the previous copy and its stats, so the copy is tried again on the next import
+                    files_stats[k] = manifest["files"][k]
+                else:
+                    update_file_dict.pop(k, None)
+                    files_stats.pop(k, None)
+        # remove the files which aren't in the game anymore
+        for k in manifest["files"]:
+            if k not in files_stats and k not in update_file_dict:
+                try:
+                    os.remove(backup_path / k)
+                    self.log.info(k + " has been removed from project folder " + pname)
+                except OSError:
+                    pass
+                changed.add(k)
+        for a, previous in manifest["archives"].items():
+            if a not in archives:
+                for k in previous["files"]:
+                    if k not in update_file_dict:
                         try:
-                            # file copy to project folder
-                            shutil.copy(fp, backup_path / fpr)
-                            # add to config.json
-                            update_file_dict[fpr.as_posix()] = {
-                                "file_type":FileType.NORMAL,
-                                "ignored":IntBool.FALSE,
-                                "strings":0,
-                                "translated":0,
-                                "disabled_strings":0
-                            }
-                            self.log.info(fpr.as_posix() + " has been copied to project folder " + pname)
-                        except Exception as e:
-                            self.log.error("Couldn't copy the following file:" + fp.as_posix() + " to project folder " + pname + "\n" + self.trbk(e))
-                        copied = True
+                            os.remove(backup_path / k)
+                        except OSError:
+                            pass
+                        changed.add(k)
+        self.log.info(f"Imported {len(update_file_dict)} game files for project {pname}, {len(changed)} files have been added, modified or removed since the previous import")
+        self._backup_save_manifest(pname, {"version":self.VERSION, "files":files_stats, "archives":archives, "changed":sorted(changed)})
         # keep file setting if it exists
         for k, v in self.projects[pname].get("files", {}).items():
             if k in update_file_dict or v["file_type"] in (FileType.ARCHIVE, FileType.VIRTUAL, FileType.VIRTUAL_UNDEFINED):
@@ -542,6 +1390,7 @@ class RPGMTL():
         # update and save
         self.projects[pname]["files"] = update_file_dict
         self.modified[pname] = True
+        return sorted(changed)
 
     def clean_project_name(self : RPGMTL, name : str) -> str:
         # forbidden charas (POSIX & Windows)
@@ -710,7 +1559,7 @@ class RPGMTL():
                     self.log.error(f"Error while cleaning up aborted project {name}\n{self.trbk(ce)}")
                 return False, "Creation aborted, no exploitable files found"
             # save
-            self.save()
+            self.save(skip_busy=True)
             self.log.info(f"Project {name} has been created")
             # find possible icon
             if icon_path == "" or (await self.look_for_icon_at(name, icon_path)) != 0:
@@ -749,12 +1598,18 @@ class RPGMTL():
         data["format_version"] = 2
         return data
 
-    # load a project strings.json file
+    # load a project strings.json file (or strings.bin, if it exists)
     def load_strings(self : RPGMTL, name : str) -> dict[str, Any]:
         try:
             if name not in self.strings:
-                with open('projects/' + name + '/strings.json', mode='r', encoding='utf-8') as f:
-                    self.strings[name] = self.update_string_format(json.load(f))
+                if os.path.isfile('projects/' + name + '/strings.bin'):
+                    self.strings[name] = self.update_string_format(read_compact_strings('projects/' + name + '/strings.bin'))
+                else:
+                    with open('projects/' + name + '/strings.json', mode='r', encoding='utf-8') as f:
+                        self.strings[name] = self.update_string_format(self.share_strings(json.load(f)))
+                self.journal_count[name] = self.read_journal(name, self.strings[name]) # apply changes saved since the last full write
+                self.search_indexes.pop(name, None)
+                self.reset_string_changes(name)
                 self.start_compute_translated(name) # force an up to date compute
             return self.strings[name]
         except OSError:
@@ -763,6 +1618,16 @@ class RPGMTL():
             self.log.error(f"Failed to load strings of project {name}\n{self.trbk(e)}")
             raise e
 
+    # Make the local string ids point to the global string ids, instead of keeping a copy of each
+    # The compact format already does it
+    def share_strings(self : RPGMTL, strings : dict[str, Any]) -> dict[str, Any]:
+        ids : dict[str, str] = {sid : sid for sid in strings["strings"]}
+        for groups in strings["files"].values():
+            for group in groups:
+                for i in range(1, len(group)):
+                    group[i][LocIndex.ID] = ids.get(group[i][LocIndex.ID], group[i][LocIndex.ID])
+        return strings
+
     # Update the content of strings.json to later formats
     def update_string_format(self : RPGMTL, strings : dict[str, Any]) -> dict[str, Any]:
         ver = strings.get("version", 0)
@@ -779,18 +1644,23 @@ class RPGMTL():
         return strings
 
     # backup a project strings.json file and backups
+    # backups are always in the strings.json format
     def backup_strings_file(self : RPGMTL, name : str) -> None:
+        self.compact_strings(name) # make sure strings.json is up to date
         fns : list[str] = ["strings.bak-5.json", "strings.bak-4.json", "strings.bak-3.json", "strings.bak-2.json", "strings.bak-1.json", "strings.json"]
         for i in range(1, len(fns)):
             try:
-                shutil.copyfile(f"projects/{name}/{fns[i]}", f"projects/{name}/{fns[i-1]}")
+                if fns[i] == "strings.json" and os.path.isfile(f"projects/{name}/strings.bin"):
+                    self.write_strings_json(read_compact_strings(f"projects/{name}/strings.bin"), f"projects/{name}/{fns[i-1]}")
+                else:
+                    shutil.copyfile(f"projects/{name}/{fns[i]}", f"projects/{name}/{fns[i-1]}")
             except:
                 pass
 
     # extract the strings from given file
     def extract_game_file(self : RPGMTL, name : str, filename : str) -> tuple[bool, list[list[str]], list[str]]:
         p_path : Path = Path('projects', name, 'originals')
-        for p in self.plugins.values():
+        for p in self.get_file_plugins(filename):
             if p.match(filename, False): # this file match with the plugin
                 p.reset(p_path, filename) # reset plugin state
                 p.set_settings(self.settings | self.projects[name]['settings']) # and set setting
@@ -801,15 +1671,56 @@ class RPGMTL():
                 else:
                     with open((p_path / filename).as_posix(), mode="rb") as infile:
                         content = infile.read()
-                return True, p.read(filename, content), p.related_tool_plugins
+                strings, locations = p.read_with_locations(filename, content)
+                self.save_location_map(name, filename, p, content, locations)
+                return True, strings, p.related_tool_plugins
         return False, [], []
 
+    # path of the string location map of a file
+    def get_location_map_path(self : RPGMTL, name : str, filename : str) -> Path:
+        return Path('projects', name, 'locations', filename + '.json')
+
+    # fingerprint of the original file content, for the string location maps
+    # it also covers the plugin, its code and its settings, as they can change how the file is parsed
+    def get_location_map_fingerprint(self : RPGMTL, plugin : plugins.Plugin, content : bytes) -> str:
+        h = hashlib.sha256(content)
+        h.update(plugin.name.encode("utf-8"))
+        h.update(self.get_plugin_code_fingerprint().encode("utf-8"))
+        h.update(self.get_file_settings_fingerprint(plugin.settings, [plugin]).encode("utf-8"))
+        return h.hexdigest()
+
+    # save the string location map returned by a plugin during the extraction
+    # the previous map is removed if there is none
+    def save_location_map(self : RPGMTL, name : str, filename : str, plugin : plugins.Plugin, content : bytes, locations : Any) -> None:
+        path : Path = self.get_location_map_path(name, filename)
+        try:
+            if locations is None:
+                path.unlink(missing_ok=True)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path.as_posix(), mode="w", encoding="utf-8") as f:
+                    json.dump({"fingerprint":self.get_location_map_fingerprint(plugin, content), "locations":locations}, f, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            self.log.warning(f"Failed to save the string location map of {filename} for project {name}\n{self.trbk(e)}")
+
+    # load the string location map of a file
+    # return None if there is none, or if the original file or the settings changed since the extraction
+    def load_location_map(self : RPGMTL, name : str, filename : str, plugin : plugins.Plugin, content : bytes) -> Any:
+        try:
+            with open(self.get_location_map_path(name, filename).as_posix(), mode="r", encoding="utf-8") as f:
+                data : dict[str, Any] = json.load(f)
+            if data["fingerprint"] != self.get_location_map_fingerprint(plugin, content):
+                return None
+            return data["locations"]
+        except:
+            return None
+
     # patch the strings from given file, and write to the release folder
     # return value is a tuple of counts, for successfully patched files and errors
     def patch_game_file(self : RPGMTL, name : str, filename : str, release_folder : PurePath) -> tuple[int, int]:
         p_path : Path = Path('projects', name, 'originals')
         totalerr : int = 0
-        for p in self.plugins.values():
+        for p in self.get_file_plugins(filename):
             try:
                 if p.match(filename, False): # file matches the plugin
                     p.reset(p_path, filename)
@@ -820,7 +1731,11 @@ class RPGMTL():
                     else:
                         with open((p_path / filename).as_posix(), mode="rb") as iofile:
                             content = iofile.read()
-                        content, modified = p.write(name, filename, content) # write content
+                        locations : Any = self.load_location_map(name, filename, p, content)
+                        if locations is None:
+                            content, modified = p.write(name, filename, content) # write content
+                        else:
+                            content, modified = p.write_with_locations(name, filename, content, locations) # write content without parsing it again
                         content, modified, errcount = self.apply_fixes(name, filename, content, modified) # apply fixes
                         totalerr += errcount
                         # write file if modified
@@ -842,7 +1757,11 @@ class RPGMTL():
         update_run_flag : int = 0
         # keep copy of existing ones (if any)
         try:
-            index = copy.deepcopy(self.strings[name])
+            # copy of the string table, the strings and files are copied by hand as it's way faster than deepcopy
+            strings : dict[str, Any] = self.strings[name]
+            index = copy.deepcopy({k : v for k, v in strings.items() if k not in ("strings", "files")})
+            index["strings"] = {k : v.copy() for k, v in strings["strings"].items()}
+            index["files"] = {f : [[g[0]] + [lc.copy() for lc in g[1:]] for g in groups] for f, groups in strings["files"].items()}
             for k in index["strings"]:
                 str_id = max(str_id, int(k)+1) # calculate last id
                 reverse_strings[index["strings"][k][GloIndex.ORI]] = k # keep track of string and its id in a reverse lookup table
@@ -876,6 +1795,10 @@ class RPGMTL():
             if len(index["files"][k]) == 0:
                 continue
             if k in old:
+                if (len(index["files"][k]) == len(old[k])
+                        and all(len(g) == len(h) and g[0] == h[0] and all(g[j][LocIndex.ID] == h[j][LocIndex.ID] for j in range(1, len(g))) for g, h in zip(index["files"][k], old[k]))):
+                    index["files"][k] = old[k] # same strings, keep the old ones as they are
+                    continue
                 # list new strings
                 A : list[str] = []
                 A_index : list[tuple[int, int]] = []
@@ -907,14 +1830,150 @@ class RPGMTL():
                 for t in self.plugins[p].get_tool_infos():
                     self.projects[name]["bookmarked_tools"].append(t)
 
+    # return the number of worker processes to use for the given number of files
+    # set with the --workers command line argument
+    def get_worker_count(self : RPGMTL, file_count : int) -> int:
+        if file_count < self.PARALLEL_MIN_FILES:
+            return 1
+        return max(1, min(self.settings.get("worker_count", 1), file_count))
+
+    # run a worker function on each given file, using a process pool
+    # yield a tuple per file: file path and the function result, in the file order
+    # project and strings are sent to the workers as a read-only snapshot
+    # the log messages of the workers are repeated here, in the file order too
+    def _run_workers(self : RPGMTL, name : str, workers : int, func : Callable, file_list : list[str], project : dict[str, Any], strings : dict[str, Any]|None, *args) -> Iterator[tuple[str, Any]]:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(self.settings, name, project, strings)
+        ) as executor:
+            try:
+                for f, (result, records) in zip(file_list, executor.map(func, repeat(name), file_list, *[repeat(a) for a in args], chunksize=max(1, len(file_list) // (workers * 8)))):
+                    for level, message in records:
+                        self.log.log(level, message)
+                    yield f, result
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    # extract the strings of the given files, in the same order
+    # yield a tuple per file: file path, extract_game_file() results and the error traceback (None if no errors)
+    # if enabled, the files are read by a process pool
+    def _generate_extract(self : RPGMTL, name : str, file_list : list[str]) -> Iterator[tuple[str, bool, list[list[str]], list[str], str|None]]:
+        workers : int = self.get_worker_count(len(file_list))
+        if workers <= 1:
+            for f in file_list:
+                try:
+                    yield (f, *self.extract_game_file(name, f), None)
+                except Exception as e:
+                    yield (f, False, [], [], self.trbk(e))
+        else:
+            self.log.info(f"Using {workers} processes to extract the strings of project {name}...")
+            for f, result in self._run_workers(name, workers, worker_extract, file_list, {"settings":self.projects[name]['settings']}, None):
+                yield (f, *result)
+
+    # load the manifest of the previous extraction
+    def _generate_load_manifest(self : RPGMTL, name : str) -> dict[str, Any]:
+        try:
+            with open(f"projects/{name}/extract_manifest.json", mode="r", encoding="utf-8") as f:
+                manifest : dict[str, Any] = json.load(f)
+            if manifest.get("version", None) != self.VERSION:
+                raise Exception()
+            return manifest
+        except:
+            return {"version":self.VERSION, "files":{}}
+
+    def _generate_save_manifest(self : RPGMTL, name : str, manifest : dict[str, Any]) -> None:
+        try:
+            with open(f"projects/{name}/extract_manifest.json", mode="w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            self.log.error(f"Failed to save extract_manifest.json for project {name}\n{self.trbk(e)}")
+
+    # calculate the extraction fingerprint of a file
+    # it covers the original file, the plugin reading it and the settings
+    # the hash of the original file is reused from the manifest if its size and modification time didn't change
+    # return None if no plugin matches the file
+    def _generate_fingerprint(self : RPGMTL, name : str, f : str, settings : str, previous : dict[str, Any]|None) -> dict[str, Any]|None:
+        p_path : Path = Path('projects', name, 'originals')
+        for p in self.get_file_plugins(f):
+            if p.match(f, False):
+                st : os.stat_result = os.stat(p_path / f)
+                if previous is not None and previous["stat"] == [st.st_size, st.st_mtime_ns]:
+                    content_hash : str = previous["hash"]
+                else:
+                    with open(p_path / f, mode="rb") as infile:
+                        content_hash : str = hashlib.file_digest(infile, "sha256").hexdigest()
+                h = hashlib.sha256(content_hash.encode("utf-8"))
+                h.update(f"{p.name}\n{self.get_plugin_code_fingerprint()}\n{settings}".encode("utf-8"))
+                return {"stat":[st.st_size, st.st_mtime_ns], "hash":content_hash, "fingerprint":h.hexdigest(), "plugins":p.related_tool_plugins}
+        return None
+
+    # rebuild the groups of a file and its children files, as returned by its plugin, from a string table
+    def _generate_rebuild_groups(self : RPGMTL, strings : dict[str, Any], f : str, children : list[str]) -> list[list[str]]:
+        groups : list[list[str]] = []
+        for k in [f] + children:
+            if k != f:
+                groups.append([self.CHILDREN_FILE_ID + k[len(f)+1:]])
+            for g in strings["files"][k]:
+                groups.append([g[0]] + [strings["strings"][lc[LocIndex.ID]][GloIndex.ORI] for lc in g[1:]])
+        return groups
+
+    # digest of groups returned by _generate_rebuild_groups, to check if the previous strings still match the previous extraction
+    def _generate_groups_digest(self : RPGMTL, groups : list[list[str]]) -> str:
+        return hashlib.sha256(json.dumps(groups, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    # calculate the extraction fingerprints of the given files
+    def _generate_fingerprints(self : RPGMTL, name : str, file_list : list[str], manifest : dict[str, Any]) -> dict[str, dict[str, Any]|None]:
+        fingerprints : dict[str, dict[str, Any]|None] = {}
+        # settings of every file plugin, as archive plugins pass their content to other plugins
+        settings : str = self.get_file_settings_fingerprint(self.settings | self.projects[name]['settings'])
+        for f in file_list:
+            try:
+                fingerprints[f] = self._generate_fingerprint(name, f, settings, manifest["files"].get(f, None))
+            except OSError:
+                fingerprints[f] = None # the error will be reported when extracting
+        return fingerprints
+
+    # select the files which didn't change since the previous extraction
+    # return their groups rebuilt from the previous strings, and the related plugins
+    def _generate_find_unchanged(self : RPGMTL, file_list : list[str], old_index : dict[str, Any], manifest : dict[str, Any], fingerprints : dict[str, dict[str, Any]|None]) -> dict[str, tuple[list[list[str]], list[str]]]:
+        unchanged : dict[str, tuple[list[list[str]], list[str]]] = {}
+        for f in file_list:
+            previous : dict[str, Any]|None = manifest["files"].get(f, None)
+            if (previous is None
+                    or fingerprints[f] is None
+                    or previous["fingerprint"] != fingerprints[f]["fingerprint"]
+                    or any(k not in old_index["files"] for k in [f] + previous["children"])):
+                continue
+            groups : list[list[str]] = self._generate_rebuild_groups(old_index, f, previous["children"])
+            if self._generate_groups_digest(groups) == previous["groups"]:
+                unchanged[f] = (groups, fingerprints[f]["plugins"])
+        return unchanged
+
+    # yield the results of _generate_extract for the given files, in the same order
+    # the unchanged files aren't extracted again, their previous groups are used instead
+    def _generate_reuse(self : RPGMTL, name : str, file_list : list[str], unchanged : dict[str, tuple[list[list[str]], list[str]]]) -> Iterator[tuple[str, bool, list[list[str]], list[str], str|None]]:
+        extraction : Iterator[tuple[str, bool, list[list[str]], list[str], str|None]] = self._generate_extract(name, [f for f in file_list if f not in unchanged])
+        try:
+            for f in file_list:
+                if f in unchanged:
+                    yield (f, True, *unchanged[f], None)
+                else:
+                    yield next(extraction)
+        finally:
+            extraction.close() # stop the workers
+
     # extract strings from backed up files
+    # the files which didn't change since the previous extraction (see extract_manifest.json) aren't parsed again
     def generate(self : RPGMTL, name : str) -> int:
-        self.save() # save first!
+        self.save(name=name) # save first!
         self.backup_strings_file(name) # backup strings.json
         self.load_strings(name) # load strings.json
         # init
         index, old, reverse_strings, str_id, update_run_flag = self._generate_init(name)
         self.log.info(f"Extracting strings for project {name}...")
+        files_backup : dict[str, Any] = copy.deepcopy(self.projects[name]['files']) # restored if the task is cancelled
         # go over each files
         # ... first to set virtual as undefined
         for f in list(self.projects[name]['files'].keys()):
@@ -923,19 +1982,39 @@ class RPGMTL():
         # ... next to extract the strings
         err : int = 0
         used_plugins : set[str] = set()
-        for f in list(self.projects[name]['files'].keys()):
+        file_list : list[str] = [f for f, v in self.projects[name]['files'].items() if v["file_type"] in (FileType.NORMAL, FileType.ARCHIVE)]
+        # look for the files which didn't change
+        manifest : dict[str, Any] = self._generate_load_manifest(name)
+        fingerprints : dict[str, dict[str, Any]|None] = self._generate_fingerprints(name, file_list, manifest)
+        unchanged : dict[str, tuple[list[list[str]], list[str]]] = {}
+        if update_run_flag:
+            unchanged = self._generate_find_unchanged(file_list, {"strings":index["strings"], "files":old}, manifest, fingerprints)
+            if len(unchanged) > 0:
+                self.log.info(f"{len(unchanged)} files didn't change since the previous extraction, {len(file_list) - len(unchanged)} files will be extracted...")
+        new_manifest : dict[str, Any] = {"version":self.VERSION, "files":{}}
+        # results are processed in the file order, so the string ids don't depend on the extraction mode
+        extraction : Iterator[tuple[str, bool, list[list[str]], list[str], str|None]] = self._generate_reuse(name, file_list, unchanged)
+        for n, (f, extracted, groups, related_plugins, error) in enumerate(extraction):
+            try:
+                self.job_step(n, len(file_list))
+            except JobCancelled:
+                extraction.close() # stop the workers
+                self.projects[name]['files'] = files_backup
+                raise
             try:
                 # references
                 file_info : dict[str, Any] = self.projects[name]['files'][f]
-                if file_info["file_type"] not in (FileType.NORMAL, FileType.ARCHIVE):
-                    continue
                 file_info["file_type"] = FileType.NORMAL # reset to normal for now
                 target : dict[str, Any] = file_info # reference for children files
                 target_file : str = f
+                children : list[str] = []
                 # reset string
                 target["strings"] = 0
-                # extract strings
-                extracted, groups, related_plugins = self.extract_game_file(name, f)
+                # check extraction result
+                if error is not None:
+                    err += 1
+                    self.log.error(f"Failed to extract strings from {f} for project {name}\n{error}")
+                    continue
                 if extracted:
                     for related in related_plugins:
                         used_plugins.add(related)
@@ -958,6 +2037,8 @@ class RPGMTL():
                             self.projects[name]['files'][target_file]["parent"] = f
                             if target_file not in index["files"]: # add to index too
                                 index["files"][target_file] = []
+                            if target_file not in children:
+                                children.append(target_file)
                             target = self.projects[name]['files'][target_file] # set as target
                             target["strings"] = 0 # reset to 0 (if needed)
                             continue
@@ -978,6 +2059,12 @@ class RPGMTL():
                                 index["strings"][str(str_id)] = [s, None, 1, 0]
                                 str_id += 1 # increase for next id
                         index["files"][target_file].append(group)
+                    # keep track of the extraction
+                    if fingerprints[f] is not None:
+                        new_manifest["files"][f] = fingerprints[f] | {
+                            "children":children,
+                            "groups":manifest["files"][f]["groups"] if f in unchanged else self._generate_groups_digest(self._generate_rebuild_groups(index, f, children))
+                        }
             except Exception as e:
                 err += 1
                 self.log.error(f"Failed to extract strings from {f} for project {name}\n{self.trbk(e)}")
@@ -987,6 +2074,7 @@ class RPGMTL():
             self._generate_auto_bookmark_files(name, used_plugins)
         # set new string table
         self.strings[name] = index
+        self._generate_save_manifest(name, new_manifest)
         # increase project version
         self.projects[name]["version"] = self.projects[name].get("version", 0) + 1
         # start computing completion
@@ -996,45 +2084,108 @@ class RPGMTL():
         self.log.info(f"Strings extraction for project {name} completed")
         return err
 
-    def start_compute_translated(self : RPGMTL, name : str) -> None:
+    # if check is True, the result is compared with the current counts (see compute_translated)
+    def start_compute_translated(self : RPGMTL, name : str, check : bool = False) -> None:
+        if self.loop is not None and threading.current_thread() is not threading.main_thread():
+            # called from a background task, schedule it in the event loop instead
+            self.loop.call_soon_threadsafe(self.start_compute_translated, name, check)
+            return
         if name in self.computing:
+            if not self.computing_checks.get(name, False):
+                check = False # the current counts are already known to be outdated
             self.computing[name].cancel()
-        self.computing[name] = asyncio.create_task(self.compute_translated(name))
+        self.computing_checks[name] = check
+        self.computing[name] = asyncio.create_task(self.compute_translated(name, check))
 
     # calculate number of translated lines
-    async def compute_translated(self : RPGMTL, name : str) -> None:
+    # used when strings.json is loaded or modified as a whole
+    # smaller modifications are counted by update_translated
+    # if check is True, the counts kept up to date by update_translated are compared with the result, and mismatches are logged
+    # it's used after background tasks, as plugins might modify the strings without calling mark_modified
+    async def compute_translated(self : RPGMTL, name : str, check : bool = False) -> None:
+        # Store the task for later cleanup
+        task : asyncio.Task = self.computing[name]
         try:
-            # Store the task for later cleanup
-            task : asyncio.Task = self.computing[name]
+            # Wait for background tasks to end
+            while self.is_busy(name):
+                await asyncio.sleep(0.5)
+            # Keep the previous counts
+            check = check and name in self.translated_strings
+            if check:
+                previous : dict[str, tuple[Any, Any, Any]] = {
+                    f : (v.get("translated", None), v.get("disabled_strings", None), v.get("strings", None))
+                    for f, v in self.projects[name]['files'].items()
+                }
             # List all global translated strings
             tl_table : dict[str, bool] = {s : self.strings[name]["strings"][s][GloIndex.TL] is not None for s in self.strings[name]["strings"]}
             # Look for individual strings
             for f in self.strings[name]["files"]:
-                await asyncio.sleep(0.005) # i.e 5s for 1000 files
-                counts = [0, 0, 0]
-                for g in self.strings[name]["files"][f]:
-                    counts[2] += len(g) - 1
-                    for i in range(1, len(g)):
-                        if g[i][LocIndex.IGNORED]:
-                            counts[1] += 1 # disabled count
-                        elif (g[i][LocIndex.LOCAL] and g[i][LocIndex.TL] is not None) or tl_table[g[i][LocIndex.ID]]:
-                            counts[0] += 1 # translated count
+                await asyncio.sleep(0) # let other requests run
                 if f not in self.projects[name]['files']:
                     return
-                self.projects[name]['files'][f]["translated"] = counts[0]
-                self.projects[name]['files'][f]["disabled_strings"] = counts[1]
-                self.projects[name]['files'][f]["strings"] = counts[2]
+                self.count_translated(name, f, tl_table)
+            self.translated_strings[name] = tl_table
+            if check:
+                mismatches : list[str] = [
+                    f for f in self.strings[name]["files"]
+                    if previous.get(f, None) != (self.projects[name]['files'][f]["translated"], self.projects[name]['files'][f]["disabled_strings"], self.projects[name]['files'][f]["strings"])
+                ]
+                if len(mismatches) > 0:
+                    self.log.warning(f"The translation counts of {len(mismatches)} file(s) were outdated in project {name}, they have been corrected: {', '.join(mismatches[:10])}" + (", ..." if len(mismatches) > 10 else ""))
+                    self.modified[name] = True # save the corrected counts
             # Note: Not raising the modified flag
             # This function is already called after modifying something
             # It's to avoid too much writes
-            
-            # Cleanup
-            if self.computing.get(name, None) is task:
-                self.computing.pop(name)
         except asyncio.CancelledError:
             return
         except Exception as e:
             self.log.error(f"Unexpected error in compute_translated for project {name}\n{self.trbk(e)}")
+        finally:
+            # Cleanup
+            if self.computing.get(name, None) is task:
+                self.computing.pop(name)
+                self.computing_checks.pop(name, None)
+
+    # count the translated, disabled and total strings of a file
+    def count_translated(self : RPGMTL, name : str, f : str, tl_table : dict[str, bool]) -> None:
+        counts = [0, 0, 0]
+        for g in self.strings[name]["files"][f]:
+            counts[2] += len(g) - 1
+            for i in range(1, len(g)):
+                if g[i][LocIndex.IGNORED]:
+                    counts[1] += 1 # disabled count
+                elif (g[i][LocIndex.LOCAL] and g[i][LocIndex.TL] is not None) or tl_table[g[i][LocIndex.ID]]:
+                    counts[0] += 1 # translated count
+        self.projects[name]['files'][f]["translated"] = counts[0]
+        self.projects[name]['files'][f]["disabled_strings"] = counts[1]
+        self.projects[name]['files'][f]["strings"] = counts[2]
+
+    # update the counts of compute_translated after the given strings and files have been modified
+    # the given files are counted again, and the other occurences of the given strings are updated one by one
+    def update_translated(self : RPGMTL, name : str, string_ids : Iterable[str], files : Iterable[str]) -> None:
+        if (name in self.computing # a computation is already pending
+                or name not in self.translated_strings # or hasn't been done yet
+                or threading.current_thread() is not threading.main_thread()): # or called from a background task
+            self.start_compute_translated(name)
+            return
+        tl_table : dict[str, bool] = self.translated_strings[name]
+        files = set(files)
+        occurences : dict[str, list[tuple[str, int, int]]] = self.get_occurences(name)
+        for sid in string_ids:
+            translated : bool = self.strings[name]["strings"][sid][GloIndex.TL] is not None
+            if tl_table.get(sid, False) == translated:
+                continue
+            tl_table[sid] = translated
+            for f, g, i in occurences.get(sid, ()):
+                if f in files or f not in self.projects[name]['files']:
+                    continue
+                lc : list = self.strings[name]["files"][f][g][i]
+                if lc[LocIndex.IGNORED] or (lc[LocIndex.LOCAL] and lc[LocIndex.TL] is not None):
+                    continue # its count doesn't depend on the global translation
+                self.projects[name]['files'][f]["translated"] += 1 if translated else -1
+        for f in files:
+            if f in self.strings[name]["files"] and f in self.projects[name]['files']:
+                self.count_translated(name, f, tl_table)
 
     def _create_release_cleanup(self : RPGMTL, release_folder : PurePath) -> int:
         if os.path.isdir(release_folder):
@@ -1046,23 +2197,159 @@ class RPGMTL():
                 return 1
         return 0
 
-    def _create_release_patch_files(self : RPGMTL, name : str, release_folder : PurePath) -> tuple[int, int]:
+    # patch the given files, in the same order
+    # yield a tuple per file: file path and patch_game_file() results
+    # if enabled, the files are patched by a process pool
+    def _create_release_patch(self : RPGMTL, name : str, file_list : list[str], release_folder : PurePath) -> Iterator[tuple[str, tuple[int, int]]]:
+        workers : int = self.get_worker_count(len(file_list))
+        if workers <= 1:
+            for f in file_list:
+                yield f, self.patch_game_file(name, f, release_folder)
+        else:
+            self.log.info(f"Using {workers} processes to patch the files of project {name}...")
+            yield from self._run_workers(name, workers, worker_patch, file_list, self.projects[name], self.strings[name], release_folder)
+
+    def _create_release_patch_files(self : RPGMTL, name : str, release_folder : PurePath, file_list : list[str], manifest : dict[str, Any], fingerprints : dict[str, str]) -> tuple[int, int]:
         # for each file
         patch_count : int = 0
         err : int = 0
-        for f in self.projects[name]["files"]:
-            ftype : int = self.projects[name]["files"][f]["file_type"]
-            if (self.projects[name]["files"][f]["ignored"]
-                    or ftype in (FileType.VIRTUAL, FileType.VIRTUAL_UNDEFINED)):
-                # skip ignored files and virtual files
-                continue
-            r : tuple[int, int] = self.patch_game_file(name, f, release_folder)
+        patching : Iterator[tuple[str, tuple[int, int]]] = self._create_release_patch(name, file_list, release_folder)
+        for n, (f, r) in enumerate(patching):
+            try:
+                self.job_step(n, len(file_list))
+            except JobCancelled:
+                patching.close() # stop the workers
+                raise
             if r[0] > 0:
                 patch_count += 1
             if r[1] > 0:
                 err += 1
+                manifest["files"].pop(f, None) # files with errors are always patched again
+            else:
+                # keep track of the output file, to detect if it's been modified or deleted
+                output : list[int]|None = None
+                if r[0] > 0:
+                    st : os.stat_result = os.stat(release_folder / f)
+                    output = [st.st_size, st.st_mtime_ns]
+                manifest["files"][f] = {"fingerprint":fingerprints[f], "output":output}
         return patch_count, err
 
+    # load the manifest of the previous release
+    # return None if there is none, or if the release must be fully rebuilt
+    def _create_release_load_manifest(self : RPGMTL, name : str, release_folder : PurePath) -> dict[str, Any]|None:
+        try:
+            if not os.path.isdir(release_folder):
+                return None
+            with open(f"projects/{name}/release_manifest.json", mode="r", encoding="utf-8") as f:
+                manifest : dict[str, Any] = json.load(f)
+            if manifest.get("version", None) != self.VERSION:
+                return None
+            return manifest
+        except:
+            return None
+
+    def _create_release_save_manifest(self : RPGMTL, name : str, manifest : dict[str, Any]) -> None:
+        try:
+            with open(f"projects/{name}/release_manifest.json", mode="w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+        except Exception as e:
+            self.log.error(f"Failed to save release_manifest.json for project {name}\n{self.trbk(e)}")
+
+    # calculate the fingerprint of each given file
+    # it covers the original file, the settings, the translations which would be applied (including by the children files) and the matching fixes
+    # the hashes of the original files are reused from the manifest if their size and modification time didn't change
+    # also flag the files with an effective patch: a translation different from its original string, or a matching fix
+    def _create_release_fingerprints(self : RPGMTL, name : str, file_list : list[str], manifest : dict[str, Any]|None) -> tuple[dict[str, str], dict[str, list], dict[str, bool]]:
+        p_path : Path = Path('projects', name, 'originals')
+        files : dict[str, Any] = self.projects[name]["files"]
+        strings : dict[str, Any] = self.strings[name]
+        # settings of every file plugin, as archive plugins pass their content to other plugins
+        settings : str = self.get_file_settings_fingerprint(self.settings | self.projects[name]['settings'])
+        code : str = self.get_plugin_code_fingerprint()
+        # group the string files with their parent file
+        children : dict[str, list[str]] = {f:[] for f in file_list}
+        for k in strings["files"]:
+            parent : str = k
+            while parent not in children and "/" in parent:
+                parent = parent.rsplit("/", 1)[0]
+            if parent in children:
+                children[parent].append(k)
+        fingerprints : dict[str, str] = {}
+        originals : dict[str, list] = {}
+        has_patch : dict[str, bool] = {}
+        previous : dict[str, list] = {} if manifest is None else manifest.get("originals", {})
+        for f in file_list:
+            # original file hash
+            try:
+                st : os.stat_result = os.stat(p_path / f)
+                if f in previous and previous[f][:2] == [st.st_size, st.st_mtime_ns]:
+                    originals[f] = previous[f]
+                else:
+                    with open(p_path / f, mode="rb") as infile:
+                        originals[f] = [st.st_size, st.st_mtime_ns, hashlib.file_digest(infile, "sha256").hexdigest()]
+            except OSError:
+                fingerprints[f] = "" # the error will be reported when patching
+                continue
+            # fixes applied to this file
+            fixes : list[list[str]] = [[k, v] for k, v in self.projects[name]["patches"].items() if k in f]
+            patched : bool = len(fixes) > 0
+            # translations which would be set by the WalkHelper
+            translations : list = []
+            for k in children[f]:
+                ignored : int = files[k]["ignored"] if k in files else IntBool.FALSE
+                translations.append([k, ignored])
+                for group in strings["files"][k]:
+                    tls : list[str|None] = [
+                        None if lc[LocIndex.IGNORED] else (lc[LocIndex.TL] if lc[LocIndex.LOCAL] else strings["strings"][lc[LocIndex.ID]][GloIndex.TL])
+                        for lc in group[1:]
+                    ]
+                    translations.append([group[0]] + tls)
+                    if not patched and not ignored:
+                        patched = any(tl is not None and tl != strings["strings"][lc[LocIndex.ID]][GloIndex.ORI] for lc, tl in zip(group[1:], tls))
+            has_patch[f] = patched
+            h = hashlib.sha256(originals[f][2].encode("utf-8"))
+            h.update(code.encode("utf-8"))
+            h.update(settings.encode("utf-8"))
+            h.update(json.dumps([translations, fixes], ensure_ascii=False).encode("utf-8"))
+            fingerprints[f] = h.hexdigest()
+        return fingerprints, originals, has_patch
+
+    # check if the release file of the previous release is still valid
+    def _create_release_is_up_to_date(self : RPGMTL, release_folder : PurePath, f : str, entry : dict[str, Any]|None, fingerprint : str) -> bool:
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return False
+        try:
+            st : os.stat_result = os.stat(release_folder / f)
+            return entry["output"] == [st.st_size, st.st_mtime_ns]
+        except FileNotFoundError:
+            return entry["output"] is None
+
+    # remove the files of the previous release which must be patched again, or aren't used anymore
+    def _create_release_remove_outdated(self : RPGMTL, name : str, release_folder : PurePath, manifest : dict[str, Any], file_list : list[str], patch_list : list[str], edit_files : list[str]) -> int:
+        err : int = 0
+        keep : set[str] = set(file_list).difference(patch_list)
+        outdated : list[str] = [f for f in manifest["files"] if f not in keep]
+        outdated.extend(f for f in manifest.get("edit", []) if f not in keep and f not in edit_files)
+        for f in outdated:
+            manifest["files"].pop(f, None)
+            try:
+                os.remove(release_folder / f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.log.error(f"Failed to remove release/{f} for project {name}\n{self.trbk(e)}")
+                err += 1
+        return err
+
+    # list the files of the edit folder
+    def _create_release_list_edit_folder(self : RPGMTL, name : str) -> list[str]:
+        edit_folder : PurePath = PurePath('projects', name, 'edit')
+        edit_files : list[str] = []
+        for path, subdirs, files in os.walk(edit_folder):
+            for f in files:
+                edit_files.append(PurePath(os.path.join(path, f)).relative_to(edit_folder).as_posix())
+        return edit_files
+
     def _create_release_copy_edit_folder(self : RPGMTL, name : str, release_folder : PurePath) -> int:
         err : int = 0
         edit_folder : PurePath = PurePath('projects', name, 'edit')
@@ -1083,28 +2370,59 @@ class RPGMTL():
         return err
 
     # release game patch
-    def create_release(self : RPGMTL, name : str) -> tuple[int, int]:
+    # if full is False, only the files which changed since the previous release are patched
+    # files without an effective patch are skipped without being parsed, as they wouldn't be modified
+    # return the number of patched files, errors and skipped files
+    def create_release(self : RPGMTL, name : str, full : bool = False) -> tuple[int, int, int]:
         patch_count : int
         cleanup_err : int
         patch_err : int
         copy_err : int
         release_folder : PurePath = PurePath('projects', name, 'release')
-        # clean existing folder
-        cleanup_err : bool = self._create_release_cleanup(release_folder)
         # load strings if not loaded
         self.load_strings(name)
-        self.log.info(f"Patching files for project {name}...")
-        # patch all the files
-        patch_count, patch_err = self._create_release_patch_files(name, release_folder)
+        edit_files : list[str] = self._create_release_list_edit_folder(name)
+        # skip ignored files and virtual files
+        # and the files replaced by the edit folder content, they would be overwritten after being patched
+        edit_set : set[str] = set(edit_files)
+        file_list : list[str] = [
+            f for f, v in self.projects[name]["files"].items()
+            if not v["ignored"] and v["file_type"] not in (FileType.VIRTUAL, FileType.VIRTUAL_UNDEFINED) and f not in edit_set
+        ]
+        manifest : dict[str, Any]|None = None if full else self._create_release_load_manifest(name, release_folder)
+        fingerprints, originals, has_patch = self._create_release_fingerprints(name, file_list, manifest)
+        if manifest is None:
+            # clean existing folder
+            cleanup_err = self._create_release_cleanup(release_folder)
+            manifest = {"version":self.VERSION, "files":{}}
+            patch_list : list[str] = file_list
+            self.log.info(f"Patching files for project {name}...")
+        else:
+            patch_list : list[str] = [f for f in file_list if not self._create_release_is_up_to_date(release_folder, f, manifest["files"].get(f, None), fingerprints[f])]
+            # clean outdated files
+            cleanup_err = self._create_release_remove_outdated(name, release_folder, manifest, file_list, patch_list, edit_files)
+            self.log.info(f"Patching {len(patch_list)} files for project {name}, {len(file_list) - len(patch_list)} files are up to date...")
+        manifest["originals"] = originals
+        # skip the files without an effective patch
+        skip_list : list[str] = [f for f in patch_list if not has_patch.get(f, True)]
+        if len(skip_list) > 0:
+            patch_list = [f for f in patch_list if has_patch.get(f, True)]
+            for f in skip_list:
+                manifest["files"][f] = {"fingerprint":fingerprints[f], "output":None}
+            self.log.info(f"Skipped {len(skip_list)} files without translations to apply for project {name}")
+        # patch the files
+        patch_count, patch_err = self._create_release_patch_files(name, release_folder, patch_list, manifest, fingerprints)
         # copy edit content
         copy_err = self._create_release_copy_edit_folder(name, release_folder)
+        manifest["edit"] = edit_files
+        self._create_release_save_manifest(name, manifest)
         # result
         err : int = cleanup_err + patch_err + copy_err
         if patch_count > 0:
             self.log.info(f"Patched {patch_count} files for project {name} with {err} errors, available in the release folder")
         else:
             self.log.info(f"Patched {patch_count} files for project {name} with {err} errors,")
-        return patch_count, err
+        return patch_count, err, len(skip_list)
 
     # execute and apply runtime fix/patch
     def apply_fixes(self : RPGMTL, _name_ : str, _file_path_ : str, _content_ : bytes, _modified_ : bool) -> tuple[bytes, bool, int]:
@@ -1260,27 +2578,24 @@ class RPGMTL():
                                         table[original[j]] = translation[j]
                         else: # else go to next line
                             i += 1
-            checked = set()
-            for f in self.strings[name]["files"]:
-                for g, group in enumerate(self.strings[name]["files"][f]):
-                    for i in range(1, len(group)):
-                        sid = group[i][LocIndex.ID]
-                        if sid not in checked:
-                            checked.add(sid)
-                            if self.strings[name]["strings"][sid][GloIndex.TL] is None:
-                                if self.strings[name]["strings"][sid][GloIndex.ORI] in table:
-                                    self.strings[name]["strings"][sid][GloIndex.TL] = table[self.strings[name]["strings"][sid][GloIndex.ORI]]
-                                    count += 1
-                                elif group[0] == "Command: Script": # inline Script
-                                    s : list[str] = self.strings[name]["strings"][sid][GloIndex.ORI].split('"')
-                                    changed : bool = False
-                                    for j in range(1, len(s), 2):
-                                        if s[j] in table:
-                                            s[j] = table[s[j]]
-                                            changed = True
-                                    if changed:
-                                        self.strings[name]["strings"][sid][GloIndex.TL] = '"'.join(s)
-                                        count += 1
+            occurences : dict[str, list[tuple[str, int, int]]] = self.get_occurences(name)
+            for sid, v in self.strings[name]["strings"].items():
+                if sid in occurences and v[GloIndex.TL] is None:
+                    if v[GloIndex.ORI] in table:
+                        v[GloIndex.TL] = table[v[GloIndex.ORI]]
+                        count += 1
+                    else:
+                        f, g, i = occurences[sid][0] # group of the first occurence
+                        if self.strings[name]["files"][f][g][0] == "Command: Script": # inline Script
+                            s : list[str] = v[GloIndex.ORI].split('"')
+                            changed : bool = False
+                            for j in range(1, len(s), 2):
+                                if s[j] in table:
+                                    s[j] = table[s[j]]
+                                    changed = True
+                            if changed:
+                                v[GloIndex.TL] = '"'.join(s)
+                                count += 1
             if count > 0:
                 # increase project version
                 self.projects[name]["version"] = self.projects[name].get("version", -1) + 1
@@ -1314,7 +2629,7 @@ class RPGMTL():
                 entry["last_seen"] = 0
             else:
                 entry["last_seen"] += 1
-            self.modified[name] = True
+            self.mark_modified(name)
         # table of original : pointer to entries
         ref = {entry["original"] : entry for entry in base_ref}
         updated : int = 0
@@ -1332,7 +2647,7 @@ class RPGMTL():
                         ref[entry["original"]]["last_seen"] = 0
                         ref[entry["original"]]["occurence"] += 1
                     updated += 1
-                    self.modified[name] = True
+                    self.mark_modified(name)
                 else:
                     # Checking if the entry added by the AI is a substring of an existing one
                     # For example: AI tris to add John, when we have John Doe in our list
@@ -1349,13 +2664,13 @@ class RPGMTL():
                     if not found:
                         base_ref.append({"original":entry["original"], "translation":entry["translation"], "note":entry["note"], "last_seen":0, "occurence":1})
                         added += 1
-                        self.modified[name] = True
+                        self.mark_modified(name)
         # cleanup
         i = 0
         while i < len(base_ref):
             if base_ref[i]["last_seen"] > 15: # if not seen in last 15 translations
                 base_ref[i]["occurence"] -= 1
-                self.modified[name] = True
+                self.mark_modified(name)
             if base_ref[i]["occurence"] <= 0: # if occurence at 0, delete from base
                 base_ref.pop(i)
                 deleted += 1
@@ -1435,6 +2750,9 @@ class RPGMTL():
         middlewarecmds.add_argument('-a', '--auth', help="set the Authentication status. Add 1, on, enable, enabled, 0, off, disable or disabled to set it.", nargs=1, default=None, metavar='STATE')
         middlewarecmds.add_argument('-nu', '--newuser', help="add a new user to the Authentication list", nargs=2, default=None, metavar=('USER','PASSWORD'))
         middlewarecmds.add_argument('-ru', '--removeuser', help="remove an user from the Authentication list", nargs=1, default=None, metavar='USER')
+        performance = parser.add_argument_group('performance', 'Performance commands')
+        performance.add_argument('-w', '--workers', help="set the number of processes used to extract the strings and patch the files (1 to disable)", nargs=1, type=int, default=None, metavar='COUNT')
+        performance.add_argument('-c', '--compact', help="set the compact strings.bin format status. Add 1, on, enable, enabled, 0, off, disable or disabled to set it.", nargs=1, default=None, metavar='STATE')
         utility = parser.add_argument_group('utility', 'Utility commands')
         utility.add_argument('-v', '--verbose', help="add incoming HTTP requests to the logging and output", action='store_const', const=True, default=False, metavar='')
         utility.add_argument('-q', '--quit', help="quit without starting the application", action='store_const', const=True, default=False, metavar='')
@@ -1482,6 +2800,18 @@ class RPGMTL():
                 self.auth["enabled"] = res
                 self.settings_modified = True
                 self.log.info(f"Authentication is {"enabled" if res else "disabled"}")
+        if args.workers is not None:
+            self.settings["worker_count"] = max(1, args.workers[0])
+            self.settings_modified = True
+            self.log.info(f"Worker count set to {self.settings["worker_count"]}")
+        if args.compact is not None:
+            res : bool|None = self.parse_string_parameter(args.compact[0])
+            if res is None:
+                self.log.error("Unknown value for -c/--compact parameter.")
+            else:
+                self.settings["compact_strings"] = res
+                self.settings_modified = True
+                self.log.info(f"Compact strings format is {"enabled" if res else "disabled"}")
         if args.newuser:
             self.auth["users"][args.newuser[0]] = self.hash_password(args.newuser[1])
             self.settings_modified = True
@@ -1550,8 +2880,13 @@ class RPGMTL():
         # temporarily ignore Ctrl+C (SIGINT) at the OS level
         original_handler = signal.signal(signal.SIGINT, signal.SIG_IGN)
         self.log.info("RPGMTL is shutting down...")
+        # stop background tasks
+        self.executor.shutdown(wait=True, cancel_futures=True)
         # save on quit
         self.save()
+        for name, count in self.journal_count.items():
+            if count > 0: # merge journals
+                self.compact_strings(name)
         # restore handler
         signal.signal(signal.SIGINT, original_handler)
 
@@ -1701,8 +3036,13 @@ class RPGMTL():
             return web.json_response({"result":"ok", "data":{"path":file_path}, "message":"Please select a project name."})
         else: # update existing project
             if file_path is not None:
-                self.backup_game_files(name)
-            return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":"The project has been updated, please extract the strings"})
+                job : Job = self.start_job(name, "update", self._update_project_task, name)
+                return await self.job_response(job, payload.get('background', False))
+            return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":"The project has been updated (0 file(s) changed), please extract the strings"})
+
+    def _update_project_task(self : RPGMTL, name : str) -> str:
+        changed : list[str] = self.backup_game_files(name)
+        return f"The project has been updated ({len(changed)} file(s) changed), please extract the strings"
 
     # /api/new_project
     async def create_project(self : RPGMTL, request : web.Request) -> web.Response:
@@ -1904,8 +3244,12 @@ class RPGMTL():
         name = payload.get('name', None)
         if name is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter."}, status=400)
+        elif self.is_busy(name):
+            return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
         else:
-            self.save()
+            self.save(skip_busy=True)
+            if self.journal_count.get(name, 0) > 0: # merge the journal before unloading
+                self.compact_strings(name)
             if name in self.computing:
                 self.computing[name].cancel()
                 self.computing.pop(name)
@@ -1913,6 +3257,12 @@ class RPGMTL():
                 self.strings.pop(name)
             if name in self.modified:
                 self.modified.pop(name)
+            self.journal.pop(name, None)
+            self.journal_count.pop(name, None)
+            self.search_indexes.pop(name, None)
+            self.occurences.pop(name, None)
+            self.string_changes.pop(name, None)
+            self.translated_strings.pop(name, None)
             if name in self.projects:
                 self.projects.pop(name)
                 self.log.info(f"Project {name} has been unloaded")
@@ -1925,10 +3275,14 @@ class RPGMTL():
         if name is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter."}, status=400)
         else:
-            err = self.generate(name)
-            self.save()
-            message = f"Strings extracted, but {err} error(s) occured." if err > 0 else "Strings extracted with success."
-            return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":message})
+            self.load_project(name)
+            job : Job = self.start_job(name, "extract", self._generate_project_task, name)
+            return await self.job_response(job, payload.get('background', False))
+
+    def _generate_project_task(self : RPGMTL, name : str) -> str:
+        err = self.generate(name)
+        self.save(name=name)
+        return f"Strings extracted, but {err} error(s) occured." if err > 0 else "Strings extracted with success."
 
     # /api/release
     async def release(self : RPGMTL, request : web.Request) -> web.Response:
@@ -1937,12 +3291,17 @@ class RPGMTL():
         if name is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter"}, status=400)
         else:
-            patch_count, err = self.create_release(name)
-            if patch_count > 0:
-                message = f"Patch generated in projects/{name}/release, but {err} error(s) occured." if err > 0 else f"Patch generated in projects/{name}/release with success."
-            else:
-                message = f"No files patched and {err} error(s) occured." if err > 0 else "No files patched."
-            return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":message})
+            self.load_project(name)
+            job : Job = self.start_job(name, "release", self._release_task, name, payload.get('full', False))
+            return await self.job_response(job, payload.get('background', False))
+
+    def _release_task(self : RPGMTL, name : str, full : bool) -> str:
+        patch_count, err, skip_count = self.create_release(name, full)
+        skipped : str = f" {skip_count} file(s) without translations skipped." if skip_count > 0 else ""
+        if patch_count > 0:
+            return (f"Patch generated in projects/{name}/release, but {err} error(s) occured." if err > 0 else f"Patch generated in projects/{name}/release with success.") + skipped
+        else:
+            return (f"No files patched and {err} error(s) occured." if err > 0 else "No files patched.") + skipped
 
     # /api/patches
     async def open_patches(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2059,14 +3418,20 @@ class RPGMTL():
         if name is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter"}, status=400)
         else:
-            state, count = self.import_old_data(name, path)
-            match state:
-                case 1:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"Imported {count} string(s) with success"})
-                case -1:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"Imported {count} string(s), but an error occured"})
-                case _:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}})
+            self.load_project(name)
+            job : Job = self.start_job(name, "import", self._import_task, self.import_old_data, name, path)
+            return await self.job_response(job, payload.get('background', False))
+
+    # common task of import_old and import_rpgmtrans
+    def _import_task(self : RPGMTL, func : Callable, name : str, path : str) -> str|None:
+        state, count = func(name, path)
+        match state:
+            case 1:
+                return f"Imported {count} string(s) with success"
+            case -1:
+                return f"Imported {count} string(s), but an error occured"
+            case _:
+                return None
         
     # /api/import_rpgmtrans
     async def import_rpgmtrans(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2076,14 +3441,9 @@ class RPGMTL():
         if name is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter"}, status=400)
         else:
-            state, count = self.import_rpgmtrans_data(name, path)
-            match state:
-                case 1:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"Imported {count} string(s) with success"})
-                case -1:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"Imported {count} string(s), but an error occured"})
-                case _:
-                    return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}})
+            self.load_project(name)
+            job : Job = self.start_job(name, "import_rpgmtrans", self._import_task, self.import_rpgmtrans_data, name, path)
+            return await self.job_response(job, payload.get('background', False))
 
     # /api/backups
     async def backup_list(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2110,8 +3470,14 @@ class RPGMTL():
             return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter"}, status=400)
         elif file is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'file' parameter"}, status=400)
+        elif self.is_busy(name):
+            return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
         else:
-            self.save() # save
+            self.save(skip_busy=True) # save
+            self.compact_strings(name) # merge the journal, it mustn't be applied to the backup
+            if os.path.isfile(f"projects/{name}/strings.bin"): # convert to strings.json, so it's kept as strings.bak-1.json
+                self.write_strings_json(read_compact_strings(f"projects/{name}/strings.bin"), f"projects/{name}/strings.json")
+                os.remove(f"projects/{name}/strings.bin")
             shutil.move(f"projects/{name}/{file}", f"projects/{name}/backup.tmp.file.json")
             bak : list[str] = [
                 "strings.bak-5.json",
@@ -2143,6 +3509,28 @@ class RPGMTL():
             self.load_strings(name)
             return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"strings.json has been renamed strings.bak-1.json, and {file} became the new strings.json"})
 
+    # /api/export_strings
+    async def export_strings(self : RPGMTL, request : web.Request) -> web.Response:
+        payload = await request.json()
+        name = payload.get('name', None)
+        if name is None:
+            return web.json_response({"result":"bad", "message":"Bad request, missing 'name' parameter"}, status=400)
+        elif self.is_busy(name):
+            return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
+        else:
+            self.load_project(name)
+            if self.load_strings(name) is None:
+                return web.json_response({"result":"bad", "message":"Strings doesn't exist. You might have to extract them."}, status=400)
+            self.save(skip_busy=True)
+            self.compact_strings(name)
+            if os.path.isfile(f"projects/{name}/strings.bin"): # compact format, strings.json is only a copy
+                try:
+                    self.write_strings_json(self.strings[name], f"projects/{name}/strings.json")
+                except Exception as e:
+                    self.log.error(f"Failed to export projects/{name}/strings.json:\n{self.trbk(e)}")
+                    return web.json_response({"result":"bad", "message":"An unexpected error occured"})
+            return web.json_response({"result":"ok", "data":{"name":name, "config":self.projects[name]}, "message":f"projects/{name}/strings.json is up to date"})
+
     # /api/browse
     async def open_folder(self : RPGMTL, request : web.Request) -> web.Response:
         payload = await request.json()
@@ -2208,8 +3596,9 @@ class RPGMTL():
             if path not in self.strings[name]["files"]:
                 return web.json_response({"result":"bad", "message":"Bad request, invalid 'path' parameter."}, status=400)
             else:
-                actions = {k : [v[0], v[1], v[2]] for k, v in self.actions.items() if self.plugins[v[0]].match(path, True)}
-                return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "path":path, "strings":self.strings[name]["strings"], "list":self.strings[name]["files"][path], "actions":actions}})
+                data : dict[str, Any] = self.get_file_data(name, path)
+                data["actions"] = {k : [v[0], v[1], v[2]] for k, v in self.actions.items() if self.plugins[v[0]].match(path, True)}
+                return web.json_response({"result":"ok", "data":data})
 
     # /api/file_action
     async def run_action(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2231,11 +3620,8 @@ class RPGMTL():
         else:
             if version != self.projects[name]["version"]:
                 return web.json_response({"result":"bad", "message":"The project has been updated, redirecting..."})
-            message = self.actions[key][3](name, path, self.settings | self.projects[name].get("settings", {}))
-            if message != "":
-                return web.json_response({"result":"ok", "data":{}, "message":message})
-            else:
-                return web.json_response({"result":"ok", "data":{}})
+            job : Job = self.start_job(name, "action", self.actions[key][3], name, path, self.settings | self.projects[name].get("settings", {}))
+            return await self.job_response(job, payload.get('background', False), {})
 
     # /api/update_marker
     async def update_marker(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2252,10 +3638,12 @@ class RPGMTL():
             return web.json_response({"result":"bad", "message":"Bad request, missing 'value' parameter"}, status=400)
         elif path is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'path' parameter"}, status=400)
+        elif self.is_busy(name):
+            return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
         else:
             self.strings[name]["strings"][sid][GloIndex.COLOR] = value
-            self.modified[name] = True
-            return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "path":path, "strings":self.strings[name]["strings"], "list":self.strings[name]["files"][path]}})
+            self.mark_modified(name, (sid,))
+            return web.json_response({"result":"ok", "data":self.get_file_data(name, path, payload.get('strings_version', None))})
 
     # /api/update_string
     async def edit_string(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2280,10 +3668,13 @@ class RPGMTL():
         else:
             if version != self.projects[name]["version"]:
                 return web.json_response({"result":"bad", "message":"The project has been updated, redirecting..."})
+            elif self.is_busy(name):
+                return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
             if path not in self.strings[name]["files"]:
                 return web.json_response({"result":"bad", "message":"Bad request, invalid 'path' parameter"}, status=400)
             else:
                 ref = self.strings[name]["files"][path][group][index] # reference
+                edited_files : set[str] = {path} # files to save
                 match setting:
                     case 0: # Unlink
                         ref[LocIndex.LOCAL] = (ref[LocIndex.LOCAL] + 1) % 2
@@ -2292,18 +3683,15 @@ class RPGMTL():
                     case 2: # Disable all occurences in file
                         sid : str = ref[0] # retrieve id
                         state : int = (ref[LocIndex.IGNORED] + 1) % 2
-                        for i in range(len(self.strings[name]["files"][path])):
-                            for j in range(1, len(self.strings[name]["files"][path][i])):
-                                if self.strings[name]["files"][path][i][j][LocIndex.ID] == sid: # for all matching id, disable
-                                    self.strings[name]["files"][path][i][j][LocIndex.IGNORED] = state
+                        for file, i, j in self.get_occurences(name)[sid]:
+                            if file == path: # for all matching id, disable
+                                self.strings[name]["files"][file][i][j][LocIndex.IGNORED] = state
                     case 3: # Disable all occurences in project
                         sid : str = ref[LocIndex.ID] # retrieve id
                         state : int = (ref[LocIndex.IGNORED] + 1) % 2
-                        for file in self.strings[name]["files"]:
-                            for i in range(len(self.strings[name]["files"][file])):
-                                for j in range(1, len(self.strings[name]["files"][file][i])):
-                                    if self.strings[name]["files"][file][i][j][LocIndex.ID] == sid: # for all matching id, disable
-                                        self.strings[name]["files"][file][i][j][LocIndex.IGNORED] = state
+                        for file, i, j in self.get_occurences(name)[sid]: # for all matching id, disable
+                            self.strings[name]["files"][file][i][j][LocIndex.IGNORED] = state
+                            edited_files.add(file)
                     case _: # Change string
                         if ref[LocIndex.LOCAL]:
                             ref[LocIndex.TL] = string
@@ -2311,11 +3699,9 @@ class RPGMTL():
                             self.strings[name]["strings"][ref[LocIndex.ID]][GloIndex.TL] = string
                 # Remove modified flag
                 ref[LocIndex.MODIFIED] = 0
-                self.modified[name] = True
-                # Start computation
-                self.start_compute_translated(name)
+                self.mark_modified(name, (ref[LocIndex.ID],), edited_files)
                 # Respond
-                return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "path":path, "strings":self.strings[name]["strings"], "list":self.strings[name]["files"][path]}})
+                return web.json_response({"result":"ok", "data":self.get_file_data(name, path, payload.get('strings_version', None))})
 
     # /api/translate_string
     async def translate_string(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2387,8 +3773,7 @@ class RPGMTL():
             count = 0
             continue_flag = False
         if count > 0:
-            self.modified[name] = True
-            self.start_compute_translated(name)
+            self.mark_modified(name, global_ids, (path,))
         # Respond
         return True, continue_flag, count
 
@@ -2439,6 +3824,7 @@ class RPGMTL():
                 self.log.error(f"Batch translation for project {name} has been aborted because of a version update")
                 return False, False, "The Project has been updated, the translation has been cancelled."
             # apply translated strings
+            global_ids : set[str] = set()
             for sid, tl in translated.items():
                 try:
                     if sid in ignore: # Don't modify strings not part of our modifications
@@ -2452,6 +3838,7 @@ class RPGMTL():
                         lc[LocIndex.TL] = tl
                     elif gl[GloIndex.TL] is None:
                         gl[GloIndex.TL] = tl
+                        global_ids.add(lc[LocIndex.ID])
                     elif gl[GloIndex.TL] == tl:
                         continue
                     else:
@@ -2463,8 +3850,7 @@ class RPGMTL():
                     self.log.error("Exception: " + self.trbk(e))
         if count > 0:
             self.log.info(f"{count} strings have been translated in file '{path}' for project {name}...")
-            self.modified[name] = True
-            self.start_compute_translated(name)
+            self.mark_modified(name, global_ids, (path,))
         return True, continue_flag, count
 
     # /api/translate_file
@@ -2482,6 +3868,8 @@ class RPGMTL():
         else:
             if version != self.projects[name]["version"]:
                 return web.json_response({"result":"bad", "message":"The project has been updated, redirecting..."})
+            elif self.is_busy(name):
+                return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
             # Getting translator
             current = self.get_current_translator(name)[3]
             if current is None:
@@ -2498,7 +3886,7 @@ class RPGMTL():
                     msg = f"{res} string(s) have been translated"
                 case _:
                     msg = f"An error occured: {res}"
-            return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "path":path, "strings":self.strings[name]["strings"], "list":self.strings[name]["files"][path]}, "message":msg})
+            return web.json_response({"result":"ok", "data":self.get_file_data(name, path, payload.get('strings_version', None)), "message":msg})
 
     # /api/translate_project
     async def translate_project(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2511,6 +3899,8 @@ class RPGMTL():
             self.load_strings(name)
             if name not in self.strings:
                 return web.json_response({"result":"bad", "data":{"name":name, "config":self.projects[name]}, "message":"The strings haven't been extracted."})
+            elif self.is_busy(name):
+                return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
             # Getting translator
             current = self.get_current_translator(name)[3]
             if current is None:
@@ -2562,7 +3952,70 @@ class RPGMTL():
                     msg = f"{count} string(s) have been translated in {file_count} file(s), {error} error(s) occured."
                 else:
                     msg = f"{count} string(s) have been translated in {file_count} file(s)"
-            return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "path":path, "strings":self.strings[name]["strings"], "list":self.strings[name]["files"][path]}, "message":msg})
+            return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name}, "message":msg})
+
+    # return the files containing strings matching the search
+    # use the search index if available, else look through all the strings
+    def search_files(self : RPGMTL, name : str, search : str, useorigin : bool, case : bool, contains : bool) -> set[str]:
+        index : SearchIndex|None = self.get_search_index(name)
+        if index is not None:
+            files : set[str]|None = index.search(search, useorigin, case, contains)
+            if files is not None:
+                return files
+        # set search term and list all string matching in set
+        lsearch : str = search.lower() if not case else search
+        original_matches : set[str] = set() # contains string id matching at original level
+        translation_matches : set[str] # contains string id matching at translation level
+        if not case:
+            if contains:
+                if useorigin:
+                    original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch in s[GloIndex.ORI].lower()}
+                translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch in s[GloIndex.TL].lower())}
+            else:
+                if useorigin:
+                    original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch == s[GloIndex.ORI].lower()}
+                translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch == s[GloIndex.TL].lower())}
+        else:
+            if contains:
+                if useorigin:
+                    original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch in s[GloIndex.ORI]}
+                translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch in s[GloIndex.TL])}
+            else:
+                if useorigin:
+                    original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch == s[GloIndex.ORI]}
+                translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch == s[GloIndex.TL])}
+        files : set[str] = set()
+        for f, groups in self.strings[name]["files"].items():
+            for g in groups:
+                if f in files:
+                    break
+                for i in range(1, len(g)):
+                    if g[i][LocIndex.ID] in original_matches:
+                        files.add(f)
+                    elif g[i][LocIndex.LOCAL]:
+                        if g[i][LocIndex.TL] is not None:
+                            if not case:
+                                if contains:
+                                    if lsearch in g[i][LocIndex.TL].lower():
+                                        files.add(f)
+                                        break
+                                else:
+                                    if lsearch == g[i][LocIndex.TL].lower():
+                                        files.add(f)
+                                        break
+                            else:
+                                if contains:
+                                    if lsearch in g[i][LocIndex.TL]:
+                                        files.add(f)
+                                        break
+                                else:
+                                    if lsearch == g[i][LocIndex.TL]:
+                                        files.add(f)
+                                        break
+                    elif g[i][LocIndex.ID] in translation_matches:
+                        files.add(f)
+                        break
+        return files
 
     # /api/search_string
     async def search_string(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2588,59 +4041,7 @@ class RPGMTL():
         else:
             self.load_project(name)
             self.load_strings(name)
-            # set search term and list all string matching in set
-            lsearch : str = search.lower() if not case else search
-            original_matches : set[str] = set() # contains string id matching at original level
-            translation_matches : set[str] # contains string id matching at translation level
-            if not case:
-                if contains:
-                    if useorigin:
-                        original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch in s[GloIndex.ORI].lower()}
-                    translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch in s[GloIndex.TL].lower())}
-                else:
-                    if useorigin:
-                        original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch == s[GloIndex.ORI].lower()}
-                    translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch == s[GloIndex.TL].lower())}
-            else:
-                if contains:
-                    if useorigin:
-                        original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch in s[GloIndex.ORI]}
-                    translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch in s[GloIndex.TL])}
-                else:
-                    if useorigin:
-                        original_matches = {k for k, s in self.strings[name]["strings"].items() if lsearch == s[GloIndex.ORI]}
-                    translation_matches = {k for k, s in self.strings[name]["strings"].items() if (s[GloIndex.TL] is not None and lsearch == s[GloIndex.TL])}
-            files : set[str] = set()
-            for f, groups in self.strings[name]["files"].items():
-                for g in groups:
-                    if f in files:
-                        break
-                    for i in range(1, len(g)):
-                        if g[i][LocIndex.ID] in original_matches:
-                            files.add(f)
-                        elif g[i][LocIndex.LOCAL]:
-                            if g[i][LocIndex.TL] is not None:
-                                if not case:
-                                    if contains:
-                                        if lsearch in g[i][LocIndex.TL].lower():
-                                            files.add(f)
-                                            break
-                                    else:
-                                        if lsearch == g[i][LocIndex.TL].lower():
-                                            files.add(f)
-                                            break
-                                else:
-                                    if contains:
-                                        if lsearch in g[i][LocIndex.TL]:
-                                            files.add(f)
-                                            break
-                                    else:
-                                        if lsearch == g[i][LocIndex.TL]:
-                                            files.add(f)
-                                            break
-                        elif g[i][LocIndex.ID] in translation_matches:
-                            files.add(f)
-                            break
+            files : set[str] = self.search_files(name, search, useorigin, case, contains)
             result : dict[str, bool] = {}
             keys : list[str] = list(files)
             keys.sort()
@@ -2713,12 +4114,15 @@ class RPGMTL():
             return web.json_response({"result":"bad", "message":"Bad request, missing 'casing' parameter"}, status=400)
         elif file_match is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'file_match' parameter"}, status=400)
+        elif self.is_busy(name):
+            return web.json_response({"result":"bad", "message":"A task is running on this project, please wait for it to end."})
         else:
-            self.save() # save first!
+            self.save(skip_busy=True) # save first!
             self.backup_strings_file(name) # backup strings.json
             self.load_strings(name) # load strings.json
             count : int = 0
             modified : set[str] = set()
+            edited_files : set[str] = set()
             seen : set[str] = set()
             for f, data in self.strings[name]["files"].items():
                 if file_match != "" and file_match not in f:
@@ -2748,12 +4152,15 @@ class RPGMTL():
                                 if s != data[g][i][LocIndex.TL]:
                                     data[g][i][LocIndex.TL] = s
                                     data[g][i][LocIndex.MODIFIED] = IntBool.TRUE
+                                    edited_files.add(f)
                                     count += 1
                         elif data[g][i][LocIndex.ID] in modified:
                             data[g][i][LocIndex.MODIFIED] = IntBool.TRUE
                             count += 1
             if count > 0:
                 self.modified[name] = True
+                self.update_search_index(name, modified, edited_files)
+                self.record_string_changes(name, modified)
             return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name, "count":count}, "message":f"{count} strings have been modified"})
             
     # /api/use_tool
@@ -2768,13 +4175,11 @@ class RPGMTL():
             return web.json_response({"result":"bad", "message":"Bad request, missing 'tool' parameter"}, status=400)
         elif params is None:
             return web.json_response({"result":"bad", "message":"Bad request, missing 'params' parameter"}, status=400)
+        elif tool not in self.tools:
+            return web.json_response({"result":"bad", "message":"Bad request, invalid 'tool' parameter"}, status=400)
         else:
-            return web.json_response(
-                {
-                    "result":"ok", "data":{"config":self.projects[name], "name":name},
-                    "message":self.tools[tool][3](name, params)
-                }
-            )
+            job : Job = self.start_job(name, "tool", self.tools[tool][3], name, params)
+            return await self.job_response(job, payload.get('background', False))
             
     # /api/bookmark_tool
     async def bookmark_tool(self : RPGMTL, request : web.Request) -> web.Response:
@@ -2948,5 +4353,120 @@ class RPGMTL():
                             return web.json_response({"result":"bad", "message":f"Failed to set icon, HTTP Error {status - 1000}"}, status=400) 
         return web.json_response({"result":"ok", "data":{"config":self.projects[name], "name":name}, "message":"Icon updated"})
 
+    # /api/jobs
+    async def job_list(self : RPGMTL, request : web.Request) -> web.Response:
+        try:
+            payload = await request.json()
+        except:
+            payload = {}
+        name = payload.get('name', None)
+        jobs : list[dict[str, Any]] = [job.info() for job in self.jobs.values() if name is None or job.name == name]
+        return web.json_response({"result":"ok", "data":{"jobs":jobs}})
+
+    # /api/job_status
+    async def job_status(self : RPGMTL, request : web.Request) -> web.Response:
+        payload = await request.json()
+        jid = payload.get('id', None)
+        if jid is None:
+            return web.json_response({"result":"bad", "message":"Bad request, missing 'id' parameter"}, status=400)
+        elif jid not in self.jobs:
+            return web.json_response({"result":"bad", "message":"Bad request, invalid 'id' parameter"}, status=400)
+        else:
+            job : Job = self.jobs[jid]
+            data : dict[str, Any] = {"job":job.info()}
+            if job.status == "done" and isinstance(job.result, str):
+                data["result"] = job.result
+            return web.json_response({"result":"ok", "data":data})
+
+    # /api/cancel_job
+    async def cancel_job(self : RPGMTL, request : web.Request) -> web.Response:
+        payload = await request.json()
+        jid = payload.get('id', None)
+        if jid is None:
+            return web.json_response({"result":"bad", "message":"Bad request, missing 'id' parameter"}, status=400)
+        elif jid not in self.jobs:
+            return web.json_response({"result":"bad", "message":"Bad request, invalid 'id' parameter"}, status=400)
+        else:
+            job : Job = self.jobs[jid]
+            if job.done():
+                return web.json_response({"result":"ok", "data":{"job":job.info()}, "message":"The task is already over"})
+            job.cancel_requested = True
+            return web.json_response({"result":"ok", "data":{"job":job.info()}, "message":"The task will be cancelled as soon as possible"})
+
+######################################################
+# Worker processes
+######################################################
+# A RPGMTL instance without the web server, used by worker processes to run the plugins
+class PluginWorker(RPGMTL):
+    def __init__(self : PluginWorker, settings : dict[str, Any], name : str, project : dict[str, Any], strings : dict[str, Any]|None = None) -> None:
+        # log messages are stored to be sent back to the main process
+        self.log_records : list[tuple[int, str]] = []
+        self.log = logging.getLogger('rpgmtl')
+        self.log.setLevel(logging.INFO)
+        self.log.propagate = False
+        self.log.addHandler(WorkerLogHandler(self.log_records))
+        self.settings = settings
+        self.projects = {name:project}
+        self.strings = {} if strings is None else {name:strings}
+        self.modified = {}
+        self.journal = {}
+        self.setting_key_set = set()
+        self.action_key_set = set()
+        self.tool_key_set = set()
+        self.settings_modified = False
+        self.setting_menu = {}
+        self.plugin_descriptions = {}
+        self.actions = {}
+        self.tools = {}
+        self.plugins = {}
+        self.translators = {}
+        self.plugin_index = {}
+        self.plugin_code_fingerprint = None
+        self.loop = None
+        self.job_local = threading.local()
+        plugins.load(self)
+        self.log_records.clear() # to not repeat the plugin loading messages
+
+    # Translators aren't used in workers
+    def add_translator(self : PluginWorker, plugin : plugins.TranslatorPlugin) -> None:
+        pass
+
+# Store the log records of a worker process
+class WorkerLogHandler(logging.Handler):
+    def __init__(self : WorkerLogHandler, records : list[tuple[int, str]]) -> None:
+        super().__init__()
+        self.records = records
+
+    def emit(self : WorkerLogHandler, record : logging.LogRecord) -> None:
+        self.records.append((record.levelno, self.format(record)))
+
+_worker_ : PluginWorker|None = None
+
+# Worker process initializer
+def init_worker(settings : dict[str, Any], name : str, project : dict[str, Any], strings : dict[str, Any]|None = None) -> None:
+    global _worker_
+    _worker_ = PluginWorker(settings, name, project, strings)
+
+# Worker process task to extract the strings of a file
+# Return the extract_game_file() results with the error traceback (None if no errors), and the log records
+def worker_extract(name : str, filename : str) -> tuple[tuple[bool, list[list[str]], list[str], str|None], list[tuple[int, str]]]:
+    _worker_.log_records.clear()
+    try:
+        result = (*_worker_.extract_game_file(name, filename), None)
+    except Exception as e:
+        result = (False, [], [], _worker_.trbk(e))
+    return result, _worker_.log_records.copy()
+
+# Worker process task to patch a file
+# Return the patch_game_file() results and the log records
+def worker_patch(name : str, filename : str, release_folder : PurePath) -> tuple[tuple[int, int], list[tuple[int, str]]]:
+    _worker_.log_records.clear()
+    try:
+        result = _worker_.patch_game_file(name, filename, release_folder)
+    except Exception as e:
+        _worker_.log.error(f"Failed to patch strings in {filename} for project {name}\n{_worker_.trbk(e)}")
+        result = (0, 1)
+    return result, _worker_.log_records.copy()
+
 if __name__ == "__main__":
     RPGMTL().run()
\ No newline at end of file